@@ -34,7 +34,10 @@ Environment Variables (set in Railway):
 
 import asyncio
 import argparse
+import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from io import BytesIO
@@ -43,10 +46,18 @@ import aiohttp
 
 # Import operators
 from operators.scraper import ArticleScraper
-from operators.monitor import create_llm, summarize_article
+from operators.custom_scraper_base import close_http_session
+from operators.monitor import (
+    create_llm,
+    create_openai_client,
+    summarize_articles,
+    iter_summaries,
+    close_shared_clients,
+)
 
 # Import storage
 from storage.r2 import R2Storage
+from storage.article_tracker import ArticleTracker
 
 # Import database (optional - graceful degradation if not configured)
 from database.connection import record_batch_to_db, test_connection as test_db_connection
@@ -59,6 +70,7 @@ from config.sources import (
     get_source_config,
     get_custom_scraper_ids,
 )
+from utils.image_hash import DUPLICATE_DISTANCE, dhash, hamming_distance, is_informative
 
 # Import custom scrapers
 from operators.custom_scrapers.identity import IdentityScraper
@@ -75,6 +87,7 @@ from operators.custom_scrapers.landscape_architecture_magazine import LandscapeA
 
 # Default configuration
 DEFAULT_HOURS_LOOKBACK = 24
+CUSTOM_SCRAPER_CONCURRENCY = 4  # Each scraper may hold a browser connection
 
 # Custom scraper registry - maps source_id to scraper class
 CUSTOM_SCRAPER_MAP = {
@@ -92,6 +105,34 @@ CUSTOM_SCRAPER_MAP = {
 }
 
 
+# =============================================================================
+# Logging
+# =============================================================================
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route log records through a queue so formatting and stdout writes
+    happen on a background thread instead of the event loop.
+
+    Args:
+        level: Root log level
+
+    Returns:
+        Started QueueListener (stop it on shutdown to flush pending records)
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    # force=True replaces the StreamHandler installed by operators.scraper at import
+    logging.basicConfig(level=level, handlers=[QueueHandler(log_queue)], force=True)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 # =============================================================================
 # Command Line Arguments
 # =============================================================================
@@ -194,8 +235,8 @@ def filter_articles(articles: list, llm) -> tuple[list, list]:
     return included, excluded
 
 
-def generate_summaries(articles: list, llm, prompt_template: str) -> list:
-    """Generate AI summaries for articles."""
+async def generate_summaries(articles: list, client, prompt_template: str) -> list:
+    """Generate AI summaries for articles (concurrent, bounded LLM requests)."""
     print(f"\n[SUMMARY] Generating AI summaries for {len(articles)} articles...")
 
     for i, article in enumerate(articles, 1):
@@ -203,19 +244,52 @@ def generate_summaries(articles: list, llm, prompt_template: str) -> list:
         source_name = article.get("source_name", article.get("source_id", "Unknown"))
         print(f"   [{i}/{len(articles)}] [{source_name}] {title[:40]}...")
 
-        try:
-            # summarize_article expects (article, llm, prompt_template)
-            summarized = summarize_article(article, llm, prompt_template)
-            article["headline"] = summarized.get("headline", "")
-            article["ai_summary"] = summarized.get("ai_summary", "")
-            article["tag"] = summarized.get("tag", "")
-        except Exception as e:
-            print(f"      [WARN] Error: {e}")
-            article["headline"] = article.get("title", "")
-            article["ai_summary"] = article.get("description", "")[:200] + "..."
-            article["tag"] = ""
+    # summarize_articles fills headline/ai_summary/tag in place and falls
+    # back to the original description for articles whose LLM call failed
+    return await summarize_articles(articles, client, prompt_template)
+
+
+async def summarize_and_save(
+    articles: list,
+    client,
+    prompt_template: str,
+    r2: R2Storage,
+    candidates: list
+) -> list:
+    """
+    Generate AI summaries and save each article to R2 as soon as it is summarized.
+
+    R2 uploads (blocking boto3 calls, run in a worker thread) overlap with
+    the LLM calls still in flight instead of waiting for the slowest summary.
+    The manifest and Supabase records are written afterwards by
+    finalize_candidates.
+
+    Args:
+        articles: Filtered article dicts
+        client: OpenAI client from create_openai_client()
+        prompt_template: Summary prompt template
+        r2: R2Storage instance
+        candidates: Caller-owned list that saved candidates are appended to,
+            so the ones saved before a failure are still known (see
+            save_remaining_candidates)
+
+    Returns:
+        The candidates list, in article order
+    """
+    print(f"\n[SUMMARY] Generating AI summaries for {len(articles)} articles (saving to R2 as they finish)...")
+
+    r2.reset_counters()
+    order = {id(article): i for i, article in enumerate(articles)}
+
+    async for article in iter_summaries(articles, client, prompt_template):
+        result = await asyncio.to_thread(save_candidate_to_r2, article, r2)
+        if result:
+            candidates.append(result)
+
+    # Keep the manifest in article order, not completion order
+    candidates.sort(key=lambda candidate: order[id(candidate["article"])])
+    return candidates
 
-    return articles
 
 def convert_webp_to_jpeg(image_bytes: bytes, quality: int = 85) -> tuple[bytes, str]:
     """
@@ -337,47 +411,99 @@ async def download_hero_images(articles: list) -> list:
     print(f"\n   [STATS] Downloaded: {downloaded}, Converted: {converted}, Failed: {failed}")
     return articles
 
-def save_candidates_to_r2(articles: list, r2: R2Storage) -> list:
+
+async def drop_duplicate_hero_images(articles: list) -> list:
     """
-    Save articles as editorial candidates to R2 storage.
-    Also records to Supabase for cross-edition tracking.
+    Drop articles whose hero image is a near-copy of one from another source.
+
+    Different outlets covering the same project usually run the same press
+    photo; keeping only the first avoids filtering, summarizing and storing
+    the story twice. Matches within one source are kept, since a site's
+    default og:image is shared by many unrelated articles. Flat images
+    (placeholders, blank or logo cards) are never compared.
 
     Args:
-        articles: List of article dicts with ai_summary
+        articles: Articles with hero_image.bytes populated
+
+    Returns:
+        Articles without cross-source hero image duplicates (order kept)
+    """
+    def hash_heroes() -> list:
+        return [
+            dhash(article["hero_image"]["bytes"])
+            if article.get("hero_image") and article["hero_image"].get("bytes") else None
+            for article in articles
+        ]
+
+    # Image decoding is CPU-bound; keep it off the event loop
+    hashes = await asyncio.to_thread(hash_heroes)
+
+    kept = []
+    seen: list[tuple[int, str, str]] = []  # (hash, source_id, link) of kept heroes
+    for article, image_hash in zip(articles, hashes):
+        if image_hash is not None and is_informative(image_hash):
+            source_id = article.get("source_id", "")
+            match = next(
+                (
+                    other_link for other, other_source, other_link in seen
+                    if other_source != source_id and hamming_distance(image_hash, other) <= DUPLICATE_DISTANCE
+                ),
+                None
+            )
+            if match is not None:
+                print(f"   [DUPLICATE] Same hero image as another source: {article.get('title', 'No title')[:40]}...")
+                print(f"      {article.get('link', '')} matches {match}")
+                continue
+            seen.append((image_hash, source_id, article.get("link", "")))
+        kept.append(article)
+
+    if len(kept) < len(articles):
+        print(f"   [STATS] Dropped {len(articles) - len(kept)} cross-source duplicates")
+    return kept
+
+def save_candidate_to_r2(article: dict, r2: R2Storage) -> Optional[dict]:
+    """
+    Save one article (JSON + hero image) as an editorial candidate.
+
+    Args:
+        article: Article dict with ai_summary
         r2: R2Storage instance
 
     Returns:
-        List of candidate info dicts (for manifest creation)
+        Candidate info dict, or None if saving failed
     """
-    print("\n[R2] Saving candidates to R2 storage...")
+    try:
+        # Get hero image bytes if available
+        image_bytes = None
+        hero = article.get("hero_image")
+        if hero and hero.get("bytes"):
+            image_bytes = hero["bytes"]
 
-    # Reset counters for this batch
-    r2.reset_counters()
+        # save_candidate handles both JSON and image
+        result = r2.save_candidate(
+            article=article,
+            image_bytes=image_bytes
+        )
 
-    candidates = []
-    for article in articles:
-        try:
-            # Get hero image bytes if available
-            image_bytes = None
-            hero = article.get("hero_image")
-            if hero and hero.get("bytes"):
-                image_bytes = hero["bytes"]
+        # Store original article in result for DB recording
+        result["article"] = article
 
-            # save_candidate handles both JSON and image
-            result = r2.save_candidate(
-                article=article,
-                image_bytes=image_bytes
-            )
+        print(f"   [OK] Saved: {result.get('article_id', 'unknown')}")
+        return result
 
-            # Store original article in result for DB recording
-            result["article"] = article
+    except Exception as e:
+        print(f"   [ERROR] Saving {article.get('title', 'unknown')[:30]}: {e}")
+        return None
 
-            candidates.append(result)
-            print(f"   [OK] Saved: {result.get('article_id', 'unknown')}")
 
-        except Exception as e:
-            print(f"   [ERROR] Saving {article.get('title', 'unknown')[:30]}: {e}")
+def finalize_candidates(candidates: list, r2: R2Storage):
+    """
+    Write the manifest for saved candidates and record them to Supabase.
 
+    Args:
+        candidates: Candidate info dicts from save_candidate_to_r2
+        r2: R2Storage instance
+    """
     # Create/update manifest with all candidates
     if candidates:
         try:
@@ -397,9 +523,110 @@ def save_candidates_to_r2(articles: list, r2: R2Storage) -> list:
     else:
         print(f"   [SKIP] Supabase not configured")
 
+
+def save_candidates_to_r2(articles: list, r2: R2Storage) -> list:
+    """
+    Save articles as editorial candidates to R2 storage.
+    Also records to Supabase for cross-edition tracking.
+
+    Args:
+        articles: List of article dicts with ai_summary
+        r2: R2Storage instance
+
+    Returns:
+        List of candidate info dicts (for manifest creation)
+    """
+    print("\n[R2] Saving candidates to R2 storage...")
+
+    # Reset counters for this batch
+    r2.reset_counters()
+
+    candidates = []
+    for article in articles:
+        result = save_candidate_to_r2(article, r2)
+        if result:
+            candidates.append(result)
+
+    finalize_candidates(candidates, r2)
+
+    return candidates
+
+
+def save_remaining_candidates(articles: list, candidates: list, r2: R2Storage) -> list:
+    """
+    Save the articles summarize_and_save did not get to, then finalize.
+
+    Used when summarize_and_save fails part-way: candidates already saved
+    are kept (no duplicate uploads) and R2 counters are not reset, so new
+    IDs continue after theirs.
+
+    Args:
+        articles: All article dicts for this run (with fallback summaries)
+        candidates: Candidates already saved by summarize_and_save
+        r2: R2Storage instance
+
+    Returns:
+        All candidate info dicts, in article order
+    """
+    if not candidates:
+        return save_candidates_to_r2(articles, r2)
+
+    saved = {id(candidate["article"]) for candidate in candidates}
+    remaining = [article for article in articles if id(article) not in saved]
+    print(f"\n[R2] Saving {len(remaining)} remaining candidates ({len(candidates)} already saved)...")
+
+    for article in remaining:
+        result = save_candidate_to_r2(article, r2)
+        if result:
+            candidates.append(result)
+
+    order = {id(article): i for i, article in enumerate(articles)}
+    candidates.sort(key=lambda candidate: order[id(candidate["article"])])
+
+    finalize_candidates(candidates, r2)
     return candidates
 
 
+# =============================================================================
+# Custom Scrapers
+# =============================================================================
+
+async def run_custom_scraper(source_id: str, hours: int, semaphore: asyncio.Semaphore) -> list:
+    """
+    Run one custom scraper and always release its browser.
+
+    Args:
+        source_id: Source to scrape (key in CUSTOM_SCRAPER_MAP)
+        hours: Lookback window passed to fetch_articles
+        semaphore: Limits how many scrapers run at once
+
+    Returns:
+        List of new article dicts (empty on error)
+    """
+    async with semaphore:
+        print(f"\n   [{source_id}] Starting...")
+        custom_scraper = None
+        try:
+            scraper_class = CUSTOM_SCRAPER_MAP[source_id]
+            custom_scraper = scraper_class()
+            articles = await custom_scraper.fetch_articles(hours=hours)
+
+            if articles:
+                print(f"   [{source_id}] Found {len(articles)} new articles")
+            else:
+                print(f"   [{source_id}] No new articles")
+
+            return articles or []
+
+        except Exception as e:
+            print(f"   [{source_id}] Error: {e}")
+            return []
+
+        finally:
+            if custom_scraper:
+                await custom_scraper.close()
+
+
 # =============================================================================
 # Main Pipeline
 # =============================================================================
@@ -475,26 +702,16 @@ async def run_pipeline(
         # =================================================================
         print("\n[STEP 1] Running custom scrapers...")
 
-        all_articles = []
-
-        for source_id in valid_sources:
-            print(f"\n   [{source_id}] Starting...")
-            try:
-                scraper_class = CUSTOM_SCRAPER_MAP[source_id]
-                custom_scraper = scraper_class()
-                articles = await custom_scraper.fetch_articles(hours=hours)
+        # Scrapers run concurrently and share one ArticleTracker pool
+        semaphore = asyncio.Semaphore(CUSTOM_SCRAPER_CONCURRENCY)
+        results = await asyncio.gather(*(
+            run_custom_scraper(source_id, hours, semaphore)
+            for source_id in valid_sources
+        ))
 
-                if articles:
-                    all_articles.extend(articles)
-                    print(f"   [{source_id}] Found {len(articles)} new articles")
-                else:
-                    print(f"   [{source_id}] No new articles")
-
-                # Close the custom scraper
-                await custom_scraper.close()
-
-            except Exception as e:
-                print(f"   [{source_id}] Error: {e}")
+        all_articles = []
+        for source_articles in results:
+            all_articles.extend(source_articles)
 
         articles = all_articles
         print(f"\n[TOTAL] Total new articles: {len(articles)}")
@@ -530,6 +747,11 @@ async def run_pipeline(
                 print(f"   [ERROR] Image download failed: {e}")
                 print("   Continuing without images...")
 
+            try:
+                articles = await drop_duplicate_hero_images(articles)
+            except Exception as e:
+                print(f"   [ERROR] Hero image dedup failed: {e}")
+
         # =================================================================
         # Step 3: AI Content Filtering (BEFORE summaries - saves API costs)
         # =================================================================
@@ -556,9 +778,18 @@ async def run_pipeline(
         # =================================================================
         print("\n[STEP 4] Generating AI summaries...")
 
+        # With R2 configured, articles are saved as their summaries complete;
+        # candidates collects them even if summarization fails part-way
+        candidates = []
+        summaries_saved = False
+
         try:
-            llm = create_llm()
-            articles = generate_summaries(articles, llm, SUMMARIZE_PROMPT_TEMPLATE)
+            client = create_openai_client()
+            if r2:
+                await summarize_and_save(articles, client, SUMMARIZE_PROMPT_TEMPLATE, r2, candidates)
+                summaries_saved = True
+            else:
+                articles = await generate_summaries(articles, client, SUMMARIZE_PROMPT_TEMPLATE)
         except Exception as e:
             print(f"   [ERROR] AI summarization failed: {e}")
             for article in articles:
@@ -572,7 +803,10 @@ async def run_pipeline(
         # =================================================================
         if r2:
             print("\n[STEP 5] Saving to R2 storage and recording to database...")
-            save_candidates_to_r2(articles, r2)
+            if summaries_saved:
+                finalize_candidates(candidates, r2)
+            else:
+                save_remaining_candidates(articles, candidates, r2)
         else:
             print("\n[STEP 5] Skipping R2 storage (not configured)")
 
@@ -588,6 +822,9 @@ async def run_pipeline(
     finally:
         if scraper:
             await scraper.close()
+        await close_http_session()
+        await close_shared_clients()
+        await ArticleTracker.close_shared()
 
 
 # =============================================================================
@@ -624,9 +861,13 @@ if __name__ == "__main__":
     if args.list_sources:
         list_available_scrapers()
     else:
-        asyncio.run(run_pipeline(
-            source_ids=args.sources,
-            hours=args.hours,
-            skip_scraping=args.no_scrape,
-            skip_filter=args.no_filter,
-        ))
\ No newline at end of file
+        log_listener = setup_logging()
+        try:
+            asyncio.run(run_pipeline(
+                source_ids=args.sources,
+                hours=args.hours,
+                skip_scraping=args.no_scrape,
+                skip_filter=args.no_filter,
+            ))
+        finally:
+            log_listener.stop()
\ No newline at end of file
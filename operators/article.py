@@ -0,0 +1,58 @@
+# operators/article.py
+"""
+Article Record
+Slotted dataclass for RSS monitor articles (smaller and faster than a
+7-key dict per article).
+
+The custom-scraper pipeline in main.py still passes plain dicts through the
+shared summarization helpers, so Article also supports the small mapping
+surface those helpers use (article["title"], article.get(...), item
+assignment). Convert with to_dict() when serializing (Telegram, JSON).
+
+Usage:
+    from operators.article import Article
+
+    article = Article(title="...", link="...", description="...", guid="...")
+    article.headline = "..."
+    payload = article.to_dict()
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class Article:
+    """One RSS article plus its AI summary fields."""
+
+    title: str
+    link: str
+    description: str = ""
+    published: Optional[str] = None
+    guid: str = ""
+    source_id: Optional[str] = None
+    headline: str = ""
+    ai_summary: str = ""
+    tag: str = ""
+
+    # Dict-style access, so helpers shared with the dict-based pipeline work on both
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get equivalent."""
+        return getattr(self, key, default)
+
+    def to_dict(self) -> dict:
+        """Plain dict copy (for serialization)."""
+        return asdict(self)
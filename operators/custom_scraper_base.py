@@ -15,6 +15,7 @@ Usage:
 """
 
 import asyncio
+import codecs
 import os
 import re
 from abc import ABC, abstractmethod
@@ -22,10 +23,12 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse
 from html import unescape
+from html.parser import HTMLParser
 
 from storage.r2 import R2Storage
 import os as os_module
 
+import aiohttp
 from playwright.async_api import (
     async_playwright,
     Browser,
@@ -33,6 +36,34 @@ from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError
 )
 
+
+# =============================================================================
+# Shared HTTP Session
+# =============================================================================
+
+# One pooled session for all custom scrapers (keep-alive across listing fetches)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) the shared aiohttp session."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=20),
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+        )
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared aiohttp session (call once at pipeline shutdown)."""
+    global _http_session
+    if _http_session and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
 class BaseCustomScraper(ABC):
     """
     Abstract base class for custom site scrapers.
@@ -208,6 +239,107 @@ class BaseCustomScraper(ABC):
 
         print(f"[{self.source_id}] Browser closed")
 
+    # =========================================================================
+    # Page Fetching
+    # =========================================================================
+
+    def _http_headers(self) -> dict:
+        """Request headers for plain HTTP page fetches."""
+        return {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch page HTML over plain HTTP (no browser).
+
+        Args:
+            url: Page URL
+
+        Returns:
+            HTML string or None if the request failed
+        """
+        try:
+            session = get_http_session()
+            async with session.get(url, headers=self._http_headers()) as response:
+                if response.status != 200:
+                    print(f"[{self.source_id}] HTTP fetch failed: HTTP {response.status}")
+                    return None
+                return await response.text(errors="replace")
+        except Exception as e:
+            print(f"[{self.source_id}] HTTP fetch error: {e}")
+            return None
+
+    async def _stream_html(self, url: str, parser: HTMLParser, chunk_size: int = 32 * 1024) -> bool:
+        """
+        Stream page HTML over plain HTTP into an incremental parser.
+
+        Only one chunk is held in memory at a time instead of the whole page.
+
+        Args:
+            url: Page URL
+            parser: HTMLParser that handles elements as they arrive
+            chunk_size: Bytes read per network chunk
+
+        Returns:
+            True if the full body was fed to the parser, False on failure
+        """
+        try:
+            session = get_http_session()
+            async with session.get(url, headers=self._http_headers()) as response:
+                if response.status != 200:
+                    print(f"[{self.source_id}] HTTP fetch failed: HTTP {response.status}")
+                    return False
+
+                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    parser.feed(decoder.decode(chunk))
+
+                parser.feed(decoder.decode(b"", final=True))
+                parser.close()
+                return True
+
+        except Exception as e:
+            print(f"[{self.source_id}] HTTP stream error: {e}")
+            return False
+
+    async def _fetch_html_with_browser(
+        self,
+        url: str,
+        wait_selector: Optional[str] = None,
+        wait_state: str = "visible"
+    ) -> str:
+        """
+        Fetch rendered page HTML with Playwright (fallback for JS-rendered pages).
+
+        Args:
+            url: Page URL
+            wait_selector: Selector to wait for before reading the DOM
+            wait_state: Playwright selector state to wait for
+
+        Returns:
+            Rendered HTML string
+        """
+        page = await self._create_page()
+
+        try:
+            await page.goto(url, timeout=self.timeout, wait_until="networkidle")
+
+            # Wait only until the content we parse is present (not a fixed delay)
+            if wait_selector:
+                try:
+                    await page.wait_for_selector(wait_selector, state=wait_state, timeout=5000)
+                except PlaywrightTimeoutError:
+                    print(f"[{self.source_id}] Article list selector not found, parsing page as-is")
+
+            return await page.content()
+
+        finally:
+            await page.close()
+
     # =========================================================================
     # Common Helper Methods
     # =========================================================================
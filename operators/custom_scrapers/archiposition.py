@@ -73,8 +73,7 @@ class ArchipositionScraper(BaseCustomScraper):
     async def _ensure_tracker(self) -> None:
         """Ensure article tracker is initialized."""
         if self.tracker is None:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _is_valid_article_slug(self, slug: str) -> bool:
         """
@@ -666,9 +665,8 @@ class ArchipositionScraper(BaseCustomScraper):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
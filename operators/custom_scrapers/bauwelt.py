@@ -63,8 +63,7 @@ class BauweltScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _ensure_llm(self):
         """Ensure LLM is initialized."""
@@ -227,15 +226,10 @@ Do not use any emoji in your response."""
                 if not self.tracker:
                     raise RuntimeError("Article tracker not initialized")
 
-                new_urls = await self.tracker.filter_new_articles(self.source_id, article_urls)
+                new_urls = await self.tracker.filter_and_mark(self.source_id, article_urls)
 
                 print(f"[{self.source_id}] {len(new_urls)} new articles (not in database)")
 
-                # ============================================================
-                # Step 4: Mark URLs as Seen (BEFORE any early returns)
-                # ============================================================
-                await self.tracker.mark_as_seen(self.source_id, article_urls)
-
                 if not new_urls:
                     print(f"[{self.source_id}] No new articles to process")
                     return []
@@ -244,7 +238,7 @@ Do not use any emoji in your response."""
                 urls_to_process = new_urls[:self.MAX_NEW_ARTICLES]
 
                 # ============================================================
-                # Step 5: Create Minimal Article Dicts
+                # Step 4: Create Minimal Article Dicts
                 # ============================================================
                 # Main pipeline will handle: content scraping, date extraction, AI filtering
                 new_articles: list[dict] = []
@@ -286,9 +280,8 @@ Do not use any emoji in your response."""
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
@@ -65,8 +65,7 @@ class DomusScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _extract_article_links(self, html: str) -> List[str]:
         """
@@ -139,18 +138,13 @@ class DomusScraper(BaseCustomScraper):
                 if not self.tracker:
                     raise RuntimeError("Article tracker not initialized")
 
-                new_urls = await self.tracker.filter_new_articles(self.source_id, all_links)
+                new_urls = await self.tracker.filter_and_mark(self.source_id, all_links)
 
                 print(f"[{self.source_id}] URL breakdown:")
                 print(f"   Total found: {len(all_links)}")
                 print(f"   Previously seen: {len(all_links) - len(new_urls)}")
                 print(f"   New to process: {len(new_urls)}")
 
-                # ============================================================
-                # Step 3: Mark URLs as Seen (BEFORE any early returns)
-                # ============================================================
-                await self.tracker.mark_as_seen(self.source_id, all_links)
-
                 if not new_urls:
                     print(f"[{self.source_id}] No new articles to process")
                     return []
@@ -159,7 +153,7 @@ class DomusScraper(BaseCustomScraper):
                 urls_to_process = new_urls[:self.MAX_NEW_ARTICLES]
 
                 # ============================================================
-                # Step 4: Create Minimal Article Dicts
+                # Step 3: Create Minimal Article Dicts
                 # ============================================================
                 # Main pipeline will handle: content scraping, date extraction, AI filtering
                 new_articles: list[dict] = []
@@ -199,9 +193,8 @@ class DomusScraper(BaseCustomScraper):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
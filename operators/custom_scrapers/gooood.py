@@ -80,8 +80,7 @@ class GoooodScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _is_valid_article_url(self, url: str) -> bool:
         """
@@ -400,9 +399,8 @@ class GoooodScraper(BaseCustomScraper):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
@@ -87,8 +87,7 @@ class JapanArchitectsScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _ensure_llm(self):
         """Ensure LLM is initialized for date extraction."""
@@ -413,17 +412,14 @@ Do not use emoji."""
                 url: (title, html_block) for url, title, html_block in extracted
             }
 
-            # Use filter_new_articles to get only new URLs
-            new_urls = await self.tracker.filter_new_articles(self.source_id, all_urls)
+            # Get only new URLs and mark all URLs as seen in one round-trip
+            new_urls = await self.tracker.filter_and_mark(self.source_id, all_urls)
 
             print(f"[{self.source_id}] Database check:")
             print(f"   Total extracted: {len(extracted)}")
             print(f"   Already seen: {len(extracted) - len(new_urls)}")
             print(f"   New articles: {len(new_urls)}")
 
-            # Mark all URLs as seen
-            await self.tracker.mark_as_seen(self.source_id, all_urls)
-
             if not new_urls:
                 print(f"[{self.source_id}] No new articles to process")
                 return []
@@ -488,9 +484,8 @@ Do not use emoji."""
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
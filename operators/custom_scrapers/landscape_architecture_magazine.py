@@ -82,8 +82,7 @@ class LandscapeArchitectureMagazineScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _is_excluded_path(self, path: str) -> bool:
         """Check if URL path matches an excluded pattern."""
@@ -289,9 +288,8 @@ class LandscapeArchitectureMagazineScraper(BaseCustomScraper):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
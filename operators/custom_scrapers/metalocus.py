@@ -70,8 +70,7 @@ class MetalocusScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
     def _is_valid_article_url(self, path: str) -> bool:
         """
@@ -219,8 +218,8 @@ class MetalocusScraper(BaseCustomScraper):
 
                 all_urls = [url for url, _ in extracted]
 
-                # Use filter_new_articles to get only new URLs
-                new_urls = await self.tracker.filter_new_articles(self.source_id, all_urls)
+                # Get only new URLs and mark all URLs as seen in one round-trip
+                new_urls = await self.tracker.filter_and_mark(self.source_id, all_urls)
 
                 # Build lookup for titles
                 url_to_title = {url: title for url, title in extracted}
@@ -230,17 +229,12 @@ class MetalocusScraper(BaseCustomScraper):
                 print(f"   Already seen: {len(extracted) - len(new_urls)}")
                 print(f"   New articles: {len(new_urls)}")
 
-                # ============================================================
-                # Step 4: Mark All URLs as Seen
-                # ============================================================
-                await self.tracker.mark_as_seen(self.source_id, all_urls)
-
                 if not new_urls:
                     print(f"[{self.source_id}] No new articles to process")
                     return []
 
                 # ============================================================
-                # Step 5: Create Minimal Article Dicts
+                # Step 4: Create Minimal Article Dicts
                 # ============================================================
                 new_articles: list[dict] = []
 
@@ -280,9 +274,8 @@ class MetalocusScraper(BaseCustomScraper):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
@@ -9,7 +9,7 @@ Strategy: Extract links from article-item-title divs
 Pattern Analysis:
 - Article structure: <div class="article-item-title"><a href="/projects/article-slug/">Title</a></div>
 - Article URLs: /projects/article-slug/ (transliterated Russian, e.g., /projects/launzh-bar-g-lounge-v-tolyatti/)
-- Non-article URLs: URLs with Cyrillic letters are tag pages, not articles
+- Non-article URLs: URLs with Cyrillic (non-ASCII) letters are tag pages, not articles
 
 Architecture (Simplified):
 - Custom scraper discovers article URLs from projects page (no article page visits)
@@ -26,15 +26,67 @@ Usage:
 """
 
 import asyncio
+import logging
 import re
-from typing import Optional, List, Tuple
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Callable, Optional
+
+from html.parser import HTMLParser
 
 from bs4 import BeautifulSoup
 
 from operators.custom_scraper_base import BaseCustomScraper, custom_scraper_registry
 from storage.article_tracker import ArticleTracker
 
+logger = logging.getLogger(__name__)
+
+# Slug -> title conversion table (hyphens to spaces)
+_DASH_TO_SPACE = str.maketrans('-', ' ')
+
+# Whitespace runs collapsed to a single space in titles
+_WS_RE = re.compile(r'\s+')
+
+
+class _ProjectLinkParser(HTMLParser):
+    """
+    Incremental parser for <div class="article-item-title"><a href="/projects/...">.
+
+    Calls on_link(href, text) as each link closes, so the page never has
+    to be held in memory as a whole string or tree.
+    """
+
+    def __init__(self, on_link: Callable[[str, str], None]):
+        super().__init__(convert_charrefs=True)
+        self._on_link = on_link
+        self._title_div_depth = 0      # >0 while inside div.article-item-title
+        self._href: Optional[str] = None
+        self._text: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'div':
+            if self._title_div_depth:
+                self._title_div_depth += 1
+            elif 'article-item-title' in (dict(attrs).get('class') or '').split():
+                self._title_div_depth = 1
+        elif tag == 'a' and self._title_div_depth and self._href is None:
+            href = dict(attrs).get('href') or ''
+            if href.startswith('/projects/'):
+                self._href = href
+                self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            stripped = data.strip()
+            if stripped:
+                self._text.append(stripped)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._href is not None:
+            self._on_link(self._href, ''.join(self._text))
+            self._href = None
+        elif tag == 'div' and self._title_div_depth:
+            self._title_div_depth -= 1
+
 
 class ProRusScraper(BaseCustomScraper):
     """
@@ -45,13 +97,11 @@ class ProRusScraper(BaseCustomScraper):
     source_id = "prorus"
     source_name = "ProRus"
     base_url = "https://prorus.ru/projects/"
+    site_root = "https://prorus.ru"
 
     # Configuration
     MAX_NEW_ARTICLES = 10
 
-    # Pattern to detect Cyrillic characters (tag pages use Cyrillic URLs)
-    CYRILLIC_PATTERN = re.compile(r'[\u0400-\u04FF]')
-
     def __init__(self):
         """Initialize scraper with article tracker."""
         super().__init__()
@@ -60,17 +110,18 @@ class ProRusScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
+            self.tracker = await ArticleTracker.get_shared()
 
-    def _is_valid_article_url(self, href: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_article_url(href: str) -> bool:
         """
-        Check if URL is a valid article URL.
+        Check if URL is a valid article URL (cached per href).
 
         Valid articles:
         - Start with /projects/
         - Have content after /projects/
-        - Use transliterated (Latin) characters, not Cyrillic
+        - Use transliterated (ASCII) characters, not Cyrillic
         - End with /
 
         Args:
@@ -79,6 +130,12 @@ class ProRusScraper(BaseCustomScraper):
         Returns:
             True if valid article URL
         """
+        # Most selective check first: Cyrillic tag pages are the common reject
+        # on the projects page, while nearly every candidate starts with
+        # /projects/. Keep this ordering when adding checks.
+        if not href.isascii():
+            return False
+
         # Must start with /projects/
         if not href.startswith('/projects/'):
             return False
@@ -88,13 +145,47 @@ class ProRusScraper(BaseCustomScraper):
         if not slug or len(slug) < 3:
             return False
 
-        # Exclude URLs with Cyrillic characters (these are tag pages)
-        if self.CYRILLIC_PATTERN.search(href):
-            return False
-
         return True
 
-    def _extract_articles_from_html(self, html: str) -> List[Tuple[str, str]]:
+    def _add_article(self, articles: dict[str, str], href: str, text: str):
+        """
+        Validate one project link and add it to the url -> title dict.
+
+        Args:
+            articles: Dict being built (url -> title); keys are the dedup set
+            href: Link href
+            text: Link text (already stripped)
+        """
+        # Remaining checks: slug length and ASCII-only
+        if not self._is_valid_article_url(href):
+            return
+
+        # Build full URL (href is root-relative, so no urljoin needed)
+        full_url = self.site_root + href
+
+        # Ensure trailing slash
+        if not full_url.endswith('/'):
+            full_url = full_url + '/'
+
+        # DEDUPLICATION: Skip if already seen
+        if full_url in articles:
+            return
+
+        # Get title from link text
+        title = text
+
+        # If no title, use slug
+        if not title or len(title) < 3:
+            slug = href.strip('/').split('/')[-1]
+            title = slug.translate(_DASH_TO_SPACE).title()
+
+        # Clean title
+        title = _WS_RE.sub(' ', title).strip()[:200]
+
+        if title:
+            articles[full_url] = title
+
+    def _extract_articles_from_html(self, html: str) -> dict[str, str]:
         """
         Extract article URLs and titles from HTML.
 
@@ -104,52 +195,37 @@ class ProRusScraper(BaseCustomScraper):
             html: Page HTML content
 
         Returns:
-            List of tuples: (url, title) - deduplicated
+            Dict mapping url -> title, in page order (keys are deduplicated)
         """
         soup = BeautifulSoup(html, 'html.parser')
-        seen_urls: set[str] = set()
-        articles: List[Tuple[str, str]] = []
-
-        # Find all article-item-title divs
-        title_divs = soup.find_all('div', class_='article-item-title')
-
-        for div in title_divs:
-            # Find the link inside
-            link = div.find('a', href=True)
-            if not link:
-                continue
-
-            href = link.get('href', '')
-
-            # Check if valid article URL
-            if not self._is_valid_article_url(href):
-                continue
+        articles: dict[str, str] = {}
 
-            # Build full URL
-            full_url = urljoin("https://prorus.ru", href)
+        # Only project links inside article-item-title divs; the selector
+        # already enforces the /projects/ prefix
+        links = soup.select('div.article-item-title > a[href^="/projects/"]')
 
-            # Ensure trailing slash
-            if not full_url.endswith('/'):
-                full_url = full_url + '/'
+        for link in links:
+            self._add_article(articles, link['href'], link.get_text(strip=True))
 
-            # DEDUPLICATION: Skip if already seen
-            if full_url in seen_urls:
-                continue
-            seen_urls.add(full_url)
+        return articles
 
-            # Get title from link text
-            title = link.get_text(strip=True)
+    async def _stream_articles(self, url: str) -> dict[str, str]:
+        """
+        Extract article URLs and titles while the page downloads.
 
-            # If no title, use slug
-            if not title or len(title) < 3:
-                slug = href.strip('/').split('/')[-1]
-                title = slug.replace('-', ' ').title()
+        Args:
+            url: Projects page URL
 
-            # Clean title
-            title = ' '.join(title.split())[:200]
+        Returns:
+            Dict mapping url -> title (empty if the stream failed)
+        """
+        articles: dict[str, str] = {}
+        parser = _ProjectLinkParser(
+            on_link=lambda href, text: self._add_article(articles, href, text)
+        )
 
-            if title:
-                articles.append((full_url, title))
+        if not await self._stream_html(url, parser):
+            return {}
 
         return articles
 
@@ -160,7 +236,7 @@ class ProRusScraper(BaseCustomScraper):
         Workflow:
         1. Load projects page
         2. Extract all article links from article-item-title divs
-        3. Check database for new URLs
+        3. Check database for new URLs (and mark all as seen)
         4. Return minimal article dicts for new URLs
         5. Main pipeline handles: content, hero image (og:image), dates
 
@@ -170,106 +246,92 @@ class ProRusScraper(BaseCustomScraper):
         Returns:
             List of minimal article dicts
         """
-        print(f"[{self.source_id}] Starting HTTP pattern scraping...")
+        logger.info("[%s] Starting HTTP pattern scraping...", self.source_id)
 
         await self._ensure_tracker()
 
         try:
-            page = await self._create_page()
-
-            try:
-                # ============================================================
-                # Step 1: Load Projects Page
-                # ============================================================
-                print(f"[{self.source_id}] Loading projects page...")
-                await page.goto(self.base_url, timeout=self.timeout, wait_until="networkidle")
-                await page.wait_for_timeout(2000)
-
-                # Get page HTML
-                html = await page.content()
-
-                # ============================================================
-                # Step 2: Extract Article Links
-                # ============================================================
+            # ============================================================
+            # Steps 1-2: Load Projects Page and Extract Article Links
+            #            (parsed while streaming, browser fallback)
+            # ============================================================
+            logger.info("[%s] Loading projects page...", self.source_id)
+            extracted = await self._stream_articles(self.base_url)
+
+            if not extracted:
+                logger.info("[%s] Article list missing from HTTP response, using browser...", self.source_id)
+                html = await self._fetch_html_with_browser(self.base_url, 'div.article-item-title')
                 extracted = self._extract_articles_from_html(html)
-                print(f"[{self.source_id}] Found {len(extracted)} article links")
-
-                if not extracted:
-                    print(f"[{self.source_id}] No articles found")
-                    return []
-
-                # ============================================================
-                # Step 3: Check Database for New URLs
-                # ============================================================
-                if not self.tracker:
-                    raise RuntimeError("Article tracker not initialized")
-
-                all_urls = [url for url, _ in extracted]
-
-                # Use filter_new_articles to get only new URLs
-                new_urls = await self.tracker.filter_new_articles(self.source_id, all_urls)
-
-                # Build lookup for titles
-                url_to_title = {url: title for url, title in extracted}
-
-                print(f"[{self.source_id}] Database check:")
-                print(f"   Total extracted: {len(extracted)}")
-                print(f"   Already seen: {len(extracted) - len(new_urls)}")
-                print(f"   New articles: {len(new_urls)}")
-
-                # ============================================================
-                # Step 4: Mark All URLs as Seen
-                # ============================================================
-                await self.tracker.mark_as_seen(self.source_id, all_urls)
-
-                if not new_urls:
-                    print(f"[{self.source_id}] No new articles to process")
-                    return []
-
-                # ============================================================
-                # Step 5: Create Minimal Article Dicts
-                # ============================================================
-                new_articles: list[dict] = []
-
-                for url in new_urls[:self.MAX_NEW_ARTICLES]:
-                    title = url_to_title.get(url, url.strip('/').split('/')[-1].replace('-', ' ').title())
-
-                    # Create minimal article dict
-                    # Main pipeline will extract: content, hero image (og:image), date
-                    article = self._create_minimal_article_dict(
-                        title=title,
-                        link=url,
-                        published=None  # Will be extracted by main pipeline
-                    )
-
-                    if self._validate_article(article):
-                        new_articles.append(article)
-                        print(f"[{self.source_id}]    Added: {title[:50]}...")
-
-                # Final Summary
-                print(f"\n[{self.source_id}] Processing Summary:")
-                print(f"   Articles found: {len(extracted)}")
-                print(f"   New articles: {len(new_urls)}")
-                print(f"   Returning to pipeline: {len(new_articles)}")
-
-                return new_articles
 
-            finally:
-                await page.close()
+            logger.info("[%s] Found %d article links", self.source_id, len(extracted))
+
+            if not extracted:
+                logger.info("[%s] No articles found", self.source_id)
+                return []
+
+            # ============================================================
+            # Step 3: Check Database for New URLs
+            # ============================================================
+            if not self.tracker:
+                raise RuntimeError("Article tracker not initialized")
+
+            # Extractor already returns the url -> title lookup
+            url_to_title = extracted
+            all_urls = list(extracted)
+
+            # Get only new URLs and mark all URLs as seen in one round-trip
+            new_urls = await self.tracker.filter_and_mark(self.source_id, all_urls)
+
+            logger.info(
+                "[%s] Database check: %d extracted, %d already seen, %d new",
+                self.source_id, len(extracted), len(extracted) - len(new_urls), len(new_urls)
+            )
+
+            if not new_urls:
+                logger.info("[%s] No new articles to process", self.source_id)
+                return []
+
+            # ============================================================
+            # Step 4: Create Minimal Article Dicts
+            # ============================================================
+            new_articles: list[dict] = []
+
+            for url in new_urls[:self.MAX_NEW_ARTICLES]:
+                # Slug fallback only computed on a lookup miss
+                title = url_to_title.get(url)
+                if not title:
+                    title = url.strip('/').split('/')[-1].translate(_DASH_TO_SPACE).title()
+
+                # Create minimal article dict
+                # Main pipeline will extract: content, hero image (og:image), date
+                article = self._create_minimal_article_dict(
+                    title=title,
+                    link=url,
+                    published=None  # Will be extracted by main pipeline
+                )
+
+                if self._validate_article(article):
+                    new_articles.append(article)
+                    logger.debug("[%s]    Added: %.50s...", self.source_id, title)
+
+            # Final Summary
+            logger.info(
+                "[%s] Processing Summary: %d found, %d new, %d returned to pipeline",
+                self.source_id, len(extracted), len(new_urls), len(new_articles)
+            )
+
+            return new_articles
 
         except Exception as e:
-            print(f"[{self.source_id}] Error in scraping: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[%s] Error in scraping: %s", self.source_id, e)
             return []
 
     async def close(self):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
@@ -342,4 +404,5 @@ async def test_prorus_scraper():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(test_prorus_scraper())
\ No newline at end of file
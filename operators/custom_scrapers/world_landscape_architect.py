@@ -31,15 +31,114 @@ Usage:
 """
 
 import asyncio
+import logging
 import re
-from typing import Optional, List, Tuple
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
 from operators.custom_scraper_base import BaseCustomScraper, custom_scraper_registry
 from storage.article_tracker import ArticleTracker
 
+logger = logging.getLogger(__name__)
+
+# Slug -> title conversion table (hyphens to spaces)
+_DASH_TO_SPACE = str.maketrans('-', ' ')
+
+# Whitespace runs collapsed to a single space in titles
+_WS_RE = re.compile(r'\s+')
+
+
+# =============================================================================
+# URL Classification
+# =============================================================================
+
+# Known non-article path patterns (static pages, sections, profiles)
+EXCLUDED_PATH_PATTERNS = [
+    r'^/landscape-architect/',   # Firm profiles
+    r'^/job/',                   # Job listings
+    r'^/job-listing/',           # Job submission
+    r'^/category/',              # Category pages
+    r'^/shop/',                  # Shop pages
+    r'^/cart/',                  # Cart
+    r'^/checkout/',              # Checkout
+    r'^/about/',                 # About pages
+    r'^/contact-us/',            # Contact
+    r'^/advertise/',             # Advertise
+    r'^/submissions/',           # Submissions
+    r'^/support-wla/',           # Support page
+    r'^/supporters/',            # Supporters
+    r'^/product/',               # Product pages
+    r'^/design-discipline/',     # Design discipline section
+    r'^/editor-posts/',          # Editor posts section
+    r'^/review/',                # Reviews section
+    r'^/student/',               # Student section
+    r'^/general/',               # General section
+    r'^/privacy-policy',         # Privacy policy
+    r'^/disclaimer/',            # Disclaimer
+    r'^/refunds-policy/',        # Refunds
+    r'^/individual-membership/', # Membership pages
+    r'^/design-firm-membership/',
+    r'^/product-service-membership/',
+    r'^/\d{4}/\d{2}/$',          # Date archive pages like /2026/01/
+    r'^/[^/]+/$',                # Single word paths (likely company profiles like /urbastyle/, /mmcite/)
+]
+
+# All excluded patterns combined into one alternation, compiled once at import
+EXCLUDED_PATH_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in EXCLUDED_PATH_PATTERNS),
+    re.IGNORECASE
+)
+
+# Known company profile slugs (single-word paths that are NOT articles)
+# Stored lowercase in a frozenset for O(1) membership checks
+COMPANY_PROFILE_SLUGS: frozenset[str] = frozenset({
+    'urbastyle', 'mmcite', 'streetlife', 'cracknell', 'vestre',
+    'landscape-forms', 'maglin', 'scenic', 'benoy', 'felixx',
+    'hassell', 'sasaki', 'stoss', 'arcadia', 'arup', 'rios'
+})
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_article_path(path: str) -> bool:
+    """
+    Check if URL path is likely a valid article URL.
+
+    Cached per path: the same href usually appears several times on the
+    homepage (card title, image link, "read more").
+    """
+    # Checks run cheapest-first; the excluded-pattern regex only sees
+    # paths that already passed every plain string test.
+
+    # Must start with /
+    if not path.startswith('/'):
+        return False
+
+    # Get the slug (path without leading/trailing slashes)
+    slug = path.strip('/')
+
+    # Skip if empty or contains query parameters
+    if not slug or '?' in slug or '#' in slug:
+        return False
+
+    # Skip if it has nested paths (like /category/featured/)
+    if '/' in slug:
+        return False
+
+    # Must look like an article title: 4+ hyphens (5+ words)
+    # E.g., "a-new-rhythm-for-the-waterfront-the-evolution-of-sausalitos-ferry-landing"
+    if slug.count('-') < 4:
+        return False
+
+    # Skip if it's a known company profile (paths keep the site's casing)
+    if slug.lower() in COMPANY_PROFILE_SLUGS:
+        return False
+
+    # Exclude known non-article patterns
+    return EXCLUDED_PATH_RE.match(path) is None
+
 
 class WorldLandscapeArchitectScraper(BaseCustomScraper):
     """
@@ -50,47 +149,17 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
     source_id = "world_landscape_architect"
     source_name = "World Landscape Architect"
     base_url = "https://worldlandscapearchitect.com/"
+    site_root = "https://worldlandscapearchitect.com"
 
     # Configuration
     MAX_NEW_ARTICLES = 10
+    MIN_HTTP_LINKS = 20  # Fewer links in the raw HTML means the page needs JS rendering
 
-    # Known non-article path patterns (static pages, sections, profiles)
-    EXCLUDED_PATH_PATTERNS = [
-        r'^/landscape-architect/',   # Firm profiles
-        r'^/job/',                   # Job listings
-        r'^/job-listing/',           # Job submission
-        r'^/category/',              # Category pages
-        r'^/shop/',                  # Shop pages
-        r'^/cart/',                  # Cart
-        r'^/checkout/',              # Checkout
-        r'^/about/',                 # About pages
-        r'^/contact-us/',            # Contact
-        r'^/advertise/',             # Advertise
-        r'^/submissions/',           # Submissions
-        r'^/support-wla/',           # Support page
-        r'^/supporters/',            # Supporters
-        r'^/product/',               # Product pages
-        r'^/design-discipline/',     # Design discipline section
-        r'^/editor-posts/',          # Editor posts section
-        r'^/review/',                # Reviews section
-        r'^/student/',               # Student section
-        r'^/general/',               # General section
-        r'^/privacy-policy',         # Privacy policy
-        r'^/disclaimer/',            # Disclaimer
-        r'^/refunds-policy/',        # Refunds
-        r'^/individual-membership/', # Membership pages
-        r'^/design-firm-membership/',
-        r'^/product-service-membership/',
-        r'^/\d{4}/\d{2}/$',          # Date archive pages like /2026/01/
-        r'^/[^/]+/$',                # Single word paths (likely company profiles like /urbastyle/, /mmcite/)
-    ]
-
-    # Known company profile slugs (single-word paths that are NOT articles)
-    COMPANY_PROFILE_SLUGS = [
-        'urbastyle', 'mmcite', 'streetlife', 'cracknell', 'vestre',
-        'landscape-forms', 'maglin', 'scenic', 'benoy', 'felixx',
-        'hassell', 'sasaki', 'stoss', 'arcadia', 'arup', 'rios'
-    ]
+    # Candidate article links (hyphenated, not anchors/mailto/javascript)
+    ARTICLE_LINK_SELECTOR = (
+        'a[href*="-"]'
+        ':not([href^="#"]):not([href^="mailto:"]):not([href^="javascript:"])'
+    )
 
     def __init__(self):
         """Initialize scraper with article tracker."""
@@ -100,83 +169,28 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
     async def _ensure_tracker(self):
         """Ensure article tracker is connected."""
         if not self.tracker:
-            self.tracker = ArticleTracker()
-            await self.tracker.connect()
-
-    def _is_excluded_path(self, path: str) -> bool:
-        """Check if URL path matches an excluded pattern."""
-        for pattern in self.EXCLUDED_PATH_PATTERNS:
-            if re.match(pattern, path, re.IGNORECASE):
-                return True
-        return False
-
-    def _is_company_profile(self, slug: str) -> bool:
-        """Check if slug is a known company profile."""
-        # Remove leading/trailing slashes
-        clean_slug = slug.strip('/').lower()
-        return clean_slug in self.COMPANY_PROFILE_SLUGS
-
-    def _looks_like_article_title(self, slug: str) -> bool:
-        """
-        Heuristic check if a slug looks like an article title.
-        Article titles typically have 5+ words (many hyphens).
-        """
-        # Remove leading/trailing slashes
-        clean_slug = slug.strip('/')
-
-        # Count hyphens (word separators)
-        hyphen_count = clean_slug.count('-')
-
-        # Article titles typically have 4+ hyphens (5+ words)
-        # E.g., "a-new-rhythm-for-the-waterfront-the-evolution-of-sausalitos-ferry-landing"
-        return hyphen_count >= 4
+            self.tracker = await ArticleTracker.get_shared()
 
     def _is_valid_article_url(self, path: str) -> bool:
         """
         Check if URL path is likely a valid article URL.
         """
-        # Must start with /
-        if not path.startswith('/'):
-            return False
-
-        # Exclude known non-article patterns
-        if self._is_excluded_path(path):
-            return False
-
-        # Get the slug (path without leading/trailing slashes)
-        slug = path.strip('/')
-
-        # Skip if empty or contains query parameters
-        if not slug or '?' in slug or '#' in slug:
-            return False
-
-        # Skip if it's a known company profile
-        if self._is_company_profile(slug):
-            return False
+        return _is_valid_article_path(path)
 
-        # Skip if it has nested paths (like /category/featured/)
-        if '/' in slug:
-            return False
-
-        # Must look like an article title (5+ words)
-        return self._looks_like_article_title(slug)
-
-    def _extract_articles_from_html(self, html: str) -> List[Tuple[str, str]]:
+    def _extract_articles_from_html(self, html: str) -> dict[str, str]:
         """
         Extract potential article links with titles from HTML.
-        Returns list of (url, title) tuples.
+        Returns dict mapping url -> title (keys are deduplicated, in page order).
         """
         soup = BeautifulSoup(html, 'html.parser')
-        articles = []
-        seen_urls = set()
-
-        # Find all links
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
+        articles: dict[str, str] = {}
 
-            # Skip empty, external, or special links
-            if not href or href.startswith(('#', 'javascript:', 'mailto:')):
-                continue
+        # Article slugs always contain hyphens, so let the selector drop
+        # nav/footer links (/about/, /shop/, ...) and special links
+        # (#anchors, mailto:, javascript:) before any Python checks
+        for link in soup.select(self.ARTICLE_LINK_SELECTOR):
+            # Selector guarantees a non-empty href
+            href = link['href']
 
             # Parse URL
             parsed = urlparse(href)
@@ -198,10 +212,10 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
 
             # Check if it's a valid article URL
             if self._is_valid_article_url(path):
-                full_url = urljoin(self.base_url, path)
+                # Path is normalized to start with '/', so no urljoin needed
+                full_url = self.site_root + path
 
-                if full_url not in seen_urls:
-                    seen_urls.add(full_url)
+                if full_url not in articles:
 
                     # Try to get title from link text or nearby elements
                     title = link.get_text(strip=True)
@@ -216,9 +230,12 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
                     # Fall back to slug if no title found
                     if not title or len(title) < 10:
                         slug = path.strip('/').split('/')[-1]
-                        title = slug.replace('-', ' ').title()
+                        title = slug.translate(_DASH_TO_SPACE).title()
+
+                    # Clean title (collapse whitespace, cap length)
+                    title = _WS_RE.sub(' ', title).strip()[:200]
 
-                    articles.append((full_url, title))
+                    articles[full_url] = title
 
         return articles
 
@@ -229,7 +246,7 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
         Workflow:
         1. Load homepage
         2. Extract all article links matching pattern (with deduplication)
-        3. Check database for new URLs
+        3. Check database for new URLs (and mark all as seen)
         4. Return minimal article dicts for new URLs
         5. Main pipeline handles: content, hero image (og:image), dates
 
@@ -239,106 +256,94 @@ class WorldLandscapeArchitectScraper(BaseCustomScraper):
         Returns:
             List of minimal article dicts
         """
-        print(f"[{self.source_id}] Starting HTTP pattern scraping...")
+        logger.info("[%s] Starting HTTP pattern scraping...", self.source_id)
 
         await self._ensure_tracker()
 
         try:
-            page = await self._create_page()
-
-            try:
-                # ============================================================
-                # Step 1: Load Homepage
-                # ============================================================
-                print(f"[{self.source_id}] Loading homepage...")
-                await page.goto(self.base_url, timeout=self.timeout, wait_until="networkidle")
-                await page.wait_for_timeout(2000)
-
-                # Get page HTML
-                html = await page.content()
-
-                # ============================================================
-                # Step 2: Extract Article Links (with deduplication)
-                # ============================================================
-                extracted = self._extract_articles_from_html(html)
-                print(f"[{self.source_id}] Found {len(extracted)} unique article links")
-
-                if not extracted:
-                    print(f"[{self.source_id}] No articles found")
-                    return []
-
-                # ============================================================
-                # Step 3: Filter New URLs via Database
-                # ============================================================
-                # Create URL to title mapping
-                url_to_title = {url: title for url, title in extracted}
-                all_urls = list(url_to_title.keys())
-
-                # Ensure tracker is available
-                if not self.tracker:
-                    print(f"[{self.source_id}] Error: Article tracker not initialized")
-                    return []
-
-                # Filter for new articles using tracker
-                new_urls = await self.tracker.filter_new_articles(
-                    source_id=self.source_id,
-                    urls=all_urls
+            # ============================================================
+            # Step 1: Load Homepage (plain HTTP, browser fallback)
+            # ============================================================
+            logger.info("[%s] Loading homepage...", self.source_id)
+            html = await self._fetch_html(self.base_url)
+
+            if not html or html.count('<a ') < self.MIN_HTTP_LINKS:
+                logger.info("[%s] Too few links in HTTP response, using browser...", self.source_id)
+                html = await self._fetch_html_with_browser(self.base_url, 'a[href]', wait_state='attached')
+
+            # ============================================================
+            # Step 2: Extract Article Links (with deduplication)
+            # ============================================================
+            extracted = self._extract_articles_from_html(html)
+            logger.info("[%s] Found %d unique article links", self.source_id, len(extracted))
+
+            if not extracted:
+                logger.info("[%s] No articles found", self.source_id)
+                return []
+
+            # ============================================================
+            # Step 3: Filter New URLs via Database
+            # ============================================================
+            # Extractor already returns the URL to title mapping
+            url_to_title = extracted
+            all_urls = list(extracted)
+
+            # Ensure tracker is available
+            if not self.tracker:
+                logger.error("[%s] Article tracker not initialized", self.source_id)
+                return []
+
+            # Filter for new articles and mark all as seen in one round-trip
+            new_urls = await self.tracker.filter_and_mark(
+                source_id=self.source_id,
+                urls=all_urls
+            )
+
+            logger.info("[%s] New articles: %d of %d", self.source_id, len(new_urls), len(all_urls))
+
+            if not new_urls:
+                logger.info("[%s] No new articles to process", self.source_id)
+                return []
+
+            # ============================================================
+            # Step 4: Build Article List
+            # ============================================================
+            new_articles = []
+            for url in new_urls[:self.MAX_NEW_ARTICLES]:
+                # Slug fallback only computed on a lookup miss
+                title = url_to_title.get(url)
+                if not title:
+                    title = url.strip('/').split('/')[-1].translate(_DASH_TO_SPACE).title()
+
+                # Create minimal article dict
+                article = self._create_minimal_article_dict(
+                    title=title,
+                    link=url,
+                    published=None  # Will be extracted by main pipeline
                 )
 
-                print(f"[{self.source_id}] New articles: {len(new_urls)} of {len(all_urls)}")
-
-                if not new_urls:
-                    print(f"[{self.source_id}] No new articles to process")
-                    return []
-
-                # ============================================================
-                # Step 4: Build Article List
-                # ============================================================
-                new_articles = []
-                for url in new_urls[:self.MAX_NEW_ARTICLES]:
-                    title = url_to_title.get(url, url.strip('/').split('/')[-1].replace('-', ' ').title())
-
-                    # Create minimal article dict
-                    article = self._create_minimal_article_dict(
-                        title=title,
-                        link=url,
-                        published=None  # Will be extracted by main pipeline
-                    )
-
-                    if self._validate_article(article):
-                        new_articles.append(article)
-                        print(f"[{self.source_id}]    Added: {title[:60]}...")
-
-                # ============================================================
-                # Step 5: Mark URLs as Seen and Finalize
-                # ============================================================
-                # Mark all discovered article URLs as seen
-                await self.tracker.mark_as_seen(self.source_id, all_urls)
-
-                # Final Summary
-                print(f"\n[{self.source_id}] Processing Summary:")
-                print(f"   Articles found: {len(extracted)}")
-                print(f"   New articles: {len(new_urls)}")
-                print(f"   Returning to pipeline: {len(new_articles)}")
+                if self._validate_article(article):
+                    new_articles.append(article)
+                    logger.debug("[%s]    Added: %.60s...", self.source_id, title)
 
-                return new_articles
+            # Final Summary
+            logger.info(
+                "[%s] Processing Summary: %d found, %d new, %d returned to pipeline",
+                self.source_id, len(extracted), len(new_urls), len(new_articles)
+            )
 
-            finally:
-                await page.close()
+            return new_articles
 
         except Exception as e:
-            print(f"[{self.source_id}] Error in scraping: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[%s] Error in scraping: %s", self.source_id, e)
             return []
 
     async def close(self):
         """Close browser and tracker connections."""
         await super().close()
 
-        if self.tracker:
-            await self.tracker.close()
-            self.tracker = None
+        # Tracker pool is shared; the pipeline closes it via ArticleTracker.close_shared()
+        self.tracker = None
 
 
 # Register this scraper
@@ -411,4 +416,5 @@ async def test_world_landscape_architect_scraper():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(test_world_landscape_architect_scraper())
\ No newline at end of file
@@ -13,6 +13,9 @@ Usage:
     # Multiple sources:
     articles = await run_multi_source_monitor(source_ids=["archdaily", "dezeen"])
 
+    # Multiple sources, summarized via the OpenAI Batch API (scheduled runs):
+    articles = await run_monitor_batch(source_ids=["archdaily", "dezeen"])
+
     # All Tier 1 sources:
     articles = await run_tier1_monitor()
 
@@ -21,15 +24,38 @@ Environment Variables (set in Railway):
 """
 
 import os
+import json
+import calendar
+import hashlib
+import functools
 import feedparser
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from io import BytesIO
+from typing import AsyncIterator, Iterable, Optional
 
+import aiohttp
+import httpx
+from aiolimiter import AsyncLimiter
 from langchain_openai import ChatOpenAI
-
-from prompts.summarize import SUMMARIZE_PROMPT_TEMPLATE
-from prompts.summarize import parse_summary_response
+from openai import AsyncOpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+# Try to import diskcache, but don't fail if not installed (summary cache is optional)
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    Cache = None
+
+from operators.article import Article
+from operators.feed_parser import fast_parse_entries, FeedParseError
+from prompts.summarize import SUMMARIZE_PROMPT_TEMPLATE, SUMMARIZE_SYSTEM_PROMPT, SUMMARIZE_GROUP_USER_TEMPLATE
+from prompts.summarize import parse_summary_response, parse_group_summary_response, format_article_list
+from utils.urls import canonicalize_url
 from config.sources import (
     get_source_config,
     get_sources_by_tier,
@@ -39,61 +65,410 @@ from config.sources import (
 
 # Configuration
 HOURS_LOOKBACK = 24  # Collect articles from last N hours
+SUMMARY_CONCURRENCY = 8  # Max concurrent LLM requests per summarization run
+MAX_FEED_ITEMS = 50  # Max recent articles taken from a single feed
+STALE_STREAK_LIMIT = 5  # Stop after this many consecutive entries older than the cutoff
+
+# Summarization model settings (shared by the per-request and Batch API paths)
+SUMMARY_MODEL = "gpt-4o-mini"
+SUMMARY_MAX_TOKENS = 300
+SUMMARY_TEMPERATURE = 0.3  # Lower temperature for more consistent summaries
+SUMMARY_GROUP_SIZE = 8  # Articles summarized per request by summarize_articles_grouped
+
+# Client-side request budget for OpenAI (requests per minute)
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+
+# Persistent summary cache (overlapping lookback windows re-see the same articles)
+SUMMARY_CACHE_DIR = os.getenv("SUMMARY_CACHE_DIR", ".cache/summaries")
+SUMMARY_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+
+# OpenAI Batch API (non-urgent runs: half price, no per-request round-trips)
+BATCH_POLL_INTERVAL = 30  # Seconds between batch status checks
+BATCH_MAX_WAIT = 24 * 60 * 60  # Matches the 24h completion window
+
+FEED_USER_AGENT = "Mozilla/5.0 (compatible; ADUmediaMonitor/1.0; +https://adu.media)"
+
+# Per-feed ETag / Last-Modified validators for conditional GETs
+FEED_VALIDATORS_PATH = os.getenv("FEED_VALIDATORS_PATH", ".cache/feed_validators.json")
+
+# Threads for CPU-bound parsing (feeds, batch JSONL) so it never stalls the event loop
+CPU_WORKERS = 4
+
+# Downloaded feed bodies are reused for this long (e.g. test_all_feeds then a monitor run)
+FEED_CACHE_TTL = 300
+
+
+# =============================================================================
+# Shared HTTP Clients
+# =============================================================================
+
+# One keep-alive pool for feed downloads and one for OpenAI, reused for the
+# whole run instead of a new TCP/TLS handshake per feed or LLM call
+_http_session: Optional[aiohttp.ClientSession] = None
+_llm_http_client: Optional[httpx.AsyncClient] = None
+
+# url -> {"etag": ..., "last_modified": ...} (loaded lazily from disk)
+_feed_validators: Optional[dict[str, dict[str, str]]] = None
+
+# url -> validators from a fetch whose articles are not processed yet
+# (saved by commit_feed_validators once the run has handled them)
+_pending_validators: dict[str, dict[str, str]] = {}
+
+# url -> (expires_at, body, content_type, validators)
+_feed_cache: dict[str, tuple] = {}
+
+# Shared OpenAI rate limiter (created lazily inside the running loop)
+_llm_limiter: Optional[AsyncLimiter] = None
+
+# Bounded pool for CPU-bound work; unlike asyncio.to_thread it does not
+# compete with other blocking calls for the default executor
+_cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="monitor-cpu")
+
+
+async def run_cpu_bound(func, *args):
+    """Run a CPU-bound function on the bounded parse pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_executor, functools.partial(func, *args))
+
+
+def get_llm_limiter() -> AsyncLimiter:
+    """Get the shared OPENAI_RPM-per-minute limiter for LLM requests."""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = AsyncLimiter(OPENAI_RPM, 60)
+    return _llm_limiter
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) the shared aiohttp session for feed downloads."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            headers={"User-Agent": FEED_USER_AGENT},
+        )
+    return _http_session
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared httpx client used by OpenAI calls."""
+    global _llm_http_client
+    if _llm_http_client is None or _llm_http_client.is_closed:
+        _llm_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _llm_http_client
+
+
+async def close_shared_clients():
+    """Close the shared feed and LLM HTTP clients (call once at shutdown)."""
+    global _http_session, _llm_http_client
+    if _http_session and not _http_session.closed:
+        await _http_session.close()
+    if _llm_http_client and not _llm_http_client.is_closed:
+        await _llm_http_client.aclose()
+    _http_session = None
+    _llm_http_client = None
+
+
+# =============================================================================
+# Feed Download
+# =============================================================================
+
+def _load_feed_validators() -> dict[str, dict[str, str]]:
+    """Load stored ETag / Last-Modified values (empty if missing or unreadable)."""
+    global _feed_validators
+    if _feed_validators is None:
+        try:
+            with open(FEED_VALIDATORS_PATH, encoding="utf-8") as f:
+                _feed_validators = json.load(f)
+        except (OSError, ValueError):
+            _feed_validators = {}
+    return _feed_validators
+
+
+def _save_feed_validators():
+    """Persist validators atomically (write temp file, then rename)."""
+    if _feed_validators is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(FEED_VALIDATORS_PATH) or ".", exist_ok=True)
+        tmp_path = f"{FEED_VALIDATORS_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_feed_validators, f)
+        os.replace(tmp_path, FEED_VALIDATORS_PATH)
+    except OSError as e:
+        print(f"⚠️ Could not save feed validators: {e}")
+
+
+def commit_feed_validators(source_ids: Iterable[str]):
+    """
+    Save the ETag / Last-Modified of feeds whose articles have been delivered.
+
+    Called by the top-level caller (e.g. main() after the Telegram digest is
+    sent). Until then a failure leaves the old validators in place, so the
+    next run gets the full feed again instead of a 304 that would skip
+    those articles.
+
+    Args:
+        source_ids: Sources whose articles were delivered successfully
+    """
+    validators = _load_feed_validators()
+    changed = False
+    for source_id in source_ids:
+        url = _feed_url(source_id)
+        pending = _pending_validators.pop(url, None) if url else None
+        if pending:
+            validators[url] = pending
+            changed = True
+
+    if changed:
+        _save_feed_validators()
+
+
+def discard_feed_validators(source_id: str):
+    """Forget a source's unsaved validators (its run failed)."""
+    url = _feed_url(source_id)
+    if url:
+        _pending_validators.pop(url, None)
+
+
+def _feed_url(source_id: str) -> Optional[str]:
+    """RSS URL of a configured source (None if unknown or not RSS)."""
+    config = get_source_config(source_id)
+    return config.get("rss_url") if config else None
+
+
+def clear_feed_cache(url: Optional[str] = None):
+    """
+    Forget cached feed bodies so the next download hits the network.
 
+    Args:
+        url: Feed to invalidate (None clears every feed)
+    """
+    if url is None:
+        _feed_cache.clear()
+    else:
+        _feed_cache.pop(url, None)
+
+
+async def download_feed(
+    url: str,
+    conditional: bool = False
+) -> Optional[tuple[bytes, str, Optional[dict[str, str]]]]:
+    """
+    Download a feed body over the shared session.
+
+    Bodies are cached for FEED_CACHE_TTL seconds, so a feed fetched twice in
+    one run is downloaded once.
+
+    Args:
+        url: RSS/Atom feed URL
+        conditional: Send If-None-Match / If-Modified-Since saved by the
+            last committed run
+
+    Returns:
+        (body, content_type, validators), or None if the feed is unchanged
+        (HTTP 304). validators holds the response's ETag / Last-Modified
+        (None if it sent neither); they are not saved here, see
+        commit_feed_validators()
 
-def fetch_rss_feed(
-    url: str, 
+    Raises:
+        aiohttp.ClientError: On network errors or non-2xx responses
+    """
+    cached_body = _feed_cache.get(url)
+    if cached_body and cached_body[0] > time.monotonic():
+        return cached_body[1], cached_body[2], cached_body[3]
+
+    headers = {}
+    if conditional:
+        cached = _load_feed_validators().get(url, {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    session = get_http_session()
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return None
+
+        response.raise_for_status()
+        body = await response.read()
+        content_type = response.headers.get("Content-Type", "")
+
+        validators = None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            validators = {"etag": etag or "", "last_modified": last_modified or ""}
+
+    _feed_cache[url] = (time.monotonic() + FEED_CACHE_TTL, body, content_type, validators)
+
+    return body, content_type, validators
+
+
+def parse_with_feedparser(body: bytes, content_type: str = "") -> feedparser.FeedParserDict:
+    """Parse a downloaded feed body with feedparser."""
+    # Hand feedparser a stream over the existing buffer (BytesIO shares the
+    # bytes until written) and pass the content type so it can still honour
+    # the HTTP charset.
+    #
+    # HTML sanitizing and relative-URI resolution are the two most expensive
+    # steps in feedparser and are skipped: entry HTML is only used as prompt
+    # text for the LLM, never rendered, and links are read from <link>, which
+    # feeds publish as absolute URLs. Do not render entry.summary as HTML
+    # without sanitizing it first.
+    return feedparser.parse(
+        BytesIO(body),
+        response_headers={"content-type": content_type},
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+
+
+async def fetch_feed(url: str) -> feedparser.FeedParserDict:
+    """
+    Download a feed and parse it with feedparser (full feed metadata).
+
+    Args:
+        url: RSS/Atom feed URL
+
+    Returns:
+        Parsed feedparser result
+    """
+    body, content_type, _ = await download_feed(url)
+    return await run_cpu_bound(parse_with_feedparser, body, content_type)
+
+
+def parse_feed_entries(body: bytes, content_type: str = "") -> list[dict]:
+    """
+    Parse feed entries, using the fast XML parser with feedparser as fallback.
+
+    Args:
+        body: Raw feed bytes
+        content_type: HTTP Content-Type (used by the feedparser fallback)
+
+    Returns:
+        List of entry dicts with title, link, summary, id and published
+        (aware UTC datetime or None)
+    """
+    try:
+        return fast_parse_entries(body)
+    except FeedParseError as e:
+        print(f"⚠️ Fast parser failed ({e}), falling back to feedparser")
+
+    feed = parse_with_feedparser(body, content_type)
+
+    # Check for errors
+    if feed.bozo:
+        print(f"⚠️ Feed warning: {feed.bozo_exception}")
+
+    utc = timezone.utc
+    entries = []
+    for entry in feed.entries:
+        # Parse published date (feedparser gives UTC struct_time; timegm is a C call)
+        parsed_time = entry.get("published_parsed") or entry.get("updated_parsed")
+        pub_date = datetime.fromtimestamp(calendar.timegm(parsed_time), tz=utc) if parsed_time else None
+
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", ""),
+            "id": entry.get("id", ""),
+            "published": pub_date,
+        })
+
+    return entries
+
+
+async def fetch_rss_feed(
+    url: str,
     hours: int = 24,
-    source_id: Optional[str] = None
-) -> list[dict]:
+    source_id: Optional[str] = None,
+    max_items: int = MAX_FEED_ITEMS
+) -> list[Article]:
     """
     Fetch and parse RSS feed, return entries from last N hours.
 
+    Feeds are almost always newest-first, so the scan stops after
+    STALE_STREAK_LIMIT consecutive entries older than the cutoff (the rest
+    are historical items) or once max_items recent articles are collected.
+
     Args:
         url: RSS feed URL
         hours: Look back this many hours
         source_id: Optional source ID to attach to articles
+        max_items: Max number of recent articles to return
 
     Returns:
-        List of article dicts
+        List of Article records
     """
     print(f"📡 Fetching RSS feed: {url}")
 
-    feed = feedparser.parse(url)
+    try:
+        downloaded = await download_feed(url, conditional=True)
+    except Exception as e:
+        print(f"⚠️ Feed error: {e}")
+        return []
 
-    # Check for errors
-    if feed.bozo:
-        print(f"⚠️ Feed warning: {feed.bozo_exception}")
+    # Unchanged since the last run: nothing new to parse
+    if downloaded is None:
+        print("📭 Feed not modified since last fetch")
+        return []
+
+    body, content_type, validators = downloaded
+
+    # Parsing is CPU work; run it off the event loop so other sources'
+    # downloads and LLM calls keep progressing
+    entries = await run_cpu_bound(parse_feed_entries, body, content_type)
+
+    # Saved by commit_feed_validators() once the articles have been delivered
+    if validators:
+        _pending_validators[url] = validators
+
+    # Release the raw feed before building articles (entries hold only the
+    # fields we use), so concurrent sources don't keep every body alive
+    del downloaded, body
 
     # Filter articles from specified time window
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
     recent_articles = []
-
-    for entry in feed.entries:
-        # Parse published date
-        pub_date = None
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            pub_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            pub_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-
-        # Include if within time window (or if no date available)
-        if pub_date is None or pub_date >= cutoff_time:
-            article = {
-                "title": entry.get("title", "No title"),
-                "link": entry.get("link", ""),
-                "description": entry.get("summary", ""),
-                "published": pub_date.isoformat() if pub_date else None,
-                "guid": entry.get("id", entry.get("link", "")),
-                "source_id": source_id,
-            }
-            recent_articles.append(article)
+    stale_streak = 0
+
+    for entry in entries:
+        pub_date = entry["published"]
+
+        # Older than the window: count towards the stale streak
+        if pub_date is not None and pub_date < cutoff_time:
+            stale_streak += 1
+            if stale_streak >= STALE_STREAK_LIMIT:
+                break
+            continue
+
+        stale_streak = 0
+
+        # Within time window (or no date available)
+        article = Article(
+            title=entry["title"] or "No title",
+            link=entry["link"],
+            description=entry["summary"],
+            published=pub_date.isoformat() if pub_date else None,
+            guid=entry["id"] or entry["link"],
+            source_id=source_id,
+        )
+        recent_articles.append(article)
+
+        if len(recent_articles) >= max_items:
+            break
 
     print(f"📰 Found {len(recent_articles)} articles from last {hours} hours")
     return recent_articles
 
 
-def fetch_source(source_id: str, hours: int = 24) -> list[dict]:
+async def fetch_source(source_id: str, hours: int = 24) -> list[Article]:
     """
     Fetch articles from a configured source.
 
@@ -102,7 +477,7 @@ def fetch_source(source_id: str, hours: int = 24) -> list[dict]:
         hours: Look back this many hours
 
     Returns:
-        List of article dicts with source_id attached
+        List of Article records with source_id attached
     """
     config = get_source_config(source_id)
     if not config:
@@ -117,7 +492,73 @@ def fetch_source(source_id: str, hours: int = 24) -> list[dict]:
     source_name = config.get("name", source_id)
     print(f"\n📡 Fetching {source_name}...")
 
-    return fetch_rss_feed(rss_url, hours, source_id)
+    return await fetch_rss_feed(rss_url, hours, source_id)
+
+
+# =============================================================================
+# Summarization
+# =============================================================================
+
+_summary_cache = None
+
+
+def get_summary_cache():
+    """Get the on-disk summary cache, or None if diskcache is not installed."""
+    global _summary_cache
+    if _summary_cache is None and DISKCACHE_AVAILABLE:
+        _summary_cache = Cache(SUMMARY_CACHE_DIR)
+    return _summary_cache
+
+
+def _summary_cache_key(article: dict) -> str:
+    """Cache key for an article: hash of its guid (or link)."""
+    identity = article.get("guid") or article.get("link", "")
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_cached_summary(article: dict) -> bool:
+    """Fill summary fields from the cache; True if the article was cached."""
+    cache = get_summary_cache()
+    if cache is None:
+        return False
+
+    cached = cache.get(_summary_cache_key(article))
+    if not cached:
+        return False
+
+    for field, value in cached.items():
+        article[field] = value
+    return True
+
+
+def store_cached_summary(article: dict):
+    """Store an article's summary fields in the cache (no-op without diskcache)."""
+    cache = get_summary_cache()
+    if cache is None:
+        return
+
+    cache.set(
+        _summary_cache_key(article),
+        {field: article[field] for field in ("headline", "ai_summary", "tag")},
+        expire=SUMMARY_CACHE_TTL
+    )
+
+
+def cache_summaries(func):
+    """
+    Decorator for summarize_article: reuse a stored summary for an article
+    guid instead of calling the LLM again.
+    """
+    @functools.wraps(func)
+    async def wrapper(article: dict, *args, **kwargs) -> dict:
+        if load_cached_summary(article):
+            return article
+
+        result = await func(article, *args, **kwargs)
+        store_cached_summary(result)
+        return result
+
+    return wrapper
 
 
 def create_llm():
@@ -128,44 +569,83 @@ def create_llm():
         raise ValueError("OPENAI_API_KEY not set in environment")
 
     return ChatOpenAI(
-        model="gpt-4o-mini",
+        model=SUMMARY_MODEL,
         api_key=api_key,
-        max_tokens=300,
-        temperature=0.3  # Lower temperature for more consistent summaries
+        max_tokens=SUMMARY_MAX_TOKENS,
+        temperature=SUMMARY_TEMPERATURE,
+        http_async_client=get_llm_http_client()
     )
 
 
-def summarize_article(article: dict, llm, prompt_template) -> dict:
+def create_openai_client() -> AsyncOpenAI:
+    """Create an OpenAI client on the shared httpx pool (used for summaries)."""
+    api_key = os.getenv("OPENAI_API_KEY")
+
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not set in environment")
+
+    # Client rides on the run-wide httpx pool (closed by close_shared_clients)
+    return AsyncOpenAI(api_key=api_key, http_client=get_llm_http_client())
+
+
+# LangChain message types -> OpenAI chat roles
+_CHAT_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+def build_summary_messages(article: dict, prompt_template, current_date: str) -> list[dict]:
+    """Render the summary prompt for an article as OpenAI chat messages."""
+    messages = prompt_template.format_messages(
+        title=article["title"],
+        description=article["description"],
+        url=article["link"],
+        current_date=current_date
+    )
+    return [
+        {"role": _CHAT_ROLES.get(m.type, "user"), "content": m.content}
+        for m in messages
+    ]
+
+
+@cache_summaries
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+async def summarize_article(article: dict, client: AsyncOpenAI, prompt_template) -> dict:
     """
     Generate AI summary for an article.
 
+    Calls the OpenAI client directly (no LangChain chain per article).
+    Requests go through the shared rate limiter; 429s are retried with
+    randomized exponential backoff (up to 6 attempts).
+
     Args:
         article: Article dict with title, description, link
-        llm: LangChain LLM instance
-        prompt_template: LangChain prompt template
+        client: OpenAI client from create_openai_client()
+        prompt_template: LangChain prompt template (only used for formatting)
 
     Returns:
         Article dict with added ai_summary and tags
     """
-    from datetime import datetime
-
     print(f"🤖 Summarizing: {article['title'][:50]}...")
 
     # Get current date for temporal context
     current_date = datetime.now().strftime("%B %d, %Y")  # e.g., "January 15, 2026"
 
-    # Create chain and invoke
-    chain = prompt_template | llm
+    messages = build_summary_messages(article, prompt_template, current_date)
 
-    response = chain.invoke({
-        "title": article["title"],
-        "description": article["description"],
-        "url": article["link"],
-        "current_date": current_date
-    })
+    async with get_llm_limiter():
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=messages,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=SUMMARY_TEMPERATURE
+        )
 
     # Parse response
-    parsed = parse_summary_response(response.content)
+    parsed = parse_summary_response(response.choices[0].message.content or "")
 
     # Add to article
     article["headline"] = parsed["headline"]
@@ -175,6 +655,347 @@ def summarize_article(article: dict, llm, prompt_template) -> dict:
     return article
 
 
+def apply_summary_fallback(article: dict) -> dict:
+    """Fill summary fields from the original title/description (LLM failed)."""
+    article["headline"] = article.get("title", "")
+    article["ai_summary"] = article.get("description", "")[:200] + "..."
+    article["tag"] = ""
+    return article
+
+
+async def iter_summaries(
+    articles: list[dict],
+    client: AsyncOpenAI,
+    prompt_template,
+    concurrency: int = SUMMARY_CONCURRENCY
+) -> AsyncIterator[dict]:
+    """
+    Summarize articles concurrently, yielding each one as soon as it is done.
+
+    Summaries are produced by background tasks and handed over through an
+    asyncio.Queue, so the caller can process early articles (upload, send)
+    while later LLM calls are still running.
+
+    Args:
+        articles: Article dicts with title, description, link
+        client: OpenAI client from create_openai_client()
+        prompt_template: LangChain prompt template
+        concurrency: Max LLM requests in flight
+
+    Yields:
+        Articles in completion order; failed ones fall back to the original description
+    """
+    done: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _produce(article: dict):
+        try:
+            async with semaphore:
+                await summarize_article(article, client, prompt_template)
+        except Exception as e:
+            print(f"⚠️ Error summarizing '{article['title'][:30]}...': {e}")
+            apply_summary_fallback(article)
+        await done.put(article)
+
+    producers = [asyncio.create_task(_produce(article)) for article in articles]
+
+    try:
+        for _ in producers:
+            yield await done.get()
+    finally:
+        # Consumer stopped early (error or break): don't leave calls running
+        for task in producers:
+            task.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+
+
+async def summarize_articles(
+    articles: list[dict],
+    client: AsyncOpenAI,
+    prompt_template,
+    concurrency: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
+    """
+    Generate AI summaries for many articles concurrently.
+
+    Args:
+        articles: Article dicts with title, description, link
+        client: OpenAI client from create_openai_client()
+        prompt_template: LangChain prompt template
+        concurrency: Max LLM requests in flight
+
+    Returns:
+        Articles in input order; failed ones fall back to the original description
+    """
+    # Articles are updated in place, so input order is kept by returning the list
+    async for _ in iter_summaries(articles, client, prompt_template, concurrency):
+        pass
+
+    return articles
+
+
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+async def summarize_article_group(articles: list[dict], client: AsyncOpenAI) -> list[dict]:
+    """
+    Summarize several articles with a single LLM request.
+
+    The articles go out as one numbered list and the model answers with a
+    JSON object (JSON mode), which amortizes the per-request overhead over
+    the whole group.
+
+    Args:
+        articles: Article dicts with title, description, link
+        client: OpenAI client from create_openai_client()
+
+    Returns:
+        Articles the response covered (summary fields set); the rest are
+        left untouched for the caller to retry
+    """
+    current_date = datetime.now().strftime("%B %d, %Y")
+
+    messages = [
+        {"role": "system", "content": SUMMARIZE_SYSTEM_PROMPT.format(current_date=current_date)},
+        {"role": "user", "content": SUMMARIZE_GROUP_USER_TEMPLATE.format(
+            articles=format_article_list(articles)
+        )},
+    ]
+
+    async with get_llm_limiter():
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=messages,
+            max_tokens=SUMMARY_MAX_TOKENS * len(articles),
+            temperature=SUMMARY_TEMPERATURE,
+            response_format={"type": "json_object"}
+        )
+
+    parsed = parse_group_summary_response(response.choices[0].message.content or "")
+
+    summarized = []
+    for i, article in enumerate(articles, 1):
+        result = parsed.get(i)
+        if result is None:
+            continue
+        article["headline"] = result["headline"]
+        article["ai_summary"] = result["summary"]
+        article["tag"] = result["tag"]
+        store_cached_summary(article)
+        summarized.append(article)
+
+    return summarized
+
+
+async def summarize_articles_grouped(
+    articles: list[dict],
+    client: AsyncOpenAI,
+    group_size: int = SUMMARY_GROUP_SIZE,
+    concurrency: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
+    """
+    Generate AI summaries with several articles per LLM request.
+
+    Cached articles are skipped, the rest are split into groups of
+    group_size and the groups are summarized concurrently. Articles a group
+    response missed (or whose group failed) are retried one per request.
+
+    Args:
+        articles: Article dicts with title, description, link
+        client: OpenAI client from create_openai_client()
+        group_size: Articles per request
+        concurrency: Max LLM requests in flight
+
+    Returns:
+        Articles in input order; failed ones fall back to the original description
+    """
+    pending = [article for article in articles if not load_cached_summary(article)]
+    groups = [pending[i:i + group_size] for i in range(0, len(pending), group_size)]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(group: list[dict]) -> list[dict]:
+        async with semaphore:
+            return await summarize_article_group(group, client)
+
+    outcomes = await asyncio.gather(*(_bounded(group) for group in groups), return_exceptions=True)
+
+    missed = []
+    for group, outcome in zip(groups, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"⚠️ Error summarizing group of {len(group)}: {outcome}")
+            missed.extend(group)
+        elif len(outcome) < len(group):
+            summarized = {id(article) for article in outcome}
+            missed.extend(article for article in group if id(article) not in summarized)
+
+    if missed:
+        print(f"🔁 Retrying {len(missed)} articles one per request")
+        await summarize_articles(missed, client, SUMMARIZE_PROMPT_TEMPLATE, concurrency)
+
+    return articles
+
+
+# =============================================================================
+# OpenAI Batch API Summarization
+# =============================================================================
+
+def _batch_request(custom_id: str, article: dict, prompt_template, current_date: str) -> dict:
+    """Build one Batch API JSONL request for an article."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": SUMMARY_MODEL,
+            "messages": build_summary_messages(article, prompt_template, current_date),
+            "max_tokens": SUMMARY_MAX_TOKENS,
+            "temperature": SUMMARY_TEMPERATURE,
+        },
+    }
+
+
+def _build_batch_jsonl(articles: list[dict], prompt_template, current_date: str) -> bytes:
+    """Serialize one Batch API request per article as JSONL."""
+    # custom_id is the article index (guids are not guaranteed unique across sources)
+    return "\n".join(
+        json.dumps(_batch_request(str(i), article, prompt_template, current_date))
+        for i, article in enumerate(articles)
+    ).encode("utf-8")
+
+
+def _parse_batch_output(text: str) -> dict[str, str]:
+    """Map custom_id -> response text for the successful lines of a batch output file."""
+    responses = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            responses[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return responses
+
+
+async def summarize_articles_batch(
+    articles: list[dict],
+    prompt_template,
+    poll_interval: int = BATCH_POLL_INTERVAL,
+    max_wait: int = BATCH_MAX_WAIT
+) -> list[dict]:
+    """
+    Summarize articles through the OpenAI Batch API.
+
+    Uploads one JSONL request per article, waits for the batch to finish and
+    maps results back by custom_id. Articles without a successful result get
+    the description fallback.
+
+    Args:
+        articles: Article dicts with title, description, link
+        prompt_template: LangChain prompt template
+        poll_interval: Seconds between status checks
+        max_wait: Give up after this many seconds
+
+    Returns:
+        Articles in input order with headline, ai_summary and tag set
+
+    Raises:
+        RuntimeError: If the batch fails, expires or times out
+    """
+    if not articles:
+        return []
+
+    client = create_openai_client()
+    current_date = datetime.now().strftime("%B %d, %Y")
+
+    jsonl = await run_cpu_bound(_build_batch_jsonl, articles, prompt_template, current_date)
+
+    batch_file = await client.files.create(
+        file=("summaries.jsonl", jsonl),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"📦 Submitted batch {batch.id} ({len(articles)} articles)")
+
+    # Poll until the batch reaches a terminal state
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if loop.time() > deadline:
+            raise RuntimeError(f"Batch {batch.id} still {batch.status} after {max_wait}s")
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    output = await client.files.content(batch.output_file_id)
+
+    responses = await run_cpu_bound(_parse_batch_output, output.text)
+
+    for i, article in enumerate(articles):
+        content = responses.get(str(i))
+        if content is None:
+            print(f"⚠️ No batch result for '{article['title'][:30]}...'")
+            apply_summary_fallback(article)
+            continue
+
+        parsed = parse_summary_response(content)
+        article["headline"] = parsed["headline"]
+        article["ai_summary"] = parsed["summary"]
+        article["tag"] = parsed["tag"]
+
+    print(f"✅ Batch summarized {len(responses)}/{len(articles)} articles")
+    return articles
+
+
+# =============================================================================
+# Deduplication
+# =============================================================================
+
+def article_dedup_key(article: dict) -> str:
+    """Identity of an article across sources: canonical link, else guid, else title."""
+    link = article.get("link", "")
+    if link:
+        return canonicalize_url(link)
+    return article.get("guid") or article.get("title", "").strip().lower()
+
+
+def dedupe_results(results: dict[str, list[dict]]) -> int:
+    """
+    Drop articles already seen under an earlier source (in place).
+
+    Args:
+        results: Dict mapping source_id to list of articles
+
+    Returns:
+        Number of duplicates removed
+    """
+    seen: set[str] = set()
+    removed = 0
+
+    for source_id, articles in results.items():
+        unique = []
+        for article in articles:
+            key = article_dedup_key(article)
+            if key in seen:
+                removed += 1
+                continue
+            seen.add(key)
+            unique.append(article)
+        results[source_id] = unique
+
+    return removed
+
+
 # =============================================================================
 # Main Monitor Functions
 # =============================================================================
@@ -183,23 +1004,28 @@ async def run_monitor(
     source_id: str = "archdaily",
     hours: int = HOURS_LOOKBACK,
     skip_summary: bool = False
-) -> list[dict]:
+) -> list[Article]:
     """
     Monitor a single source - fetches RSS and optionally generates AI summaries.
 
+    The feed's validators are left pending: the caller calls
+    commit_feed_validators([source_id]) once the articles have been
+    delivered (or discard_feed_validators if that fails).
+
     Args:
         source_id: Source ID from registry (e.g., 'archdaily', 'dezeen')
         hours: How many hours back to look for articles
         skip_summary: If True, skip AI summarization
 
     Returns:
-        List of article dicts with ai_summary and tags added
+        List of Article records with ai_summary and tags added
     """
     # Fetch articles
-    articles = fetch_source(source_id, hours)
+    articles = await fetch_source(source_id, hours)
 
     if not articles:
         print("📭 No new articles found")
+        commit_feed_validators([source_id])
         return []
 
     if skip_summary:
@@ -209,25 +1035,13 @@ async def run_monitor(
     if not os.getenv("OPENAI_API_KEY"):
         raise ValueError("OPENAI_API_KEY not set in environment")
 
-    # Initialize LLM
+    # Initialize LLM client
     print("🔧 Initializing AI (GPT-4o-mini)...")
-    llm = create_llm()
+    client = create_openai_client()
 
     # Generate summaries
     print(f"📝 Generating summaries for {len(articles)} articles...")
-    summarized_articles = []
-
-    for article in articles:
-        try:
-            summarized = summarize_article(article, llm, SUMMARIZE_PROMPT_TEMPLATE)
-            summarized_articles.append(summarized)
-        except Exception as e:
-            print(f"⚠️ Error summarizing '{article['title'][:30]}...': {e}")
-            # Fallback: use original description
-            article["headline"] = article["title"]
-            article["ai_summary"] = article["description"][:200] + "..."
-            article["tag"] = ""
-            summarized_articles.append(article)
+    summarized_articles = await summarize_articles_grouped(articles, client)
 
     print(f"✅ Summarized {len(summarized_articles)} articles")
     return summarized_articles
@@ -239,7 +1053,12 @@ async def run_multi_source_monitor(
     skip_summary: bool = False
 ) -> dict[str, list[dict]]:
     """
-    Monitor multiple sources.
+    Monitor multiple sources concurrently.
+
+    Feeds are fetched first, cross-posted articles are deduplicated, and only
+    then are the remaining articles summarized (one LLM call per story).
+    The caller calls commit_feed_validators(source_ids) once the articles
+    have been delivered (validators of failed sources are discarded here).
 
     Args:
         source_ids: List of source IDs to monitor
@@ -251,13 +1070,34 @@ async def run_multi_source_monitor(
     """
     results = {}
 
-    for source_id in source_ids:
-        try:
-            articles = await run_monitor(source_id, hours, skip_summary)
-            results[source_id] = articles
-        except Exception as e:
-            print(f"⚠️ Error monitoring {source_id}: {e}")
+    # Run all sources concurrently; one failing source must not cancel the rest
+    outcomes = await asyncio.gather(
+        *(run_monitor(source_id, hours, skip_summary=True) for source_id in source_ids),
+        return_exceptions=True
+    )
+
+    for source_id, outcome in zip(source_ids, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"⚠️ Error monitoring {source_id}: {outcome}")
+            discard_feed_validators(source_id)
             results[source_id] = []
+        else:
+            results[source_id] = outcome
+
+    removed = dedupe_results(results)
+    if removed:
+        print(f"🔁 Removed {removed} duplicate articles across sources")
+
+    if not skip_summary:
+        all_articles = [article for articles in results.values() for article in articles]
+        if all_articles:
+            # Validate API key
+            if not os.getenv("OPENAI_API_KEY"):
+                raise ValueError("OPENAI_API_KEY not set in environment")
+
+            print(f"📝 Generating summaries for {len(all_articles)} articles...")
+            # Articles are updated in place, so results carry the summaries
+            await summarize_articles_grouped(all_articles, create_openai_client())
 
     # Summary
     total = sum(len(articles) for articles in results.values())
@@ -266,6 +1106,38 @@ async def run_multi_source_monitor(
     return results
 
 
+async def run_monitor_batch(
+    source_ids: list[str],
+    hours: int = HOURS_LOOKBACK
+) -> dict[str, list[dict]]:
+    """
+    Monitor multiple sources and summarize everything in one Batch API job.
+
+    For scheduled, non-urgent runs. Falls back to per-request summarization
+    if the batch fails. As with run_multi_source_monitor, the caller commits
+    the feed validators after delivering the articles.
+
+    Args:
+        source_ids: List of source IDs to monitor
+        hours: How many hours back to look for articles
+
+    Returns:
+        Dict mapping source_id to list of articles
+    """
+    results = await run_multi_source_monitor(source_ids, hours, skip_summary=True)
+
+    all_articles = [article for articles in results.values() for article in articles]
+    if all_articles:
+        try:
+            await summarize_articles_batch(all_articles, SUMMARIZE_PROMPT_TEMPLATE)
+        except Exception as e:
+            print(f"⚠️ Batch summarization failed ({e}), falling back to per-request calls")
+            await summarize_articles(all_articles, create_openai_client(), SUMMARIZE_PROMPT_TEMPLATE)
+
+    # Articles are updated in place, so results already carry the summaries
+    return results
+
+
 async def run_tier1_monitor(
     hours: int = HOURS_LOOKBACK,
     skip_summary: bool = False
@@ -335,7 +1207,7 @@ async def test_rss_feed(source_id: str) -> dict:
         return {"source_id": source_id, "success": False, "error": "No RSS URL"}
 
     try:
-        feed = feedparser.parse(rss_url)
+        feed = await fetch_feed(rss_url)
 
         if feed.bozo and not feed.entries:
             return {
@@ -370,15 +1242,14 @@ async def test_all_feeds() -> list[dict]:
         List of test results for each source
     """
     sources = get_all_rss_sources()
-    results = []
 
     print("\n🧪 Testing All RSS Feeds")
     print("=" * 60)
 
-    for source in sources:
-        source_id = source["id"]
-        result = await test_rss_feed(source_id)
+    # Every feed is on a different host, so test them all at once
+    results = await asyncio.gather(*(test_rss_feed(source["id"]) for source in sources))
 
+    for source, result in zip(sources, results):
         status = "✅" if result["success"] else "❌"
         print(f"{status} {source['name']}: ", end="")
 
@@ -387,17 +1258,12 @@ async def test_all_feeds() -> list[dict]:
         else:
             print(f"Error - {result.get('error', 'Unknown')[:50]}")
 
-        results.append(result)
-
-        # Small delay to be nice to servers
-        await asyncio.sleep(0.5)
-
     # Summary
     successful = sum(1 for r in results if r["success"])
     print("\n" + "=" * 60)
     print(f"📊 Results: {successful}/{len(results)} feeds working")
 
-    return results
+    return list(results)
 
 
 # =============================================================================
@@ -416,48 +1282,64 @@ async def main():
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     print("=" * 60)
 
-    # Check for test mode
-    import sys
-    if len(sys.argv) > 1 and sys.argv[1] == "--test-feeds":
-        await test_all_feeds()
-        return
-
-    # Validate required environment variables
-    required_vars = ["TELEGRAM_BOT_TOKEN", "TELEGRAM_CHANNEL_ID", "OPENAI_API_KEY"]
-    missing = [var for var in required_vars if not os.getenv(var)]
-
-    if missing:
-        print(f"❌ Missing environment variables: {', '.join(missing)}")
-        print("Please set these in Railway dashboard.")
-        return
-
-    # Run monitor for tested sources only
-    results = await run_tested_sources_monitor()
-
-    # Combine all articles
-    all_articles = []
-    for source_id, articles in results.items():
-        all_articles.extend(articles)
+    try:
+        # Check for test mode
+        import sys
+        if len(sys.argv) > 1 and sys.argv[1] == "--test-feeds":
+            await test_all_feeds()
+            return
+
+        # Validate required environment variables
+        required_vars = ["TELEGRAM_BOT_TOKEN", "TELEGRAM_CHANNEL_ID", "OPENAI_API_KEY"]
+        missing = [var for var in required_vars if not os.getenv(var)]
+
+        if missing:
+            print(f"❌ Missing environment variables: {', '.join(missing)}")
+            print("Please set these in Railway dashboard.")
+            return
+
+        # Run monitor for tested sources only
+        results = await run_tested_sources_monitor()
+        source_ids = list(results)
+
+        # Combine all articles
+        all_articles = []
+        for source_id, articles in results.items():
+            all_articles.extend(articles)
+
+        if not all_articles:
+            print("📭 No articles to send. Exiting.")
+            commit_feed_validators(source_ids)
+            return
+
+        # Send to Telegram
+        print("\n📱 Sending to Telegram...")
+        try:
+            bot = TelegramBot()
+            results = await bot.send_digest([article.to_dict() for article in all_articles])
 
-    if not all_articles:
-        print("📭 No articles to send. Exiting.")
-        return
+            print("=" * 60)
+            print(f"✅ Complete! Sent {results['sent']} messages.")
+            if results['failed'] > 0:
+                print(f"⚠️ Failed: {results['failed']} messages")
+            print("=" * 60)
 
-    # Send to Telegram
-    print("\n📱 Sending to Telegram...")
-    try:
-        bot = TelegramBot()
-        results = await bot.send_digest(all_articles)
+        except Exception as e:
+            print(f"❌ Telegram error: {e}")
+            # Keep the old validators so the next run refetches these articles
+            for source_id in source_ids:
+                discard_feed_validators(source_id)
+            raise
 
-        print("=" * 60)
-        print(f"✅ Complete! Sent {results['sent']} messages.")
+        # Only a fully delivered digest lets the next run skip unchanged feeds
         if results['failed'] > 0:
-            print(f"⚠️ Failed: {results['failed']} messages")
-        print("=" * 60)
+            for source_id in source_ids:
+                discard_feed_validators(source_id)
+        else:
+            commit_feed_validators(source_ids)
 
-    except Exception as e:
-        print(f"❌ Telegram error: {e}")
-        raise
+    finally:
+        await close_shared_clients()
 
 
 if __name__ == "__main__":
@@ -4,9 +4,10 @@ ArchNews Article Scraper
 Scrapes full article content from architecture news sites using Railway Browserless.
 
 Features:
-- Persistent browser sessions for efficiency
-- Page reuse (navigates with goto instead of creating new pages)
+- One browser with several contexts; cookies persisted across runs
+- Warm page pool per context (pages are reused, not created per article)
 - Aggressive ad/tracker blocking for speed
+- Plain HTTP fast path for sites that don't need JavaScript
 - Hero image extraction from og:image meta tags
 - Image downloading for R2 storage
 
@@ -20,15 +21,21 @@ Usage:
 Environment Variables (set in Railway):
     BROWSER_PLAYWRIGHT_ENDPOINT - Railway Browserless WebSocket URL
     BROWSER_TOKEN - Railway Browserless auth token (optional)
+    SCRAPER_STATE_DIR - Where context cookies are saved between runs (default: .browser_state)
 """
 
 import asyncio
+import json
 import logging
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import time
 import re
 import os
 from typing import Dict, List, Any, Optional
 from urllib.parse import urlparse, urljoin
+from bs4 import BeautifulSoup
 from playwright.async_api import (
     async_playwright, 
     Browser, 
@@ -37,10 +44,313 @@ from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError
 )
 
+from operators.custom_scraper_base import get_http_session, close_http_session
+from utils.urls import canonicalize_url
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keys _scrape_single_article / _scrape_http add to an article
+SCRAPE_RESULT_FIELDS = (
+    "full_content", "images", "image_count", "hero_image",
+    "scrape_success", "scrape_time", "content_length", "scrape_error",
+)
+
+# Articles with less text than this count as failed scrapes
+MIN_CONTENT_CHARS = 100
+
+
+# =============================================================================
+# In-page Extraction Scripts
+# =============================================================================
+
+# Runs in every page before site scripts: no animations, no popups
+PAGE_INIT_JS = """
+// Disable animations for faster rendering
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = `
+        *, *::before, *::after {
+            animation: none !important;
+            transition: none !important;
+        }
+    `;
+    document.head.appendChild(style);
+});
+
+// Block popups
+window.alert = window.confirm = window.prompt = () => {};
+window.open = () => null;
+"""
+
+# Clicks the first visible dismiss target; returns what was clicked (or null)
+DISMISS_OVERLAYS_JS = """
+(targets) => {
+    const visible = el => !!(el.offsetParent || el.getClientRects().length);
+    let buttons = null;
+
+    for (const [kind, value] of targets) {
+        if (kind === 'css') {
+            const el = document.querySelector(value);
+            if (el && visible(el)) {
+                el.click();
+                return value;
+            }
+        } else {
+            buttons = buttons || Array.from(document.querySelectorAll('button'));
+            const needle = value.toLowerCase();
+            const el = buttons.find(b => visible(b) && (b.innerText || '').toLowerCase().includes(needle));
+            if (el) {
+                el.click();
+                return value;
+            }
+        }
+    }
+    return null;
+}
+"""
+
+# Hero image from og:image / twitter:image / schema.org / image_src
+HERO_IMAGE_JS = """
+(baseUrl) => {
+    // Helper to resolve relative URLs
+    function resolveUrl(url) {
+        if (!url) return null;
+        if (url.startsWith('http')) return url;
+        if (url.startsWith('//')) return 'https:' + url;
+        try {
+            return new URL(url, baseUrl).href;
+        } catch {
+            return null;
+        }
+    }
+
+    // Try og:image first (most reliable for social sharing)
+    const ogImage = document.querySelector('meta[property="og:image"]');
+    if (ogImage) {
+        const url = resolveUrl(ogImage.content);
+        if (url) {
+            // Try to get dimensions from og:image:width/height
+            const ogWidth = document.querySelector('meta[property="og:image:width"]');
+            const ogHeight = document.querySelector('meta[property="og:image:height"]');
+            const ogAlt = document.querySelector('meta[property="og:image:alt"]');
+
+            return {
+                url: url,
+                width: ogWidth ? parseInt(ogWidth.content) : null,
+                height: ogHeight ? parseInt(ogHeight.content) : null,
+                alt: ogAlt ? ogAlt.content : '',
+                source: 'og:image'
+            };
+        }
+    }
+
+    // Try twitter:image
+    const twitterImage = document.querySelector('meta[name="twitter:image"]') ||
+                         document.querySelector('meta[property="twitter:image"]');
+    if (twitterImage) {
+        const url = resolveUrl(twitterImage.content);
+        if (url) {
+            return {
+                url: url,
+                width: null,
+                height: null,
+                alt: '',
+                source: 'twitter:image'
+            };
+        }
+    }
+
+    // Fallback: try to find schema.org image
+    const schemaImage = document.querySelector('meta[itemprop="image"]');
+    if (schemaImage) {
+        const url = resolveUrl(schemaImage.content);
+        if (url) {
+            return {
+                url: url,
+                width: null,
+                height: null,
+                alt: '',
+                source: 'schema.org'
+            };
+        }
+    }
+
+    // Last resort: link rel="image_src"
+    const linkImage = document.querySelector('link[rel="image_src"]');
+    if (linkImage) {
+        const url = resolveUrl(linkImage.href);
+        if (url) {
+            return {
+                url: url,
+                width: null,
+                height: null,
+                alt: '',
+                source: 'link:image_src'
+            };
+        }
+    }
+
+    return null;
+}
+"""
+
+# Main article text: first selector with >200 chars, else trimmed body text
+ARTICLE_CONTENT_JS = """
+(selectors) => {
+    // Try each selector
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            // Clone to avoid modifying original
+            const clone = element.cloneNode(true);
+
+            // Remove unwanted elements
+            const removeSelectors = [
+                'script', 'style', 'nav', 'header', 'footer',
+                'aside', '.ad', '.ads', '.advertisement',
+                '.social-share', '.related-posts', '.comments',
+                '.newsletter', '.sidebar', '[role="complementary"]',
+                '.breadcrumb', '.pagination', '.author-bio'
+            ];
+
+            removeSelectors.forEach(sel => {
+                clone.querySelectorAll(sel).forEach(el => el.remove());
+            });
+
+            const text = clone.innerText || clone.textContent || '';
+            if (text.trim().length > 200) {
+                return text.trim();
+            }
+        }
+    }
+
+    // Fallback: get body text
+    const body = document.body.cloneNode(true);
+    ['script', 'style', 'nav', 'header', 'footer', 'aside']
+        .forEach(tag => body.querySelectorAll(tag).forEach(el => el.remove()));
+
+    return (body.innerText || body.textContent || '').trim().substring(0, 10000);
+}
+"""
+
+# Up to 10 content-sized article images
+IMAGES_JS = """
+(baseUrl) => {
+    const images = [];
+    const seen = new Set();
+
+    // Common non-content images (one case-insensitive scan per src)
+    const skipSrc = /logo|icon|avatar|advertisement|banner|placeholder/i;
+
+    // Selectors for article images
+    const selectors = [
+        'article img',
+        '.article-content img',
+        '.gallery img',
+        'main img',
+        '.post-content img',
+        '.entry-content img',
+    ];
+
+    // Collect images in one DOM walk (document order; each <img> visited once)
+    document.querySelectorAll(selectors.join(',')).forEach(img => {
+        let src = img.src || img.dataset.src || img.dataset.lazySrc || '';
+        if (!src) return;
+
+        // Absolute URL via the browser's parser (data-src may be relative)
+        try {
+            src = new URL(src, baseUrl).href;
+        } catch (e) {
+            return;
+        }
+
+        // Skip if already seen
+        if (seen.has(src)) return;
+
+        // Skip tiny images, icons, logos. Image requests are blocked, so
+        // size usually comes from the width/height attributes (read as
+        // attributes: img.width would force a layout); images with no known
+        // size are kept
+        const loaded = img.complete && img.naturalWidth > 0;
+        const width = (loaded ? img.naturalWidth : parseInt(img.getAttribute('width'))) || 0;
+        const height = (loaded ? img.naturalHeight : parseInt(img.getAttribute('height'))) || 0;
+        if ((width && width < 200) || (height && height < 150)) return;
+
+        // Skip common non-content images
+        if (skipSrc.test(src)) return;
+
+        seen.add(src);
+        images.push({
+            url: src,
+            alt: img.alt || '',
+            width: width,
+            height: height,
+            area: width * height,
+        });
+    });
+
+    return images.slice(0, 10);  // Limit to 10 images
+}
+"""
+
+# All three in a single page.evaluate round-trip; the image walk is skipped
+# when the page has too little text to be a usable article
+EXTRACT_ALL_JS = """
+({baseUrl, selectors, minContent}) => {
+    const content = (""" + ARTICLE_CONTENT_JS + """)(selectors);
+    const hasContent = !!content && content.trim().length > minContent;
+    return {
+        hero: (""" + HERO_IMAGE_JS + """)(baseUrl),
+        content: content,
+        images: hasContent ? (""" + IMAGES_JS + """)(baseUrl) : [],
+    };
+}
+"""
+
+# Largest article image only (reduced in the page, so one object crosses CDP)
+LARGEST_IMAGE_JS = """
+(baseUrl) => {
+    const images = (""" + IMAGES_JS + """)(baseUrl);
+    return images.length ? images.reduce((a, b) => (b.area > a.area ? b : a)) : null;
+}
+"""
+
+# Scripts installed once per context as window.__adu.<name>, so each call
+# ships only a short stub over CDP instead of the full function source
+# (see ArticleScraper._run_script; the constants above are the fallback)
+PAGE_SCRIPTS = {
+    "dismiss": DISMISS_OVERLAYS_JS,
+    "hero": HERO_IMAGE_JS,
+    "content": ARTICLE_CONTENT_JS,
+    "images": IMAGES_JS,
+    "largest_image": LARGEST_IMAGE_JS,
+    "all": EXTRACT_ALL_JS,
+}
+
+SCRIPTS_INIT_JS = """
+window.__adu = {
+    dismiss: """ + DISMISS_OVERLAYS_JS.strip() + """,
+    hero: """ + HERO_IMAGE_JS.strip() + """,
+    content: """ + ARTICLE_CONTENT_JS.strip() + """,
+    images: """ + IMAGES_JS.strip() + """,
+    largest_image: (baseUrl) => {
+        const images = window.__adu.images(baseUrl);
+        return images.length ? images.reduce((a, b) => (b.area > a.area ? b : a)) : null;
+    },
+    all: ({baseUrl, selectors, minContent}) => {
+        const content = window.__adu.content(selectors);
+        const hasContent = !!content && content.trim().length > minContent;
+        return {
+            hero: window.__adu.hero(baseUrl),
+            content: content,
+            images: hasContent ? window.__adu.images(baseUrl) : [],
+        };
+    },
+};
+"""
+
 
 class ArticleScraper:
     """
@@ -48,18 +358,23 @@ class ArticleScraper:
     Optimized for speed with persistent browser sessions and page reuse.
     """
 
-    def __init__(self, browser_pool_size: int = 2):
+    def __init__(self, browser_pool_size: int = 2, pages_per_context: int = 2):
         """
         Initialize the article scraper.
 
         Args:
-            browser_pool_size: Number of concurrent browsers (2-3 recommended)
+            browser_pool_size: Number of browser contexts (2-3 recommended)
+            pages_per_context: Warm pages kept open per browser context
         """
-        # Browser pool settings
+        # Browser pool settings: one browser, browser_pool_size contexts
         self.browser_pool_size = browser_pool_size
-        self.browser_pool: List[Browser] = []
+        self.pages_per_context = pages_per_context
+        self.browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
         self.browser_contexts: List[BrowserContext] = []
-        self.browser_pages: List[Page] = []  # Persistent pages - one per context
+        self.warm_domains: List[set] = []  # Sites whose overlays were dismissed - one set per context
+        self.browser_pages: List[List[Page]] = []  # Warm pages - one list per context
+        self.page_pools: List[asyncio.Queue] = []  # Idle pages - one queue per context
         self.playwright = None
         self.session_active = False
         self._session_lock = asyncio.Lock()
@@ -72,10 +387,31 @@ class ArticleScraper:
         )
         self.browserless_token = os.getenv('BROWSER_TOKEN')
 
+        # Context cookies/localStorage saved at close() and loaded on the next
+        # run, so consent banners that were dismissed once stay dismissed
+        self.state_dir = os.getenv('SCRAPER_STATE_DIR', '.browser_state')
+
         # Timeout settings (in milliseconds)
         self.default_timeout = 20000  # 20 seconds
         self.browser_launch_timeout = 25000  # 25 seconds
 
+        # Browser identity (also sent by the HTTP fast path)
+        self.user_agent = (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        )
+
+        # Sites that serve full article HTML without JavaScript.
+        # These are fetched over plain HTTP first; the browser is only used
+        # when the HTML yields too little content.
+        self.http_domains = {
+            'archdaily.com',
+            'dezeen.com',
+            'designboom.com',
+            'archpaper.com',
+        }
+
         # Domain-specific timeouts for slower sites
         self.domain_timeouts = {
             'archdaily.com': 25000,
@@ -85,10 +421,92 @@ class ArticleScraper:
             'archpaper.com': 18000,
         }
 
+        # Content selectors, merged once per site: site-specific first, then generic
+        site_selectors = {
+            'archdaily.com': [
+                'article.afd-char-gallery',
+                '.afd-gallery-container',
+                'article[class*="article"]',
+                '.article-content',
+            ],
+            'dezeen.com': [
+                '.article-content',
+                'article .entry-content',
+                '.dezeen-content',
+            ],
+            'designboom.com': [
+                '.article-content',
+                '.entry-content',
+                'article .content',
+            ],
+        }
+        self._default_selectors = [
+            'article',
+            '[role="article"]',
+            '.article-content',
+            '.article-body',
+            '.post-content',
+            '.entry-content',
+            'main',
+            '[role="main"]',
+            '.content',
+        ]
+        self._selectors_by_domain = {
+            domain: selectors + self._default_selectors
+            for domain, selectors in site_selectors.items()
+        }
+
+        # Hero image download limits (bytes)
+        self.max_image_bytes = 8_000_000  # Skip larger hero images
+        self.max_image_bytes_in_flight = 64_000_000  # Across concurrent streamed (HTTP path) downloads
+        self._image_bytes_in_flight = 0
+
         # Performance settings
-        self.load_wait_time = 2.0  # Seconds to wait after page load
+        self.ready_timeout = 3000  # Max ms to wait for article markup after load
         self.interaction_delay = 0.3
 
+        # Known ad/tracking domains, matched against the host only (a path or
+        # slug like /advertising-agency-office/ must not be blocked)
+        blocked_domains = [
+            'google-analytics', 'googletagmanager', 'googlesyndication',
+            'doubleclick', 'facebook.com', 'facebook.net',
+            'twitter.com', 'amazon-adsystem', 'adsystem',
+            'adservice', 'advertising', 'analytics',
+            'hotjar', 'mixpanel', 'segment.io',
+            'optimizely', 'crazyegg', 'mouseflow',
+        ]
+        self._blocked_domain_re = re.compile(
+            r'https?://[^/]*(?:' + '|'.join(map(re.escape, blocked_domains)) + ')',
+            re.IGNORECASE
+        )
+
+        # Resource types never loaded. Images are extracted from their URLs
+        # only; the hero download fetches its one URL separately.
+        self._blocked_types = frozenset({'image', 'media', 'font', 'websocket', 'manifest'})
+
+        # Content cleanup patterns, compiled once (junk phrases fused into one pass)
+        junk_patterns = [
+            r'cookie\s*(policy|consent|notice)',
+            r'privacy\s*policy',
+            r'terms\s*(of|and)\s*(use|service)',
+            r'newsletter\s*sign\s*up',
+            r'follow\s*us\s*on',
+            r'share\s*(this|on)',
+            r'advertisement',
+            r'sponsored\s*content',
+        ]
+        self._junk_re = re.compile('|'.join(f'(?:{p})' for p in junk_patterns), re.IGNORECASE)
+        # Cheap pre-check: the leading word of every junk pattern
+        self._junk_probe = re.compile(
+            r'cookie|privacy|terms|newsletter|follow|share|advertisement|sponsored',
+            re.IGNORECASE
+        )
+        self._blank_lines_re = re.compile(r'\n\s*\n+')
+        self._spaces_re = re.compile(r'[ \t]+')
+
+        # Regex cleanup of long articles runs here, off the event loop
+        self._cleaner_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="content-clean")
+
         # Statistics tracking
         self.stats = {
             "total_scraped": 0,
@@ -105,6 +523,11 @@ class ArticleScraper:
         logger.info(f"   Browser pool size: {self.browser_pool_size}")
         logger.info(f"   Browserless: {'✓ ' + self._get_endpoint_display() if self.browserless_endpoint else '✗ Local mode'}")
 
+    @staticmethod
+    def _get_domain(url: str) -> str:
+        """Lowercased host without a leading 'www.' (key for per-site settings)."""
+        return urlparse(url).netloc.lower().removeprefix('www.')
+
     def _get_endpoint_display(self) -> str:
         """Get safe display string for endpoint (hide sensitive parts)."""
         if not self.browserless_endpoint:
@@ -128,29 +551,38 @@ class ArticleScraper:
             logger.info("🚀 Initializing browser pool...")
             self.playwright = await async_playwright().start()
 
+            self.browser = await self._create_browser("browser")
+            if not self.browser:
+                raise RuntimeError("Failed to initialize browser")
+
             for i in range(self.browser_pool_size):
                 try:
-                    browser = await self._create_browser(f"browser-{i}")
-                    if browser:
-                        self.browser_pool.append(browser)
-                        context = await self._create_context(browser)
-                        self.browser_contexts.append(context)
-
-                        # Create a persistent page for this context
-                        # This keeps the browser alive (Browserless won't close it)
-                        page = await context.new_page()
-                        await self._configure_page(page)
-                        self.browser_pages.append(page)
-
-                        logger.info(f"   ✅ Browser {i + 1}/{self.browser_pool_size} ready with persistent page")
+                    index = len(self.browser_contexts)
+                    context = await self._create_context(self.browser, index)
+
+                    # Pre-create warm pages for this context
+                    # Open pages also keep the browser alive (Browserless won't close it)
+                    pages = await self._create_pages(context)
+                    self.browser_contexts.append(context)
+                    self.browser_pages.append(pages)
+
+                    page_pool = asyncio.Queue()
+                    for page in pages:
+                        page_pool.put_nowait(page)
+                    self.page_pools.append(page_pool)
+
+                    warm = f", {len(self.warm_domains[index])} warm sites" if self.warm_domains[index] else ""
+                    logger.info(f"   ✅ Context {i + 1}/{self.browser_pool_size} ready with {len(pages)} warm pages{warm}")
                 except Exception as e:
-                    logger.error(f"   ❌ Browser {i + 1} failed: {e}")
+                    logger.error(f"   ❌ Context {i + 1} failed: {e}")
+                    # Keep warm_domains aligned with browser_contexts
+                    del self.warm_domains[len(self.browser_contexts):]
 
-            if self.browser_pool:
+            if self.browser_contexts:
                 self.session_active = True
-                logger.info(f"🎯 Browser pool ready: {len(self.browser_pool)}/{self.browser_pool_size}")
+                logger.info(f"🎯 Browser pool ready: {len(self.browser_contexts)}/{self.browser_pool_size} contexts")
             else:
-                raise RuntimeError("Failed to initialize any browsers")
+                raise RuntimeError("Failed to initialize any browser contexts")
 
     async def _create_browser(self, browser_id: str) -> Optional[Browser]:
         """Create a single browser connection."""
@@ -186,63 +618,176 @@ class ArticleScraper:
             logger.error(f"   ❌ Failed to create {browser_id}: {e}")
             return None
 
-    async def _create_context(self, browser: Browser) -> BrowserContext:
-        """Create browser context with optimized settings."""
+    async def _create_context(self, browser: Browser, index: int) -> BrowserContext:
+        """
+        Create browser context with optimized settings.
+
+        Loads the context's saved storage state (cookies from earlier runs) and
+        the sites whose overlays it already dismissed into warm_domains[index].
+        A cookie alone does not mean consent was recorded (session and
+        pre-consent cookies are set on first visit), so warm sites are only
+        those where _dismiss_overlays actually clicked something.
+        """
+        storage_state = self._load_storage_state(index)
+
         context = await browser.new_context(
             viewport={"width": 1280, "height": 800},
-            user_agent=(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
+            user_agent=self.user_agent,
             java_script_enabled=True,
             ignore_https_errors=True,
+            storage_state=storage_state,
         )
+        await self._configure_context(context)
+
+        warm = self._load_warm_domains(index) if storage_state else set()
+        if index < len(self.warm_domains):
+            # Replacement context: keep sites dismissed earlier in this run
+            self.warm_domains[index] |= warm
+        else:
+            self.warm_domains.append(warm)
+
         return context
 
+    def _storage_state_path(self, index: int) -> str:
+        """File holding a context's saved cookies and localStorage."""
+        return os.path.join(self.state_dir, f"state_{index}.json")
+
+    def _load_storage_state(self, index: int) -> Optional[Dict]:
+        """Saved storage state for a context, or None (first run / unreadable file)."""
+        path = self._storage_state_path(index)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"   ⚠️ Ignoring saved browser state {path}: {e}")
+            return None
+
+    def _warm_domains_path(self, index: int) -> str:
+        """File listing the sites whose overlays a context has dismissed."""
+        return os.path.join(self.state_dir, f"warm_{index}.json")
+
+    def _load_warm_domains(self, index: int) -> set:
+        """Saved warm sites for a context (empty on first run / unreadable file)."""
+        path = self._warm_domains_path(index)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"   ⚠️ Ignoring saved warm sites {path}: {e}")
+            return set()
+
+    async def _save_storage_states(self):
+        """Persist each context's cookies, localStorage and warm sites for the next run."""
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"   ⚠️ Cannot save browser state: {e}")
+            return
+
+        results = await asyncio.gather(
+            *(
+                context.storage_state(path=self._storage_state_path(index))
+                for index, context in enumerate(self.browser_contexts)
+            ),
+            return_exceptions=True
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.warning(f"   ⚠️ Failed to save state for context {index}: {result}")
+                continue
+            try:
+                with open(self._warm_domains_path(index), "w", encoding="utf-8") as f:
+                    json.dump(sorted(self.warm_domains[index]), f)
+            except OSError as e:
+                logger.warning(f"   ⚠️ Failed to save warm sites for context {index}: {e}")
+
+    async def _create_pages(self, context: BrowserContext) -> List[Page]:
+        """Open pages_per_context pages in a context (configured via the context)."""
+        return [await context.new_page() for _ in range(self.pages_per_context)]
+
+    async def _acquire_page(self, index: int) -> Page:
+        """Take an idle warm page from a context's pool (waits if all are busy)."""
+        return await self.page_pools[index].get()
+
+    async def _release_page(self, index: int, page: Page):
+        """Reset a page and return it to its pool (dropped if its context was replaced)."""
+        if page.context is not self.browser_contexts[index]:
+            return
+
+        try:
+            # Unload the article so the idle page holds no DOM or timers
+            await page.goto("about:blank")
+        except Exception:
+            pass
+
+        self.page_pools[index].put_nowait(page)
+
+    async def _ensure_browser(self) -> Optional[Browser]:
+        """Return the shared browser, relaunching it if the connection dropped."""
+        async with self._browser_lock:
+            if self.browser and self.browser.is_connected():
+                return self.browser
+
+            if self.browser:
+                try:
+                    await self.browser.close()
+                except Exception as e:
+                    logger.debug(f"Browser close failed: {e}")
+
+            self.browser = await self._create_browser("browser")
+            return self.browser
+
     async def _reconnect_browser(self, index: int) -> bool:
-        """Reconnect a failed browser in the pool."""
+        """Replace a failed context in the pool (relaunching the browser if it died)."""
+        # Take idle pages out of the pool (checked-out ones are discarded on release)
+        page_pool = self.page_pools[index]
+        idle_pages = []
+        while not page_pool.empty():
+            idle_pages.append(page_pool.get_nowait())
+
         try:
-            logger.info(f"🔄 Reconnecting browser-{index}...")
+            logger.info(f"🔄 Reconnecting context-{index}...")
 
-            # Close old page if exists
-            if index < len(self.browser_pages) and self.browser_pages[index]:
+            # Close old pages if they exist
+            for page in self.browser_pages[index]:
                 try:
-                    await self.browser_pages[index].close()
-                except:
-                    pass
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Page close failed: {e}")
 
             # Close old context if exists
             if index < len(self.browser_contexts) and self.browser_contexts[index]:
                 try:
                     await self.browser_contexts[index].close()
-                except:
-                    pass
-
-            # Close old browser if exists
-            if index < len(self.browser_pool) and self.browser_pool[index]:
-                try:
-                    await self.browser_pool[index].close()
-                except:
-                    pass
+                except Exception as e:
+                    logger.debug(f"Context close failed: {e}")
 
-            # Create new browser, context, and page
-            browser = await self._create_browser(f"browser-{index}")
+            # Create new context and pages (on a new browser if the old one is gone)
+            browser = await self._ensure_browser()
             if browser:
-                context = await self._create_context(browser)
-                page = await context.new_page()
-                await self._configure_page(page)
+                context = await self._create_context(browser, index)
+                pages = await self._create_pages(context)
 
-                self.browser_pool[index] = browser
                 self.browser_contexts[index] = context
-                self.browser_pages[index] = page
+                self.browser_pages[index] = pages
 
-                logger.info(f"   ✅ Browser-{index} reconnected with new page")
+                # Same queue object, so tasks already waiting on it get the new pages
+                for page in pages:
+                    page_pool.put_nowait(page)
+
+                logger.info(f"   ✅ Context-{index} reconnected with {len(pages)} new pages")
                 return True
-            return False
         except Exception as e:
             logger.error(f"   ❌ Reconnection failed: {e}")
-            return False
+
+        # Put the dead pages back so waiting tasks fail fast instead of hanging
+        for page in idle_pages:
+            page_pool.put_nowait(page)
+        return False
 
     # =========================================================================
     # Main Scraping Methods
@@ -265,61 +810,96 @@ class ArticleScraper:
         logger.info(f"🔍 Scraping {len(articles)} articles...")
         start_time = time.time()
 
-        # Initialize browser pool
-        await self._initialize_browser_pool()
+        results: List[Optional[Dict]] = [None] * len(articles)
 
-        # Process articles sequentially per browser to avoid race conditions
-        # Each browser processes its share of articles one at a time
-        scraped_articles = []
-
-        # Distribute articles across browsers
-        articles_per_browser: List[List[tuple]] = [[] for _ in range(len(self.browser_pool))]
+        # Scrape each canonical URL once (feeds repeat links with tracking
+        # params / fragments); duplicates get a copy of the first result
+        first_index: Dict[str, int] = {}
+        duplicate_of: Dict[int, int] = {}
         for i, article in enumerate(articles):
-            browser_index = i % len(self.browser_pool)
-            articles_per_browser[browser_index].append((i, article))
-
-        # Create tasks - one per browser, each processing its articles sequentially
-        async def process_browser_queue(browser_index: int, article_queue: List[tuple]) -> List[tuple]:
-            results = []
-            for original_index, article in article_queue:
-                result = await self._scrape_single_article(article, browser_index)
-                results.append((original_index, result))
-            return results
-
-        tasks = [
-            process_browser_queue(browser_idx, queue)
-            for browser_idx, queue in enumerate(articles_per_browser)
+            key = canonicalize_url(article.get("link", ""))
+            if key and key in first_index:
+                duplicate_of[i] = first_index[key]
+            elif key:
+                first_index[key] = i
+
+        unique_items = [(i, article) for i, article in enumerate(articles) if i not in duplicate_of]
+        if duplicate_of:
+            logger.info(f"🔁 Skipping {len(duplicate_of)} duplicate URLs")
+
+        # HTTP fast path for sites that don't need JavaScript
+        http_items = [
+            (i, article) for i, article in unique_items
+            if self._get_domain(article.get("link", "")) in self.http_domains
         ]
+        if http_items:
+            logger.info(f"⚡ Trying plain HTTP for {len(http_items)} articles...")
+            outcomes = await asyncio.gather(
+                *(self._scrape_http(article) for _, article in http_items),
+                return_exceptions=True
+            )
+            for (i, _), outcome in zip(http_items, outcomes):
+                if isinstance(outcome, dict):
+                    results[i] = outcome
 
-        # Execute all browser tasks in parallel
-        all_results = await asyncio.gather(*tasks, return_exceptions=True)
+        browser_items = [(i, article) for i, article in unique_items if results[i] is None]
+        completed = len(unique_items) - len(browser_items)
 
-        # Flatten and sort results by original index
-        indexed_results = []
-        for browser_results in all_results:
-            if isinstance(browser_results, Exception):
-                logger.error(f"❌ Browser task failed: {browser_results}")
-                continue
-            indexed_results.extend(browser_results)
-
-        # Sort by original index and extract results
-        indexed_results.sort(key=lambda x: x[0])
-        scraped_articles = [result for _, result in indexed_results]
-
-        # Handle any missing articles (from failed browser tasks)
-        if len(scraped_articles) < len(articles):
-            scraped_set = {a.get("link") for a in scraped_articles}
-            for article in articles:
-                if article.get("link") not in scraped_set:
-                    article_copy = article.copy()
-                    article_copy.update({
-                        "full_content": "",
-                        "images": [],
-                        "hero_image": None,
-                        "scrape_success": False,
-                        "scrape_error": "Browser task failed"
-                    })
-                    scraped_articles.append(article_copy)
+        async def worker(browser_index: int, shards: List[deque]):
+            nonlocal completed
+            while True:
+                item = self._next_work_item(browser_index, shards)
+                if item is None:
+                    return
+                original_index, article = item
+
+                try:
+                    results[original_index] = await self._scrape_single_article(article, browser_index)
+                except Exception as e:
+                    logger.error(f"❌ Worker on context-{browser_index} failed: {e}")
+
+                completed += 1
+                logger.info(f"   📊 Progress: {completed}/{len(unique_items)}")
+
+        if browser_items:
+            # Initialize browser pool (only when some articles need a browser)
+            await self._initialize_browser_pool()
+
+            # One work shard per context: articles from the same site go to the
+            # same context (warm cookies, TLS sessions, DNS), and each worker
+            # holds one warm page's worth of capacity on a fixed context
+            shards: List[deque] = [deque() for _ in self.browser_contexts]
+            for item in browser_items:
+                domain = self._get_domain(item[1].get("link", ""))
+                shards[self._context_index(domain)].append(item)
+
+            worker_count = len(self.browser_contexts) * self.pages_per_context
+            await asyncio.gather(*(worker(i % len(self.browser_contexts), shards) for i in range(worker_count)))
+
+        # Fan scraped fields back out to duplicate articles
+        for i, original in duplicate_of.items():
+            if results[original] is not None:
+                result = articles[i].copy()
+                result.update({
+                    field: results[original][field]
+                    for field in SCRAPE_RESULT_FIELDS
+                    if field in results[original]
+                })
+                results[i] = result
+
+        # Handle any missing articles (from failed workers)
+        scraped_articles = []
+        for article, result in zip(articles, results):
+            if result is None:
+                result = article
+                result.update(
+                    full_content="",
+                    images=[],
+                    hero_image=None,
+                    scrape_success=False,
+                    scrape_error="Browser task failed"
+                )
+            scraped_articles.append(result)
 
         # Update statistics
         total_time = time.time() - start_time
@@ -335,108 +915,144 @@ class ArticleScraper:
 
         return scraped_articles
 
+    def _context_index(self, domain: str) -> int:
+        """Context that owns a domain (stable across runs, unlike hash())."""
+        return zlib.crc32(domain.encode('utf-8')) % len(self.browser_contexts)
+
+    @staticmethod
+    def _next_work_item(browser_index: int, shards: List[deque]) -> Optional[tuple]:
+        """
+        Next article for a worker: from its own context's shard, or stolen from
+        the longest other shard once its own is empty (so one busy site never
+        leaves the other contexts idle).
+        """
+        own = shards[browser_index]
+        if own:
+            return own.popleft()
+
+        busiest = max(shards, key=len)
+        if busiest:
+            # Take from the tail; the owner keeps working through the head
+            return busiest.pop()
+        return None
+
     async def _scrape_single_article(self, article: Dict, browser_index: int) -> Dict:
         """
-        Scrape a single article URL using page reuse.
+        Scrape a single article URL on a warm page from the pool.
 
         Args:
             article: Article dict with 'link' key
             browser_index: Which browser from pool to use
 
         Returns:
-            Article dict with scraped content added
+            The same article dict, updated in place with the scraped fields
         """
         url = article.get("link", "")
         if not url:
-            article["scrape_success"] = False
-            article["scrape_error"] = "No URL provided"
+            article.update(scrape_success=False, scrape_error="No URL provided")
             return article
 
         start_time = time.time()
-        result = article.copy()
 
         # Get browser from pool
-        if browser_index >= len(self.browser_pool):
+        if browser_index >= len(self.browser_contexts):
             browser_index = 0
 
-        # Get the persistent page for this browser
-        page = self.browser_pages[browser_index]
+        # Take a warm page from this browser's pool
+        page = await self._acquire_page(browser_index)
+        hero_download: Optional[asyncio.Task] = None
 
         try:
             logger.info(f"🌐 Scraping: {url[:60]}...")
 
             # Get timeout for this domain
-            domain = urlparse(url).netloc.lower()
-            timeout = self.domain_timeouts.get(
-                domain.replace('www.', ''), 
-                self.default_timeout
-            )
-
-            # Navigate to page (reuse existing page instead of creating new one)
-            await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-            await asyncio.sleep(self.load_wait_time)
+            domain = self._get_domain(url)
+            timeout = self.domain_timeouts.get(domain, self.default_timeout)
 
-            # Dismiss popups/overlays
-            await self._dismiss_overlays(page)
+            # Navigate to page; control returns at the first response byte
+            await page.goto(url, wait_until="commit", timeout=timeout)
 
             # Check if article already has hero_image with bytes (from custom scraper)
             # If so, preserve it and skip extraction
             existing_hero = article.get("hero_image")
-            if existing_hero and existing_hero.get("bytes"):
+            preserve_hero = bool(existing_hero and existing_hero.get("bytes"))
+
+            early_hero = None
+            if not preserve_hero:
+                # og:image is in <head>, which arrives first: start the hero
+                # download (for R2 storage) while the body is still loading
+                early_hero = await self._extract_early_hero(page, url, timeout)
+                if early_hero:
+                    hero_download = asyncio.create_task(
+                        self._download_hero_image_via_request(early_hero, page)
+                    )
+
+            await self._wait_for_content(page, timeout)
+
+            # Dismiss popups/overlays (skipped once this context has dismissed
+            # them for the site, so saved cookies carry the choice)
+            if domain not in self.warm_domains[browser_index]:
+                if await self._dismiss_overlays(page):
+                    self.warm_domains[browser_index].add(domain)
+
+            # Hero image, content and images in one round-trip
+            extracted = await self._extract_all(page, url, domain)
+            content = extracted["content"]
+            images = extracted["images"]
+
+            if preserve_hero:
                 hero_image = existing_hero
                 logger.info(f"   Preserving existing hero image from custom scraper")
             else:
-                # Extract hero image (og:image) - do this FIRST before any DOM manipulation
-                hero_image = await self._extract_hero_image(page, url)
+                hero_image = early_hero or extracted["hero"]
 
                 # Download hero image bytes for R2 storage
-                if hero_image and hero_image.get("url"):
+                if hero_download:
+                    image_bytes = await hero_download
+                elif hero_image and hero_image.get("url"):
                     image_bytes = await self._download_hero_image_via_request(hero_image, page)
-                    if image_bytes:
-                        hero_image["bytes"] = image_bytes
-                        logger.info(f"   Hero image bytes downloaded: {len(image_bytes)} bytes")
-
-            # Extract content
-            content = await self._extract_article_content(page, url)
+                else:
+                    image_bytes = None
 
-            # Extract all images (for reference)
-            images = await self._extract_images(page, url)
+                if image_bytes:
+                    hero_image["bytes"] = image_bytes
+                    logger.info(f"   Hero image bytes downloaded: {len(image_bytes)} bytes")
 
-            if content and len(content.strip()) > 100:
+            if content and len(content.strip()) > MIN_CONTENT_CHARS:
                 processing_time = time.time() - start_time
 
-                result.update({
-                    "full_content": content,
-                    "images": images,
-                    "image_count": len(images),
-                    "hero_image": hero_image,
-                    "scrape_success": True,
-                    "scrape_time": processing_time,
-                    "content_length": len(content),
-                })
+                article.update(
+                    full_content=content,
+                    images=images,
+                    image_count=len(images),
+                    hero_image=hero_image,
+                    scrape_success=True,
+                    scrape_time=processing_time,
+                    content_length=len(content),
+                )
 
                 if hero_image:
                     self.stats["hero_images_found"] += 1
 
                 logger.info(f"   ✅ Success: {len(content)} chars, {len(images)} images, hero: {'✓' if hero_image else '✗'} in {processing_time:.1f}s")
             else:
-                result.update({
-                    "full_content": "",
-                    "images": [],
-                    "hero_image": hero_image,  # Still save hero image even if content extraction failed
-                    "scrape_success": False,
-                    "scrape_error": "Content too short or empty"
-                })
+                article.update(
+                    full_content="",
+                    images=[],
+                    hero_image=hero_image,  # Still save hero image even if content extraction failed
+                    scrape_success=False,
+                    scrape_error="Content too short or empty"
+                )
                 logger.warning(f"   ⚠️ Low content: {url[:40]}...")
 
         except PlaywrightTimeoutError:
-            result.update({
-                "full_content": "",
-                "images": [],
-                "hero_image": None,
-                "scrape_success": False,
-                "scrape_error": "Timeout"
-            })
+            article.update(
+                full_content="",
+                images=[],
+                hero_image=None,
+                scrape_success=False,
+                scrape_error="Timeout"
+            )
             logger.warning(f"   ⏱️ Timeout: {url[:40]}...")
 
         except Exception as e:
@@ -445,178 +1061,488 @@ class ArticleScraper:
             # Check if browser was closed - attempt reconnection
             if "Browser closed" in error_msg or "Target closed" in error_msg:
                 logger.warning(f"   🔄 Browser closed, attempting reconnection...")
-                reconnected = await self._reconnect_browser(browser_index)
+
+                # Another worker may already have replaced this context
+                if page.context is self.browser_contexts[browser_index]:
+                    reconnected = await self._reconnect_browser(browser_index)
+                else:
+                    reconnected = True
 
                 if reconnected:
-                    # Update page reference and retry once
-                    page = self.browser_pages[browser_index]
+                    # Retry once on a fresh page
+                    retry_page = await self._acquire_page(browser_index)
                     try:
-                        await page.goto(url, wait_until="domcontentloaded", timeout=self.default_timeout)
-                        await asyncio.sleep(self.load_wait_time)
+                        await retry_page.goto(url, wait_until="domcontentloaded", timeout=self.default_timeout)
+                        await self._wait_for_content(retry_page, self.default_timeout)
 
-                        hero_image = await self._extract_hero_image(page, url)
-                        content = await self._extract_article_content(page, url)
-                        images = await self._extract_images(page, url)
+                        extracted = await self._extract_all(retry_page, url, domain)
+                        hero_image = extracted["hero"]
+                        content = extracted["content"]
+                        images = extracted["images"]
 
-                        if content and len(content.strip()) > 100:
+                        if content and len(content.strip()) > MIN_CONTENT_CHARS:
                             processing_time = time.time() - start_time
-                            result.update({
-                                "full_content": content,
-                                "images": images,
-                                "image_count": len(images),
-                                "hero_image": hero_image,
-                                "scrape_success": True,
-                                "scrape_time": processing_time,
-                                "content_length": len(content),
-                            })
+                            article.update(
+                                full_content=content,
+                                images=images,
+                                image_count=len(images),
+                                hero_image=hero_image,
+                                scrape_success=True,
+                                scrape_time=processing_time,
+                                content_length=len(content),
+                            )
                             logger.info(f"   ✅ Retry success after reconnection")
-                            return result
+                            return article
                     except Exception as retry_error:
                         logger.error(f"   ❌ Retry failed: {retry_error}")
-
-            result.update({
-                "full_content": "",
-                "images": [],
-                "hero_image": None,
-                "scrape_success": False,
-                "scrape_error": error_msg
-            })
+                    finally:
+                        await self._release_page(browser_index, retry_page)
+
+            article.update(
+                full_content="",
+                images=[],
+                hero_image=None,
+                scrape_success=False,
+                scrape_error=error_msg
+            )
             logger.error(f"   ❌ Error: {error_msg[:50]}")
 
-        return result
+        finally:
+            if hero_download and not hero_download.done():
+                hero_download.cancel()
+            await self._release_page(browser_index, page)
 
-    async def _download_hero_image_via_request(self, hero_image: Dict, page: Page) -> Optional[bytes]:
+        return article
+
+    # =========================================================================
+    # HTTP Fast Path
+    # =========================================================================
+
+    async def _scrape_http(self, article: Dict) -> Optional[Dict]:
         """
-        Download hero image bytes using page.request (no new page needed).
+        Scrape an article from its raw HTML, without a browser.
 
         Args:
-            hero_image: Dict with 'url' key
-            page: Current page to use for request context
+            article: Article dict with 'link' key
 
         Returns:
-            Image bytes or None if failed
+            The same article dict, updated in place with the scraped fields, or
+            None (article left untouched) if the page could not be fetched or
+            yielded too little content (use the browser)
         """
-        if not hero_image or not hero_image.get('url'):
+        url = article.get("link", "")
+        start_time = time.time()
+
+        try:
+            session = get_http_session()
+            headers = {
+                "User-Agent": self.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    logger.info(f"   ↪️ HTTP {response.status}, using browser: {url[:60]}")
+                    return None
+                html = await response.text(errors="replace")
+        except Exception as e:
+            logger.info(f"   ↪️ HTTP fetch failed ({e}), using browser: {url[:60]}")
             return None
 
-        url = hero_image['url']
+        # Parsing is CPU-bound; keep it off the event loop
+        extracted = await asyncio.to_thread(self._parse_article_html, html, url)
+        content = extracted["content"]
+
+        if not content or len(content.strip()) <= MIN_CONTENT_CHARS:
+            logger.info(f"   ↪️ Thin HTML content, using browser: {url[:60]}")
+            return None
+
+        images = extracted["images"]
+        self.stats["images_extracted"] += len(images)
+
+        existing_hero = article.get("hero_image")
+        if existing_hero and existing_hero.get("bytes"):
+            hero_image = existing_hero
+        else:
+            hero_image = extracted["hero"]
+            if hero_image:
+                image_bytes = await self._download_image_http(hero_image["url"])
+                if image_bytes:
+                    hero_image["bytes"] = image_bytes
+
+        if hero_image:
+            self.stats["hero_images_found"] += 1
+
+        processing_time = time.time() - start_time
+        article.update(
+            full_content=content,
+            images=images,
+            image_count=len(images),
+            hero_image=hero_image,
+            scrape_success=True,
+            scrape_time=processing_time,
+            content_length=len(content),
+        )
+
+        logger.info(f"   ⚡ HTTP success: {len(content)} chars, {len(images)} images, hero: {'✓' if hero_image else '✗'} in {processing_time:.1f}s")
+        return article
+
+    def _parse_article_html(self, html: str, url: str) -> Dict[str, Any]:
+        """
+        Extract hero image, content and images from raw HTML.
+
+        Mirrors the in-page scripts, except that image sizes come from
+        width/height attributes and there is no whole-body fallback.
 
+        Returns:
+            Dict with 'hero', 'content' and 'images'
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Hero image: og:image, twitter:image, schema.org, image_src
+        hero = None
+        hero_sources = [
+            ('og:image', soup.select_one('meta[property="og:image"]'), 'content'),
+            ('twitter:image', soup.select_one('meta[name="twitter:image"], meta[property="twitter:image"]'), 'content'),
+            ('schema.org', soup.select_one('meta[itemprop="image"]'), 'content'),
+            ('link:image_src', soup.select_one('link[rel="image_src"]'), 'href'),
+        ]
+        for source, tag, attr in hero_sources:
+            if tag and tag.get(attr):
+                hero = {"url": urljoin(url, tag[attr]), "width": None, "height": None, "alt": "", "source": source}
+                if source == 'og:image':
+                    width = soup.select_one('meta[property="og:image:width"]')
+                    height = soup.select_one('meta[property="og:image:height"]')
+                    alt = soup.select_one('meta[property="og:image:alt"]')
+                    hero["width"] = _int_attr(width, 'content')
+                    hero["height"] = _int_attr(height, 'content')
+                    hero["alt"] = alt.get('content', '') if alt else ''
+                break
+
+        # Images (before content cleanup removes any containers)
+        images = []
+        seen = set()
+        for img in soup.select('article img, .article-content img, .gallery img, main img, .post-content img, .entry-content img'):
+            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src') or ''
+            if not src or src in seen:
+                continue
+            # Same rule as IMAGES_JS: images with no known size are kept
+            width = _int_attr(img, 'width') or 0
+            height = _int_attr(img, 'height') or 0
+            if (width and width < 200) or (height and height < 150):
+                continue
+            src_lower = src.lower()
+            if any(word in src_lower for word in ('logo', 'icon', 'avatar', 'advertisement', 'banner', 'placeholder')):
+                continue
+            seen.add(src)
+            images.append({"url": urljoin(url, src), "alt": img.get('alt', ''), "width": width, "height": height, "area": width * height})
+            if len(images) == 10:
+                break
+
+        # Content: first selector with enough text
+        content = ""
+        remove_selector = (
+            'script, style, nav, header, footer, aside, .ad, .ads, .advertisement, '
+            '.social-share, .related-posts, .comments, .newsletter, .sidebar, '
+            '[role="complementary"], .breadcrumb, .pagination, .author-bio'
+        )
+        for selector in self._content_selectors(self._get_domain(url)):
+            element = soup.select_one(selector)
+            if element is None:
+                continue
+            for junk in element.select(remove_selector):
+                junk.decompose()
+            text = element.get_text('\n', strip=True)
+            if len(text) > 200:
+                content = self._clean_content(text)
+                break
+
+        return {"hero": hero, "content": content, "images": images}
+
+    async def _download_image_http(self, url: str) -> Optional[bytes]:
+        """Download image bytes over the shared HTTP session."""
         try:
-            # Use the page's request context to fetch the image
-            # This avoids creating a new page which could cause browser closure
-            response = await page.request.get(url, timeout=15000)
+            session = get_http_session()
+            async with session.get(url, headers={"User-Agent": self.user_agent}) as response:
+                if response.status != 200:
+                    logger.warning(f"   ⚠️ Failed to download hero image: HTTP {response.status}")
+                    return None
+
+                reserved = self._reserve_image_bytes(response.headers, url)
+                if reserved is None:
+                    return None
+                try:
+                    # Bounded read: servers without Content-Length can't exceed the cap
+                    chunks = []
+                    size = 0
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        size += len(chunk)
+                        if size > self.max_image_bytes:
+                            logger.warning(f"   ⚠️ Hero image too large, skipped: {url[:60]}")
+                            return None
+                        chunks.append(chunk)
+                    image_bytes = b"".join(chunks)
+                finally:
+                    self._image_bytes_in_flight -= reserved
 
-            if response.ok:
-                image_bytes = await response.body()
                 logger.info(f"   📥 Downloaded hero image: {len(image_bytes)} bytes")
                 return image_bytes
-            else:
-                logger.warning(f"   ⚠️ Failed to download hero image: HTTP {response.status}")
-                return None
-
         except Exception as e:
             logger.error(f"   ❌ Hero image download error: {e}")
             return None
 
+    def _check_image_headers(self, headers, url: str) -> Optional[int]:
+        """
+        Check an image response's Content-Type and Content-Length.
+
+        Args:
+            headers: Response headers
+            url: Image URL (for logging)
+
+        Returns:
+            Declared length (0 if unknown), or None if the download should be skipped
+        """
+        content_type = headers.get('content-type', '')
+        if content_type and not content_type.startswith('image/'):
+            logger.warning(f"   ⚠️ Hero URL is not an image ({content_type}), skipped: {url[:60]}")
+            return None
+
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            length = 0
+
+        if length > self.max_image_bytes:
+            logger.warning(f"   ⚠️ Hero image too large ({length} bytes), skipped: {url[:60]}")
+            return None
+
+        return length
+
+    def _reserve_image_bytes(self, headers, url: str) -> Optional[int]:
+        """
+        Check an image response's headers and reserve its size in the in-flight budget.
+
+        Only for streamed downloads: call before reading the body. Without a
+        Content-Length the full max_image_bytes is reserved (the bounded read
+        never exceeds it).
+
+        Args:
+            headers: Response headers (Content-Type / Content-Length)
+            url: Image URL (for logging)
+
+        Returns:
+            Bytes reserved (release by subtracting from _image_bytes_in_flight),
+            or None if the download should be skipped
+        """
+        length = self._check_image_headers(headers, url)
+        if length is None:
+            return None
+        length = length or self.max_image_bytes
+
+        if self._image_bytes_in_flight + length > self.max_image_bytes_in_flight:
+            logger.warning(f"   ⚠️ Too many image bytes in flight, skipped: {url[:60]}")
+            return None
+
+        self._image_bytes_in_flight += length
+        return length
+
+    async def _download_hero_image_via_request(self, hero_image: Dict, page: Page) -> Optional[bytes]:
+        """
+        Download hero image bytes over the page's browser context.
+
+        Args:
+            hero_image: Dict with 'url' key
+            page: Current page (its context's request client is used)
+
+        Returns:
+            Image bytes or None if failed
+        """
+        return await self.download_hero_image(hero_image, page.context)
+
     # =========================================================================
     # Page Configuration & Optimization
     # =========================================================================
 
-    async def _configure_page(self, page: Page):
-        """Configure page with optimizations and ad blocking."""
+    async def _configure_context(self, context: BrowserContext):
+        """
+        Configure a context with headers, helper scripts and ad blocking.
+
+        Everything is registered once on the context and inherited by all of
+        its pages, so opening a page costs a single CDP call.
+        """
         try:
             # Set headers
-            await page.set_extra_http_headers({
+            await context.set_extra_http_headers({
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.9",
                 "Cache-Control": "no-cache",
             })
 
-            # Block unnecessary resources
-            await page.route("**/*", self._block_resources)
-
-            # Inject helper scripts
-            await page.add_init_script("""
-                // Disable animations for faster rendering
-                document.addEventListener('DOMContentLoaded', () => {
-                    const style = document.createElement('style');
-                    style.textContent = `
-                        *, *::before, *::after {
-                            animation: none !important;
-                            transition: none !important;
-                        }
-                    `;
-                    document.head.appendChild(style);
-                });
-
-                // Block popups
-                window.alert = window.confirm = window.prompt = () => {};
-                window.open = () => null;
-            """)
+            # Inject helper scripts and the extraction functions
+            await context.add_init_script(PAGE_INIT_JS)
+            await context.add_init_script(SCRIPTS_INIT_JS)
 
         except Exception as e:
-            logger.warning(f"Page config warning: {e}")
+            logger.warning(f"Context config warning: {e}")
+
+        # Block unnecessary resources
+        await context.route("**/*", self._block_resources)
+
+    async def _extract_early_hero(self, page: Page, url: str, timeout: int) -> Optional[Dict]:
+        """
+        Extract the hero image as soon as <head> is parsed (before the body loads).
+
+        Returns:
+            Hero image dict, or None if the page has none or <head> is late
+        """
+        try:
+            # <body> being attached means all <head> meta tags are in the DOM
+            await page.wait_for_selector("body", state="attached", timeout=min(timeout, 5000))
+        except PlaywrightTimeoutError:
+            return None
+        return await self._extract_hero_image(page, url)
+
+    async def _wait_for_content(self, page: Page, timeout: int):
+        """
+        Wait until the document is parsed and article markup is present.
+
+        Raises:
+            PlaywrightTimeoutError: If DOMContentLoaded does not fire within timeout
+        """
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+
+        try:
+            # Client-rendered sites add the article after DOMContentLoaded
+            await page.wait_for_selector(
+                "article, main",
+                state="attached",
+                timeout=self.ready_timeout
+            )
+        except PlaywrightTimeoutError:
+            # Unusual markup - extract whatever has rendered so far
+            pass
 
     async def _block_resources(self, route):
         """Block ads, trackers, and unnecessary resources."""
         request = route.request
-        resource_type = request.resource_type
-        url = request.url.lower()
 
-        # Block by resource type (keep images for extraction)
-        blocked_types = ['media', 'font', 'websocket', 'manifest']
-        if resource_type in blocked_types:
+        # Block by resource type
+        if request.resource_type in self._blocked_types:
             await route.abort()
             return
 
-        # Block known ad/tracking domains
-        blocked_domains = [
-            'google-analytics', 'googletagmanager', 'googlesyndication',
-            'doubleclick', 'facebook.com', 'facebook.net',
-            'twitter.com', 'amazon-adsystem', 'adsystem',
-            'adservice', 'advertising', 'analytics',
-            'hotjar', 'mixpanel', 'segment.io',
-            'optimizely', 'crazyegg', 'mouseflow',
-        ]
-
-        if any(domain in url for domain in blocked_domains):
+        # Block known ad/tracking hosts (case-insensitive regex, no lowercased copy)
+        if self._blocked_domain_re.match(request.url):
             await route.abort()
             return
 
         # Allow everything else
         await route.continue_()
 
-    async def _dismiss_overlays(self, page: Page):
-        """Dismiss cookie banners, popups, and overlays."""
-        dismiss_selectors = [
+    async def _run_script(self, page: Page, name: str, arg: Any) -> Any:
+        """
+        Call one of the PAGE_SCRIPTS in the page.
+
+        Uses the copy installed by the context init script; if the page does
+        not have it (init script failed), sends the full function instead.
+        """
+        found = await page.evaluate(
+            f"(arg) => window.__adu ? {{value: window.__adu.{name}(arg)}} : null",
+            arg
+        )
+        if found is not None:
+            return found.get("value")
+        return await page.evaluate(PAGE_SCRIPTS[name], arg)
+
+    async def _dismiss_overlays(self, page: Page) -> bool:
+        """
+        Dismiss cookie banners, popups, and overlays (one in-page call).
+
+        Returns:
+            True if something was clicked
+        """
+        # (kind, value): CSS selector, or case-insensitive button text
+        dismiss_targets = [
             # Cookie consent
-            'button[id*="cookie"]',
-            'button[class*="cookie"]',
-            'button[id*="consent"]',
-            'button[class*="consent"]',
-            '[class*="cookie"] button',
-            '[class*="gdpr"] button',
+            ('css', 'button[id*="cookie"]'),
+            ('css', 'button[class*="cookie"]'),
+            ('css', 'button[id*="consent"]'),
+            ('css', 'button[class*="consent"]'),
+            ('css', '[class*="cookie"] button'),
+            ('css', '[class*="gdpr"] button'),
 
             # Generic close/accept buttons
-            'button:has-text("Accept")',
-            'button:has-text("Accept All")',
-            'button:has-text("Got it")',
-            'button:has-text("OK")',
-            'button:has-text("Close")',
-            '[aria-label="Close"]',
-            '.modal-close',
-            '.popup-close',
+            ('text', 'Accept'),
+            ('text', 'Accept All'),
+            ('text', 'Got it'),
+            ('text', 'OK'),
+            ('text', 'Close'),
+            ('css', '[aria-label="Close"]'),
+            ('css', '.modal-close'),
+            ('css', '.popup-close'),
         ]
 
-        for selector in dismiss_selectors:
-            try:
-                element = page.locator(selector).first
-                if await element.is_visible(timeout=500):
-                    await element.click(timeout=1000)
-                    await asyncio.sleep(0.2)
-                    break
-            except:
-                continue
+        try:
+            clicked = await self._run_script(page, "dismiss", dismiss_targets)
+            if clicked:
+                await asyncio.sleep(0.2)
+            return bool(clicked)
+        except Exception:
+            return False
+
+    # =========================================================================
+    # Combined Extraction
+    # =========================================================================
+
+    async def _extract_all(self, page: Page, url: str, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract hero image, content and images in one page.evaluate round-trip.
+
+        Falls back to the individual extractors if the combined script fails.
+        Images are only extracted when the content is long enough to use.
+
+        Args:
+            page: Playwright page object
+            url: Article URL (base for relative paths)
+            domain: Precomputed _get_domain(url), selects site selectors
+
+        Returns:
+            Dict with 'hero' (dict or None), 'content' (cleaned text) and 'images' (list)
+        """
+        try:
+            data = await self._run_script(page, "all", {
+                "baseUrl": url,
+                "selectors": self._content_selectors(domain or self._get_domain(url)),
+                "minContent": MIN_CONTENT_CHARS,
+            })
+        except Exception as e:
+            logger.warning(f"Combined extraction error: {e}")
+            content = await self._extract_article_content(page, url, domain)
+            return {
+                "hero": await self._extract_hero_image(page, url),
+                "content": content,
+                "images": await self._extract_images(page, url) if len(content) > MIN_CONTENT_CHARS else [],
+            }
+
+        hero = data.get("hero")
+        if hero and hero.get("url"):
+            logger.info(f"   🖼️ Hero image found via {hero.get('source', 'unknown')}")
+        else:
+            hero = None
+
+        content = await self._clean_content_async(data["content"]) if data.get("content") else ""
+        if len(content) <= MIN_CONTENT_CHARS:
+            # Failed scrape - cleanup shrank it below the threshold
+            return {"hero": hero, "content": content, "images": []}
+
+        images = data.get("images") or []
+        self.stats["images_extracted"] += len(images)
+
+        return {
+            "hero": hero,
+            "content": content,
+            "images": images,
+        }
 
     # =========================================================================
     # Hero Image Extraction (og:image)
@@ -640,89 +1566,7 @@ class ArticleScraper:
             Dict with 'url', 'width', 'height', 'alt' or None
         """
         try:
-            hero_data = await page.evaluate("""
-                (baseUrl) => {
-                    // Helper to resolve relative URLs
-                    function resolveUrl(url) {
-                        if (!url) return null;
-                        if (url.startsWith('http')) return url;
-                        if (url.startsWith('//')) return 'https:' + url;
-                        try {
-                            return new URL(url, baseUrl).href;
-                        } catch {
-                            return null;
-                        }
-                    }
-
-                    // Try og:image first (most reliable for social sharing)
-                    const ogImage = document.querySelector('meta[property="og:image"]');
-                    if (ogImage) {
-                        const url = resolveUrl(ogImage.content);
-                        if (url) {
-                            // Try to get dimensions from og:image:width/height
-                            const ogWidth = document.querySelector('meta[property="og:image:width"]');
-                            const ogHeight = document.querySelector('meta[property="og:image:height"]');
-                            const ogAlt = document.querySelector('meta[property="og:image:alt"]');
-
-                            return {
-                                url: url,
-                                width: ogWidth ? parseInt(ogWidth.content) : null,
-                                height: ogHeight ? parseInt(ogHeight.content) : null,
-                                alt: ogAlt ? ogAlt.content : '',
-                                source: 'og:image'
-                            };
-                        }
-                    }
-
-                    // Try twitter:image
-                    const twitterImage = document.querySelector('meta[name="twitter:image"]') ||
-                                         document.querySelector('meta[property="twitter:image"]');
-                    if (twitterImage) {
-                        const url = resolveUrl(twitterImage.content);
-                        if (url) {
-                            return {
-                                url: url,
-                                width: null,
-                                height: null,
-                                alt: '',
-                                source: 'twitter:image'
-                            };
-                        }
-                    }
-
-                    // Fallback: try to find schema.org image
-                    const schemaImage = document.querySelector('meta[itemprop="image"]');
-                    if (schemaImage) {
-                        const url = resolveUrl(schemaImage.content);
-                        if (url) {
-                            return {
-                                url: url,
-                                width: null,
-                                height: null,
-                                alt: '',
-                                source: 'schema.org'
-                            };
-                        }
-                    }
-
-                    // Last resort: link rel="image_src"
-                    const linkImage = document.querySelector('link[rel="image_src"]');
-                    if (linkImage) {
-                        const url = resolveUrl(linkImage.href);
-                        if (url) {
-                            return {
-                                url: url,
-                                width: null,
-                                height: null,
-                                alt: '',
-                                source: 'link:image_src'
-                            };
-                        }
-                    }
-
-                    return null;
-                }
-            """, base_url)
+            hero_data = await self._run_script(page, "hero", base_url)
 
             if hero_data and hero_data.get('url'):
                 logger.info(f"   🖼️ Hero image found via {hero_data.get('source', 'unknown')}")
@@ -738,8 +1582,8 @@ class ArticleScraper:
         """
         Download hero image bytes for storage.
 
-        Note: Prefer _download_hero_image_via_request() when you have a page available,
-        as it doesn't create a new page that could trigger browser closure.
+        Uses the context's APIRequestContext: a plain HTTP fetch over the
+        browser's network stack (shares cookies) without opening a page.
 
         Args:
             hero_image: Dict with 'url' key
@@ -754,30 +1598,37 @@ class ArticleScraper:
         url = hero_image['url']
 
         try:
-            # Use provided context or create new one
+            # Use provided context or the first one in the pool
             if context is None:
                 if not self.browser_contexts:
                     logger.warning("No browser context available for image download")
                     return None
                 context = self.browser_contexts[0]
 
-            # Create a new page for downloading
-            page = await context.new_page()
+            response = await context.request.get(url, timeout=15000)
 
+            # The driver holds the body until dispose() (contexts live for the whole run)
             try:
-                # Fetch the image
-                response = await page.goto(url, timeout=15000)
-
-                if response and response.ok:
-                    image_bytes = await response.body()
-                    logger.info(f"   📥 Downloaded hero image: {len(image_bytes)} bytes")
-                    return image_bytes
-                else:
-                    logger.warning(f"   ⚠️ Failed to download hero image: HTTP {response.status if response else 'no response'}")
+                if not response.ok:
+                    logger.warning(f"   ⚠️ Failed to download hero image: HTTP {response.status}")
                     return None
 
+                # get() has already buffered the whole body in the driver, so the
+                # in-flight budget cannot bound it here; the header check only
+                # avoids copying oversized / non-image bodies into Python
+                if self._check_image_headers(response.headers, url) is None:
+                    return None
+                image_bytes = await response.body()
             finally:
-                await page.close()
+                await response.dispose()
+
+            # Servers without Content-Length bypass the header check
+            if len(image_bytes) > self.max_image_bytes:
+                logger.warning(f"   ⚠️ Hero image too large ({len(image_bytes)} bytes), skipped: {url[:60]}")
+                return None
+
+            logger.info(f"   📥 Downloaded hero image: {len(image_bytes)} bytes")
+            return image_bytes
 
         except Exception as e:
             logger.error(f"   ❌ Hero image download error: {e}")
@@ -787,120 +1638,49 @@ class ArticleScraper:
     # Content Extraction
     # =========================================================================
 
-    async def _extract_article_content(self, page: Page, url: str) -> str:
+    def _content_selectors(self, domain: str) -> List[str]:
+        """Content selectors for a domain: site-specific ones first, then generic."""
+        return self._selectors_by_domain.get(domain, self._default_selectors)
+
+    async def _extract_article_content(self, page: Page, url: str, domain: Optional[str] = None) -> str:
         """
         Extract main article content from page.
         Uses site-specific selectors when available.
         """
-        domain = urlparse(url).netloc.lower().replace('www.', '')
-
-        # Site-specific extraction
-        site_selectors = {
-            'archdaily.com': [
-                'article.afd-char-gallery',
-                '.afd-gallery-container',
-                'article[class*="article"]',
-                '.article-content',
-            ],
-            'dezeen.com': [
-                '.article-content',
-                'article .entry-content',
-                '.dezeen-content',
-            ],
-            'designboom.com': [
-                '.article-content',
-                '.entry-content',
-                'article .content',
-            ],
-        }
-
-        # Get selectors for this site, or use generic ones
-        selectors = site_selectors.get(domain, []) + [
-            'article',
-            '[role="article"]',
-            '.article-content',
-            '.article-body',
-            '.post-content',
-            '.entry-content',
-            'main',
-            '[role="main"]',
-            '.content',
-        ]
+        selectors = self._content_selectors(domain or self._get_domain(url))
 
         try:
-            content = await page.evaluate("""
-                (selectors) => {
-                    // Try each selector
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element) {
-                            // Clone to avoid modifying original
-                            const clone = element.cloneNode(true);
-
-                            // Remove unwanted elements
-                            const removeSelectors = [
-                                'script', 'style', 'nav', 'header', 'footer',
-                                'aside', '.ad', '.ads', '.advertisement',
-                                '.social-share', '.related-posts', '.comments',
-                                '.newsletter', '.sidebar', '[role="complementary"]',
-                                '.breadcrumb', '.pagination', '.author-bio'
-                            ];
-
-                            removeSelectors.forEach(sel => {
-                                clone.querySelectorAll(sel).forEach(el => el.remove());
-                            });
-
-                            const text = clone.innerText || clone.textContent || '';
-                            if (text.trim().length > 200) {
-                                return text.trim();
-                            }
-                        }
-                    }
-
-                    // Fallback: get body text
-                    const body = document.body.cloneNode(true);
-                    ['script', 'style', 'nav', 'header', 'footer', 'aside']
-                        .forEach(tag => body.querySelectorAll(tag).forEach(el => el.remove()));
-
-                    return (body.innerText || body.textContent || '').trim().substring(0, 10000);
-                }
-            """, selectors)
+            content = await self._run_script(page, "content", selectors)
 
             # Clean up content
-            return self._clean_content(content) if content else ""
+            return await self._clean_content_async(content) if content else ""
 
         except Exception as e:
             logger.warning(f"Content extraction error: {e}")
             try:
                 # Fallback
                 text = await page.inner_text('body')
-                return self._clean_content(text[:5000]) if text else ""
-            except:
+                return await self._clean_content_async(text[:5000]) if text else ""
+            except Exception:
                 return ""
 
+    async def _clean_content_async(self, content: str) -> str:
+        """Run _clean_content on the cleaner thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cleaner_pool, self._clean_content, content)
+
     def _clean_content(self, content: str) -> str:
         """Clean extracted content."""
         if not content:
             return ""
 
         # Remove excessive whitespace
-        content = re.sub(r'\n\s*\n+', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
-
-        # Remove common junk phrases
-        junk_patterns = [
-            r'cookie\s*(policy|consent|notice)',
-            r'privacy\s*policy',
-            r'terms\s*(of|and)\s*(use|service)',
-            r'newsletter\s*sign\s*up',
-            r'follow\s*us\s*on',
-            r'share\s*(this|on)',
-            r'advertisement',
-            r'sponsored\s*content',
-        ]
+        content = self._blank_lines_re.sub('\n\n', content)
+        content = self._spaces_re.sub(' ', content)
 
-        for pattern in junk_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+        # Remove common junk phrases (most articles contain none of the keywords)
+        if self._junk_probe.search(content):
+            content = self._junk_re.sub('', content)
 
         return content.strip()
 
@@ -913,65 +1693,10 @@ class ArticleScraper:
         Extract article images for Telegram posts.
 
         Returns:
-            List of image dicts with 'url', 'alt', 'width', 'height'
+            List of image dicts with 'url', 'alt', 'width', 'height', 'area'
         """
         try:
-            images = await page.evaluate("""
-                (baseUrl) => {
-                    const images = [];
-                    const seen = new Set();
-
-                    // Selectors for article images (prioritized)
-                    const selectors = [
-                        'article img',
-                        '.article-content img',
-                        '.gallery img',
-                        'main img',
-                        '.post-content img',
-                        '.entry-content img',
-                    ];
-
-                    // Collect images
-                    for (const selector of selectors) {
-                        document.querySelectorAll(selector).forEach(img => {
-                            let src = img.src || img.dataset.src || img.dataset.lazySrc || '';
-
-                            // Skip if no src or already seen
-                            if (!src || seen.has(src)) return;
-
-                            // Skip tiny images, icons, logos
-                            const width = img.naturalWidth || img.width || 0;
-                            const height = img.naturalHeight || img.height || 0;
-                            if (width < 200 || height < 150) return;
-
-                            // Skip common non-content images
-                            const srcLower = src.toLowerCase();
-                            if (srcLower.includes('logo') || 
-                                srcLower.includes('icon') ||
-                                srcLower.includes('avatar') ||
-                                srcLower.includes('advertisement') ||
-                                srcLower.includes('banner') ||
-                                srcLower.includes('placeholder')) return;
-
-                            seen.add(src);
-                            images.push({
-                                url: src,
-                                alt: img.alt || '',
-                                width: width,
-                                height: height,
-                            });
-                        });
-                    }
-
-                    return images.slice(0, 10);  // Limit to 10 images
-                }
-            """, base_url)
-
-            # Convert relative URLs to absolute
-            for img in images:
-                if img['url'] and not img['url'].startswith('http'):
-                    img['url'] = urljoin(base_url, img['url'])
-
+            images = await self._run_script(page, "images", base_url)
             self.stats["images_extracted"] += len(images)
             return images
 
@@ -983,17 +1708,18 @@ class ArticleScraper:
         """
         Get the main/hero image for Telegram post thumbnail.
 
+        The largest image (likely the hero) is picked inside the page, so
+        only that one image is sent back.
+
         Returns:
             Single image dict or None
         """
-        images = await self._extract_images(page, base_url)
-
-        if not images:
+        try:
+            return await self._run_script(page, "largest_image", base_url)
+        except Exception as e:
+            logger.warning(f"Hero image selection error: {e}")
             return None
 
-        # Return the largest image (likely the hero)
-        return max(images, key=lambda x: (x.get('width', 0) * x.get('height', 0)))
-
     # =========================================================================
     # Statistics & Cleanup
     # =========================================================================
@@ -1025,43 +1751,61 @@ class ArticleScraper:
         """Clean shutdown of browser pool."""
         logger.info("🛑 Shutting down scraper...")
 
-        # Close persistent pages first
-        for page in self.browser_pages:
-            try:
-                await page.close()
-            except:
-                pass
+        # Save cookies before the contexts go away
+        if self.session_active:
+            await self._save_storage_states()
 
-        # Close contexts
-        for context in self.browser_contexts:
-            try:
-                await context.close()
-            except:
-                pass
+        # Close warm pages first, then contexts (each group concurrently)
+        results = await asyncio.gather(
+            *(page.close() for pages in self.browser_pages for page in pages),
+            return_exceptions=True
+        )
+        results += await asyncio.gather(
+            *(context.close() for context in self.browser_contexts),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.debug(f"Page/context close failed: {result}")
 
-        # Close browsers
-        for browser in self.browser_pool:
+        # Close the browser
+        if self.browser:
             try:
-                await browser.close()
-            except:
-                pass
+                await self.browser.close()
+            except Exception as e:
+                logger.debug(f"Browser close failed: {e}")
 
         # Stop Playwright
         if self.playwright:
             try:
                 await self.playwright.stop()
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"Playwright stop failed: {e}")
+
+        # Stop the cleanup threads; a fresh executor (threads start on first
+        # use) keeps the scraper usable if it is initialized again
+        self._cleaner_pool.shutdown(wait=False, cancel_futures=True)
+        self._cleaner_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="content-clean")
 
         self.session_active = False
         self.browser_pages = []
+        self.page_pools = []
         self.browser_contexts = []
-        self.browser_pool = []
+        self.warm_domains = []
+        self.browser = None
 
         self.print_stats()
         logger.info("✅ Scraper shutdown complete")
 
 
+def _int_attr(tag, attr: str) -> Optional[int]:
+    """Integer value of an HTML attribute ('800', '800px'), or None."""
+    if tag is None:
+        return None
+    match = re.match(r'\s*(\d+)', tag.get(attr) or '')
+    return int(match.group(1)) if match else None
+
+
 # =============================================================================
 # Standalone Test
 # =============================================================================
@@ -1088,6 +1832,7 @@ async def test_scraper():
 
     finally:
         await scraper.close()
+        await close_http_session()
 
 
 if __name__ == "__main__":
@@ -20,15 +20,33 @@ Usage:
 """
 
 import asyncio
+from datetime import datetime, timezone
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 from operators.rss_fetcher import RSSFetcher
 from operators.custom_scrapers import (
-    has_custom_scraper,
     fetch_custom_source,
     list_custom_scrapers
 )
+from operators.feed_parser import parse_feed_date
 from config.sources import get_source_config, get_all_rss_sources
+from utils.urls import canonicalize_url
+
+
+# Sources fetched at once by fetch_all_sources (and concurrent fetch_source calls)
+FETCH_CONCURRENCY = 16
+
+
+def _published_timestamp(published: Any) -> int:
+    """Unix time of an article's 'published' value (ISO/RFC 822 string or datetime); 0 if unknown."""
+    if isinstance(published, datetime):
+        parsed = published if published.tzinfo else published.replace(tzinfo=timezone.utc)
+    elif isinstance(published, str):
+        parsed = parse_feed_date(published)
+    else:
+        parsed = None
+    return int(parsed.timestamp()) if parsed else 0
 
 
 class UnifiedFetcher:
@@ -43,11 +61,25 @@ class UnifiedFetcher:
         self.rss_fetcher = RSSFetcher()
         
         # Track which sources use which method
-        self.custom_sources = set(list_custom_scrapers())
+        self.reload_sources()
+
+        # Bounds concurrent fetches across all callers of fetch_source
+        self._fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
         
         print("[UnifiedFetcher] Initialized")
         print(f"   Custom scrapers: {len(self.custom_sources)}")
     
+    def reload_sources(self):
+        """
+        Re-read the source lists (RSS config and custom scraper registry).
+
+        Both are fixed once the config and scraper modules are imported, so
+        this runs once at init; call it again only after changing them.
+        """
+        self.custom_sources = frozenset(list_custom_scrapers())
+        self._rss_source_ids = tuple(s["id"] for s in get_all_rss_sources())
+        self._all_source_ids = tuple(sorted(set(self._rss_source_ids) | self.custom_sources))
+
     async def fetch_source(
         self,
         source_id: str,
@@ -71,10 +103,11 @@ class UnifiedFetcher:
             return []
         
         # Check if custom scraper exists
-        if has_custom_scraper(source_id):
+        if source_id in self.custom_sources:
             print(f"[UnifiedFetcher] Using custom scraper for: {source_id}")
             try:
-                articles = await fetch_custom_source(source_id, hours)
+                async with self._fetch_semaphore:
+                    articles = await fetch_custom_source(source_id, hours)
                 
                 # Apply max_articles limit if specified
                 if max_articles and len(articles) > max_articles:
@@ -92,11 +125,14 @@ class UnifiedFetcher:
             return []
         
         print(f"[UnifiedFetcher] Using RSS for: {source_id}")
-        return self.rss_fetcher.fetch_source(
-            source_id,
-            hours=hours,
-            max_articles=max_articles
-        )
+        async with self._fetch_semaphore:
+            # RSSFetcher is synchronous; run it in a thread so sources overlap
+            return await asyncio.to_thread(
+                self.rss_fetcher.fetch_source,
+                source_id,
+                hours=hours,
+                max_articles=max_articles
+            )
     
     async def fetch_all_sources(
         self,
@@ -122,32 +158,48 @@ class UnifiedFetcher:
         # Determine which sources to fetch
         if source_ids:
             sources_to_fetch = source_ids
+        elif include_custom:
+            # All RSS sources plus custom scrapers
+            sources_to_fetch = self._all_source_ids
         else:
-            # Get all RSS sources
-            rss_sources = [s["id"] for s in get_all_rss_sources()]
-            
-            # Add custom scrapers if enabled
-            if include_custom:
-                sources_to_fetch = list(set(rss_sources + list(self.custom_sources)))
-            else:
-                sources_to_fetch = rss_sources
+            sources_to_fetch = self._rss_source_ids
         
         print(f"\n[UnifiedFetcher] Fetching {len(sources_to_fetch)} sources...")
         
-        # Fetch from each source
-        for source_id in sources_to_fetch:
-            articles = await self.fetch_source(
-                source_id,
-                hours=hours,
-                max_articles=max_per_source
-            )
-            all_articles.extend(articles)
-        
-        # Sort by publication date (newest first)
-        all_articles.sort(
-            key=lambda x: x.get("published") or "1970-01-01",
-            reverse=True
+        # Fetch all sources concurrently (bounded by the fetch semaphore)
+        results = await asyncio.gather(
+            *(
+                self.fetch_source(source_id, hours=hours, max_articles=max_per_source)
+                for source_id in sources_to_fetch
+            ),
+            return_exceptions=True
         )
+        for source_id, result in zip(sources_to_fetch, results):
+            if isinstance(result, list):
+                all_articles.extend(result)
+            else:
+                print(f"[UnifiedFetcher] Fetch failed for {source_id}: {result}")
+
+        # Drop articles reached through several sources (or tracking-param
+        # variants of one link); the first source listed wins
+        seen_urls = set()
+        unique_articles = []
+        for article in all_articles:
+            key = canonicalize_url(article.get("link", ""))
+            if key:
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+            unique_articles.append(article)
+        if len(unique_articles) < len(all_articles):
+            print(f"[UnifiedFetcher] Skipped {len(all_articles) - len(unique_articles)} duplicate articles")
+        all_articles = unique_articles
+        
+        # Sort by publication date (newest first). Dates are normalized to
+        # epoch seconds once, so mixed formats/offsets sort correctly
+        for article in all_articles:
+            article["published_ts"] = _published_timestamp(article.get("published"))
+        all_articles.sort(key=itemgetter("published_ts"), reverse=True)
         
         print(f"[UnifiedFetcher] Total: {len(all_articles)} articles from {len(sources_to_fetch)} sources")
         return all_articles
@@ -162,7 +214,7 @@ class UnifiedFetcher:
         Returns:
             "custom" or "rss" or "unknown"
         """
-        if has_custom_scraper(source_id):
+        if source_id in self.custom_sources:
             return "custom"
         
         config = get_source_config(source_id)
@@ -178,13 +230,10 @@ class UnifiedFetcher:
         Returns:
             Dict with "rss" and "custom" keys, each with list of source_ids
         """
-        rss_sources = [s["id"] for s in get_all_rss_sources()]
-        custom_sources = list(self.custom_sources)
-        
         return {
-            "rss": rss_sources,
-            "custom": custom_sources,
-            "total": len(set(rss_sources + custom_sources))
+            "rss": list(self._rss_source_ids),
+            "custom": list(self.custom_sources),
+            "total": len(self._all_source_ids)
         }
 
 
@@ -192,6 +241,18 @@ class UnifiedFetcher:
 # Convenience Functions
 # =============================================================================
 
+# Shared fetcher for the convenience functions (created on first use)
+_unified_fetcher: Optional[UnifiedFetcher] = None
+
+
+def get_unified_fetcher() -> UnifiedFetcher:
+    """Get (or lazily create) the shared UnifiedFetcher."""
+    global _unified_fetcher
+    if _unified_fetcher is None:
+        _unified_fetcher = UnifiedFetcher()
+    return _unified_fetcher
+
+
 async def fetch_unified(
     source_id: str,
     hours: int = 24
@@ -206,8 +267,7 @@ async def fetch_unified(
     Returns:
         List of article dicts
     """
-    fetcher = UnifiedFetcher()
-    return await fetcher.fetch_source(source_id, hours)
+    return await get_unified_fetcher().fetch_source(source_id, hours)
 
 
 async def fetch_all_unified(
@@ -226,8 +286,7 @@ async def fetch_all_unified(
     Returns:
         Combined list of articles
     """
-    fetcher = UnifiedFetcher()
-    return await fetcher.fetch_all_sources(hours, sources, include_custom=include_custom)
+    return await get_unified_fetcher().fetch_all_sources(hours, sources, include_custom=include_custom)
 
 
 # =============================================================================
@@ -21,6 +21,8 @@ Keeps:
 - Urban planning, infrastructure
 """
 
+import re
+
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 
 # System prompt for the article filter
@@ -87,6 +89,10 @@ FILTER_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
 ])
 
 
+# "VERDICT: ..." / "REASON: ..." lines, case-insensitive
+_FILTER_LINE_RE = re.compile(r'^[ \t]*(VERDICT|REASON):(.*)$', re.IGNORECASE | re.MULTILINE)
+
+
 def parse_filter_response(response_text: str) -> dict:
     """
     Parse AI filter response into structured result.
@@ -97,20 +103,15 @@ def parse_filter_response(response_text: str) -> dict:
     Returns:
         Dict with 'include' (bool), 'reason' (str)
     """
-    lines = response_text.strip().split('\n')
-
-    include = True  # Default to include if parsing fails
-    reason = ""
-
-    for line in lines:
-        line = line.strip()
-
-        if line.upper().startswith('VERDICT:'):
-            verdict = line.split(':', 1)[1].strip().upper()
-            include = verdict == 'INCLUDE'
-
-        elif line.upper().startswith('REASON:'):
-            reason = line.split(':', 1)[1].strip()
+    # Last occurrence of each field wins
+    fields = {
+        match.group(1).upper(): match.group(2).strip()
+        for match in _FILTER_LINE_RE.finditer(response_text)
+    }
+
+    # Default to include if parsing fails
+    include = fields["VERDICT"].upper() == 'INCLUDE' if "VERDICT" in fields else True
+    reason = fields.get("REASON", "")
 
     return {
         "include": include,
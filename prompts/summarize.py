@@ -4,6 +4,10 @@ Summarization Prompts
 Prompts for generating article summaries and tags.
 """
 
+import json
+import re
+from itertools import islice
+
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 
 # System prompt for the AI summarizer
@@ -41,12 +45,87 @@ Cloud 11 Office Complex / Snøhetta
 Snøhetta has completed an office complex in Tokyo featuring a diagrid structural system. The 32-story building uses cross-laminated timber for its facade, making it one of the tallest timber-hybrid structures in Asia.
 commercial"""
 
+# Non-blank response lines (headline, summary, tag)
+_NONEMPTY_LINE_RE = re.compile(r'^.*\S.*$', re.MULTILINE)
+
 # Combined ChatPromptTemplate for LangChain
 SUMMARIZE_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
     SystemMessagePromptTemplate.from_template(SUMMARIZE_SYSTEM_PROMPT),
     HumanMessagePromptTemplate.from_template(SUMMARIZE_USER_TEMPLATE)
 ])
 
+# User message for summarizing several articles in one request.
+# Asks for a JSON object (OpenAI JSON mode cannot return a bare array).
+SUMMARIZE_GROUP_USER_TEMPLATE = """Summarize each of these architecture articles:
+
+{articles}
+
+For every article, write:
+- headline: PROJECT NAME / ARCHITECT OR BUREAU or just PROJECT NAME if author unknown or irrelevant. DO NOT write Uknown in the title
+- summary: a 2-sentence summary
+- tag: 1 relevant tag (one word, the realm or type of the project: urbanism, museums, library, culture, education, airport,  etc.). No spaces, hyphens, or special characters in the tag.
+
+Respond with ONLY a JSON object of this form, one entry per article, using the article numbers as ids:
+{{"articles": [{{"id": 1, "headline": "Cloud 11 Office Complex / Snøhetta", "summary": "Snøhetta has completed an office complex in Tokyo featuring a diagrid structural system. The 32-story building uses cross-laminated timber for its facade, making it one of the tallest timber-hybrid structures in Asia.", "tag": "commercial"}}]}}"""
+
+
+def format_article_list(articles: list) -> str:
+    """
+    Format articles as the numbered list used in SUMMARIZE_GROUP_USER_TEMPLATE.
+
+    Args:
+        articles: Article dicts with title, description, link
+
+    Returns:
+        Numbered article blocks (ids start at 1)
+    """
+    return "\n\n".join(
+        f"Article {i}\nTitle: {article['title']}\nDescription: {article['description']}\nSource: {article['link']}"
+        for i, article in enumerate(articles, 1)
+    )
+
+
+def parse_group_summary_response(response_text: str) -> dict:
+    """
+    Parse a JSON group summary response.
+
+    Args:
+        response_text: Raw AI response (JSON object with an "articles" list)
+
+    Returns:
+        Dict mapping article id (1-based) to a dict with 'headline', 'summary'
+        and 'tag' keys. Malformed entries are left out.
+    """
+    try:
+        data = json.loads(response_text)
+    except ValueError:
+        return {}
+
+    items = data.get("articles", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+
+    parsed = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            article_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+
+        summary = str(item.get("summary") or "").strip()
+        if not summary:
+            continue
+
+        parsed[article_id] = {
+            "headline": str(item.get("headline") or "").strip(),
+            "summary": summary,
+            "tag": str(item.get("tag") or "").lower().strip()
+        }
+
+    return parsed
+
 
 def parse_summary_response(response_text: str) -> dict:
     """
@@ -58,7 +137,8 @@ def parse_summary_response(response_text: str) -> dict:
     Returns:
         Dict with 'headline', 'summary' and 'tag' keys
     """
-    lines = [line.strip() for line in response_text.strip().split('\n') if line.strip()]
+    # Only the first three non-blank lines are used; stop scanning there
+    lines = [match.group().strip() for match in islice(_NONEMPTY_LINE_RE.finditer(response_text), 3)]
 
     if len(lines) >= 3:
         headline = lines[0]
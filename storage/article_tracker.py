@@ -6,21 +6,84 @@ Tracks seen article URLs to prevent reprocessing.
 Simple URL-based tracking: store URLs when discovered, filter against them next run.
 
 Database Schema:
-    - articles table: stores seen URLs per source
-    - Indexed by source_id and url for fast lookups
+    - articles table: stores seen URLs per source, hash-partitioned by source_id
+      (existing unpartitioned tables: storage/migrate_articles_partitions.py)
+    - url_hash: 16-byte MD5 of the url (generated column), unique per source;
+      lookups send hashes instead of full URLs
+
+Seen-URL prefilter:
+    - Per-source Bloom filters of url_hash are loaded from the database at connect
+    - URLs missing from the filter are definitely new (no DB lookup needed)
+    - Only "maybe seen" URLs are confirmed against PostgreSQL
 
 Usage:
     tracker = ArticleTracker()
     await tracker.connect()
 
+    # Or the process-wide tracker shared by all scrapers (one pool)
+    tracker = await ArticleTracker.get_shared()
+
     # URL tracking workflow  
     new_urls = await tracker.filter_new_articles(source_id, url_list)
+    seen = await tracker.bulk_is_seen(source_id, url_list)  # set of seen URLs
     await tracker.mark_as_seen(source_id, url_list)
+
+    # Or both steps in a single statement
+    new_urls = await tracker.filter_and_mark(source_id, url_list)
 """
 
+import asyncio
+import hashlib
+import logging
 import os
+import warnings
 import asyncpg
-from typing import Optional, List
+from typing import Optional, List, Iterable
+
+from storage.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+# Hash partitions of the articles table (fixed when the table is created)
+ARTICLE_PARTITIONS = 16
+
+
+def _url_hash(url: str) -> bytes:
+    """Same value as the url_hash column: decode(md5(url), 'hex')."""
+    return hashlib.md5(url.encode('utf-8')).digest()
+
+
+async def create_articles_table(conn: asyncpg.Connection, partitions: int = ARTICLE_PARTITIONS):
+    """
+    Create the articles table partitioned by HASH (source_id).
+
+    Every query filters by source_id, so each lookup only touches one
+    partition's (smaller) indexes. Indexes are created by the caller on the
+    parent table and propagate to the partitions.
+
+    Args:
+        conn: Open connection (wrap in a transaction to create atomically)
+        partitions: Number of hash partitions
+    """
+    # The primary key must include the partition key
+    await conn.execute("""
+        CREATE TABLE articles (
+            id SERIAL,
+            source_id VARCHAR(100) NOT NULL,
+            url TEXT NOT NULL,
+            url_hash BYTEA GENERATED ALWAYS AS (decode(md5(url), 'hex')) STORED,
+            first_seen TIMESTAMP DEFAULT NOW(),
+            last_checked TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (source_id, id)
+        ) PARTITION BY HASH (source_id)
+    """)
+
+    for remainder in range(partitions):
+        await conn.execute(f"""
+            CREATE TABLE articles_p{remainder} PARTITION OF articles
+            FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})
+        """)
 
 
 class ArticleTracker:
@@ -30,9 +93,31 @@ class ArticleTracker:
     # TEST MODE - Set to True to ignore "seen" status
     # This makes all articles appear as "new" for testing
     # Set via environment variable: SCRAPER_TEST_MODE=true
+    # Read once at import: test-mode methods are swapped in below the class
     # ========================================
     TEST_MODE = os.getenv("SCRAPER_TEST_MODE", "").lower() == "true"
 
+    # Bloom filter sizing (per source)
+    BLOOM_CAPACITY = 50_000
+    BLOOM_ERROR_RATE = 1e-6
+
+    # mark_as_seen batches at least this large are loaded with COPY
+    COPY_THRESHOLD = 200
+
+    # Pool sizing for the shared tracker (scrapers run concurrently)
+    # Override via environment variables: DB_POOL_MIN / DB_POOL_MAX
+    SHARED_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN", "5"))
+    SHARED_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX", "20"))
+
+    # Connection recycling and per-connection prepared statement cache
+    POOL_MAX_QUERIES = 50_000
+    POOL_MAX_INACTIVE_LIFETIME = 300.0
+    STATEMENT_CACHE_SIZE = 256
+
+    # Process-wide instance returned by get_shared()
+    _shared: Optional["ArticleTracker"] = None
+    _shared_lock = asyncio.Lock()
+
     def __init__(self, connection_url: Optional[str] = None):
         """
         Initialize article tracker.
@@ -47,27 +132,43 @@ class ArticleTracker:
 
         self.pool: Optional[asyncpg.Pool] = None
 
-    async def connect(self):
-        """Connect to PostgreSQL and initialize schema."""
+        # Per-source Bloom filters of seen url_hash values (loaded at connect)
+        self._seen_filters: dict[str, BloomFilter] = {}
+
+    async def connect(self, min_size: int = 1, max_size: int = 5):
+        """
+        Connect to PostgreSQL and initialize schema.
+
+        Args:
+            min_size: Minimum pool connections
+            max_size: Maximum pool connections
+        """
         if self.pool:
             return
 
-        # Create connection pool
+        # Create connection pool (min_size connections are opened up front;
+        # connections are replaced after max_queries or when idle too long)
         self.pool = await asyncpg.create_pool(
             self.connection_url,
-            min_size=1,
-            max_size=5,
+            min_size=min_size,
+            max_size=max_size,
+            max_queries=self.POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=self.POOL_MAX_INACTIVE_LIFETIME,
+            statement_cache_size=self.STATEMENT_CACHE_SIZE,
             command_timeout=60
         )
 
         # Initialize schema
         await self._init_schema()
 
+        # Prefilter for filter_new_articles
+        await self._load_seen_filters()
+
         # Show mode status
         if self.TEST_MODE:
-            print("⚠️  Article tracker TEST MODE ENABLED - all articles will appear as 'new'")
+            logger.warning("⚠️  Article tracker TEST MODE ENABLED - all articles will appear as 'new'")
 
-        print("✅ Article tracker connected to PostgreSQL")
+        logger.debug("✅ Article tracker connected to PostgreSQL")
 
     async def _init_schema(self):
         """Create articles table if it doesn't exist."""
@@ -75,24 +176,30 @@ class ArticleTracker:
             raise RuntimeError("Not connected to database")
 
         async with self.pool.acquire() as conn:
+            if not await conn.fetchval("SELECT to_regclass('articles') IS NOT NULL"):
+                async with conn.transaction():
+                    await create_articles_table(conn)
+
+            # Tables created before url_hash existed
             await conn.execute("""
-                CREATE TABLE IF NOT EXISTS articles (
-                    id SERIAL PRIMARY KEY,
-                    source_id VARCHAR(100) NOT NULL,
-                    url TEXT NOT NULL,
-                    first_seen TIMESTAMP DEFAULT NOW(),
-                    last_checked TIMESTAMP DEFAULT NOW(),
-                    UNIQUE(source_id, url)
-                )
+                ALTER TABLE articles ADD COLUMN IF NOT EXISTS
+                url_hash BYTEA GENERATED ALWAYS AS (decode(md5(url), 'hex')) STORED
             """)
 
-            # Create index for fast lookups
+            # Uniqueness on the 16-byte hash instead of the full URL text
+            await conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_source_hash
+                ON articles(source_id, url_hash)
+            """)
             await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_articles_source_url 
-                ON articles(source_id, url)
+                ALTER TABLE articles DROP CONSTRAINT IF EXISTS articles_source_id_url_key
             """)
 
-        print("✅ Article tracker schema initialized")
+            # Lookups go through idx_articles_source_hash; the old
+            # (source_id, url) index only added write and memory cost
+            await conn.execute("DROP INDEX IF EXISTS idx_articles_source_url")
+
+        logger.debug("✅ Article tracker schema initialized")
 
     # =========================================================================
     # URL Tracking - Core Methods
@@ -103,14 +210,16 @@ class ArticleTracker:
         Filter list of URLs to only those not seen before.
 
         This is the main method for detecting new articles.
-        Respects TEST_MODE: when enabled, returns all URLs as "new".
+        Respects TEST_MODE: when enabled, returns all URLs as "new"
+        (_test_filter_new_articles replaces this method).
 
         Args:
             source_id: Source identifier (e.g., 'bauwelt')
             urls: List of article URLs found on homepage
 
         Returns:
-            List of URLs not previously seen (new articles)
+            List of URLs not previously seen (new articles), in input order
+            and without duplicates
         """
         if not self.pool:
             raise RuntimeError("Not connected to database")
@@ -118,26 +227,17 @@ class ArticleTracker:
         if not urls:
             return []
 
-        # TEST MODE: Return all URLs as "new" for testing
-        if self.TEST_MODE:
-            print(f"   ⚠️  TEST MODE: Returning ALL {len(urls)} URLs as 'new'")
-            return urls
-
-        async with self.pool.acquire() as conn:
-            # Get all existing URLs for this source (batch lookup)
-            rows = await conn.fetch("""
-                SELECT url FROM articles
-                WHERE source_id = $1 AND url = ANY($2)
-            """, source_id, urls)
+        # Deduplicate while preserving order (each URL is hashed and looked up once)
+        urls = list(dict.fromkeys(urls))
 
-            seen_urls = set(row['url'] for row in rows)
+        seen_urls = await self._find_seen(source_id, urls)
 
-            # Return URLs not in database
-            new_urls = [url for url in urls if url not in seen_urls]
+        # Return URLs not in database
+        new_urls = [url for url in urls if url not in seen_urls]
 
-            print(f"   Database: {len(seen_urls)} seen, {len(new_urls)} new")
+        logger.info(f"   Database: {len(seen_urls)} seen, {len(new_urls)} new")
 
-            return new_urls
+        return new_urls
 
     async def mark_as_seen(self, source_id: str, urls: List[str]) -> int:
         """
@@ -146,12 +246,18 @@ class ArticleTracker:
         Call this after discovering URLs on homepage to track them
         for future runs.
 
+        The commit does not wait for the WAL flush (synchronous_commit off
+        for this transaction only). A database crash can lose the last
+        fraction of a second of marks, which only means those articles are
+        picked up again on the next run.
+
         Args:
             source_id: Source identifier
             urls: List of article URLs to mark as seen
 
         Returns:
-            Number of URLs marked as seen
+            Number of URLs marked as seen (0 if the batch failed; the error
+            is logged, not raised, so callers keep their scraped articles)
         """
         if not self.pool:
             raise RuntimeError("Not connected to database")
@@ -159,31 +265,129 @@ class ArticleTracker:
         if not urls:
             return 0
 
-        marked = 0
+        # One batch in one transaction (one commit, not one per URL)
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute("SET LOCAL synchronous_commit = off")
+
+                    if len(urls) >= self.COPY_THRESHOLD:
+                        await self._copy_mark_as_seen(conn, source_id, urls)
+                    else:
+                        await conn.executemany("""
+                            INSERT INTO articles (source_id, url)
+                            VALUES ($1, $2)
+                            ON CONFLICT (source_id, url_hash) DO UPDATE
+                            SET last_checked = NOW()
+                        """, [(source_id, url) for url in urls])
+        except Exception as e:
+            # The batch rolled back as a whole: report it once
+            logger.error(f"   ⚠️  Error marking URLs as seen ({len(urls)} failed): {e}")
+            return 0
 
-        async with self.pool.acquire() as conn:
-            for url in urls:
-                try:
-                    await conn.execute("""
-                        INSERT INTO articles (source_id, url)
-                        VALUES ($1, $2)
-                        ON CONFLICT (source_id, url) DO UPDATE
-                        SET last_checked = NOW()
-                    """, source_id, url)
-
-                    marked += 1
-
-                except Exception as e:
-                    print(f"   ⚠️  Error marking URL as seen: {e}")
-                    continue
-
-        print(f"   Marked {marked} URLs as seen in database")
+        marked = len(urls)
+        self._remember_seen(source_id, urls)
+
+        logger.info(f"   Marked {marked} URLs as seen in database")
         return marked
 
+    async def _copy_mark_as_seen(self, conn: asyncpg.Connection, source_id: str, urls: List[str]):
+        """
+        Bulk-upsert a large batch: COPY into a temp table, then merge.
+
+        Must run inside a transaction (the temp table is dropped on commit).
+        """
+        await conn.execute("""
+            CREATE TEMP TABLE _new_urls (source_id TEXT, url TEXT) ON COMMIT DROP
+        """)
+
+        await conn.copy_records_to_table(
+            '_new_urls',
+            records=[(source_id, url) for url in urls],
+            columns=['source_id', 'url']
+        )
+
+        # DISTINCT: ON CONFLICT DO UPDATE cannot touch the same row twice
+        await conn.execute("""
+            INSERT INTO articles (source_id, url)
+            SELECT DISTINCT source_id, url FROM _new_urls
+            ON CONFLICT (source_id, url_hash) DO UPDATE
+            SET last_checked = NOW()
+        """)
+
+    async def filter_and_mark(self, source_id: str, urls: List[str]) -> List[str]:
+        """
+        Filter URLs to those not seen before and mark all of them as seen.
+
+        Combines filter_new_articles() and mark_as_seen() in one statement:
+        INSERT ... ON CONFLICT DO UPDATE refreshes last_checked on known URLs
+        and RETURNING (xmax = 0) tells which rows were newly inserted.
+        Respects TEST_MODE: URLs are still recorded, but all are returned as "new".
+
+        Args:
+            source_id: Source identifier
+            urls: List of article URLs found on homepage
+
+        Returns:
+            List of URLs not previously seen (new articles), in input order
+        """
+        if not self.pool:
+            raise RuntimeError("Not connected to database")
+
+        if not urls:
+            return []
+
+        # Deduplicate while preserving order (DO UPDATE cannot touch a row twice)
+        urls = list(dict.fromkeys(urls))
+
+        async with self.pool.acquire() as conn:
+            # xmax is 0 only on rows this statement inserted
+            rows = await conn.fetch("""
+                INSERT INTO articles (source_id, url)
+                SELECT $1, url FROM unnest($2::text[]) AS url
+                ON CONFLICT (source_id, url_hash) DO UPDATE
+                SET last_checked = NOW()
+                RETURNING url, (xmax = 0) AS inserted
+            """, source_id, urls)
+
+        inserted = {row['url'] for row in rows if row['inserted']}
+
+        self._remember_seen(source_id, urls)
+
+        logger.info(f"   Database: {len(urls) - len(inserted)} seen, {len(inserted)} new (all marked as seen)")
+
+        # TEST MODE: Return all URLs as "new" for testing
+        if self.TEST_MODE:
+            logger.warning(f"   ⚠️  TEST MODE: Returning ALL {len(urls)} URLs as 'new'")
+            return urls
+
+        return [url for url in urls if url in inserted]
+
+    async def bulk_is_seen(self, source_id: str, urls: Iterable[str]) -> set[str]:
+        """
+        Check which of several URLs have been seen before (one query at most).
+
+        Respects TEST_MODE (_test_bulk_is_seen replaces this method).
+
+        Args:
+            source_id: Source identifier
+            urls: Article URLs to check
+
+        Returns:
+            Set of the given URLs that exist in database
+        """
+        if not self.pool:
+            raise RuntimeError("Not connected to database")
+
+        return await self._find_seen(source_id, urls)
+
     async def is_seen(self, source_id: str, url: str) -> bool:
         """
         Check if a single URL has been seen before.
 
+        Deprecated: checking URLs one at a time costs a round-trip each;
+        use bulk_is_seen() or filter_new_articles().
+
         Args:
             source_id: Source identifier
             url: Article URL to check
@@ -191,22 +395,73 @@ class ArticleTracker:
         Returns:
             True if URL exists in database
         """
-        if not self.pool:
-            raise RuntimeError("Not connected to database")
+        warnings.warn(
+            "ArticleTracker.is_seen() is deprecated; use bulk_is_seen() or filter_new_articles()",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return url in await self.bulk_is_seen(source_id, [url])
 
-        # TEST MODE: Always return False (not seen)
-        if self.TEST_MODE:
-            return False
+    async def _find_seen(self, source_id: str, urls: Iterable[str]) -> set[str]:
+        """Seen subset of urls: Bloom prefilter, then one url_hash query."""
+        bloom = self._seen_filter(source_id)
+
+        # URLs missing from the filter are definitely new;
+        # only "maybe seen" URLs (possible false positives) hit the database
+        maybe_seen = {}
+        for url in urls:
+            url_hash = _url_hash(url)
+            if url_hash in bloom:
+                maybe_seen[url_hash] = url
+
+        if not maybe_seen:
+            return set()
 
         async with self.pool.acquire() as conn:
-            exists = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM articles
-                    WHERE source_id = $1 AND url = $2
-                )
-            """, source_id, url)
+            rows = await conn.fetch("""
+                SELECT url_hash FROM articles
+                WHERE source_id = $1 AND url_hash = ANY($2::bytea[])
+            """, source_id, list(maybe_seen))
 
-            return bool(exists)
+        return {maybe_seen[row['url_hash']] for row in rows}
+
+    # =========================================================================
+    # Seen-URL Bloom Filters
+    # =========================================================================
+
+    async def _load_seen_filters(self):
+        """Build every source's Bloom filter from the url_hash column (one query)."""
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch("SELECT source_id, url_hash FROM articles")
+
+        hashes_by_source: dict[str, List[bytes]] = {}
+        for row in rows:
+            hashes_by_source.setdefault(row['source_id'], []).append(row['url_hash'])
+
+        self._seen_filters = {
+            source_id: self._build_seen_filter(hashes)
+            for source_id, hashes in hashes_by_source.items()
+        }
+
+    def _build_seen_filter(self, url_hashes: List[bytes] = ()) -> BloomFilter:
+        """Create a Bloom filter pre-populated with known URL hashes."""
+        bloom = BloomFilter(
+            capacity=max(self.BLOOM_CAPACITY, 2 * len(url_hashes)),
+            error_rate=self.BLOOM_ERROR_RATE
+        )
+        bloom.update(url_hashes)
+        return bloom
+
+    def _seen_filter(self, source_id: str) -> BloomFilter:
+        """Bloom filter for a source (empty for sources with no rows at connect)."""
+        bloom = self._seen_filters.get(source_id)
+        if bloom is None:
+            bloom = self._seen_filters[source_id] = self._build_seen_filter()
+        return bloom
+
+    def _remember_seen(self, source_id: str, urls: Iterable[str]):
+        """Add newly marked URLs to the source's Bloom filter."""
+        self._seen_filter(source_id).update(_url_hash(url) for url in urls)
 
     # =========================================================================
     # Statistics
@@ -225,39 +480,26 @@ class ArticleTracker:
         if not self.pool:
             raise RuntimeError("Not connected to database")
 
+        query = """
+            SELECT COUNT(*) AS count, MIN(first_seen) AS oldest, MAX(first_seen) AS newest
+            FROM articles
+        """
+        args = []
+        if source_id:
+            query += " WHERE source_id = $1"
+            args.append(source_id)
+
+        # One round-trip and one scan for all three values
         async with self.pool.acquire() as conn:
-            if source_id:
-                count = await conn.fetchval("""
-                    SELECT COUNT(*) FROM articles WHERE source_id = $1
-                """, source_id)
-
-                oldest = await conn.fetchval("""
-                    SELECT first_seen FROM articles
-                    WHERE source_id = $1
-                    ORDER BY first_seen ASC LIMIT 1
-                """, source_id)
-
-                newest = await conn.fetchval("""
-                    SELECT first_seen FROM articles
-                    WHERE source_id = $1
-                    ORDER BY first_seen DESC LIMIT 1
-                """, source_id)
-            else:
-                count = await conn.fetchval("SELECT COUNT(*) FROM articles")
-                oldest = await conn.fetchval("""
-                    SELECT first_seen FROM articles
-                    ORDER BY first_seen ASC LIMIT 1
-                """)
-                newest = await conn.fetchval("""
-                    SELECT first_seen FROM articles
-                    ORDER BY first_seen DESC LIMIT 1
-                """)
-
-            return {
-                "total_articles": count or 0,
-                "oldest_seen": oldest.isoformat() if oldest else None,
-                "newest_seen": newest.isoformat() if newest else None,
-            }
+            row = await conn.fetchrow(query, *args)
+
+        oldest, newest = row['oldest'], row['newest']
+
+        return {
+            "total_articles": row['count'] or 0,
+            "oldest_seen": oldest.isoformat() if oldest else None,
+            "newest_seen": newest.isoformat() if newest else None,
+        }
 
     async def get_source_counts(self) -> dict:
         """
@@ -304,7 +546,8 @@ class ArticleTracker:
 
             # Extract count from result
             deleted = int(result.split()[-1])
-            print(f"[{source_id}] Cleared {deleted} tracked URLs")
+            self._seen_filters.pop(source_id, None)
+            logger.info(f"[{source_id}] Cleared {deleted} tracked URLs")
             return deleted
 
     async def clear_all(self) -> int:
@@ -321,7 +564,8 @@ class ArticleTracker:
         async with self.pool.acquire() as conn:
             result = await conn.execute("DELETE FROM articles")
             deleted = int(result.split()[-1])
-            print(f"⚠️  Cleared ALL {deleted} tracked URLs from database")
+            self._seen_filters.clear()
+            logger.warning(f"⚠️  Cleared ALL {deleted} tracked URLs from database")
             return deleted
 
     # =========================================================================
@@ -333,4 +577,64 @@ class ArticleTracker:
         if self.pool:
             await self.pool.close()
             self.pool = None
-            print("✅ Article tracker disconnected")
\ No newline at end of file
+            logger.debug("✅ Article tracker disconnected")
+
+    # =========================================================================
+    # Shared Instance
+    # =========================================================================
+
+    @classmethod
+    async def get_shared(cls) -> "ArticleTracker":
+        """
+        Get the process-wide tracker, connecting it on first use.
+
+        All scrapers share one connection pool, so running them concurrently
+        does not pay connection setup per scraper.
+
+        Returns:
+            Connected ArticleTracker
+        """
+        async with cls._shared_lock:
+            if cls._shared is None or cls._shared.pool is None:
+                tracker = cls()
+                await tracker.connect(
+                    min_size=cls.SHARED_POOL_MIN_SIZE,
+                    max_size=cls.SHARED_POOL_MAX_SIZE
+                )
+                cls._shared = tracker
+        return cls._shared
+
+    @classmethod
+    async def close_shared(cls):
+        """Close the shared tracker pool (call once at pipeline shutdown)."""
+        if cls._shared:
+            await cls._shared.close()
+            cls._shared = None
+
+
+# =========================================================================
+# Test Mode
+# =========================================================================
+
+async def _test_filter_new_articles(self: ArticleTracker, source_id: str, urls: List[str]) -> List[str]:
+    """TEST MODE filter_new_articles: every URL is "new"."""
+    if not self.pool:
+        raise RuntimeError("Not connected to database")
+
+    if urls:
+        logger.warning(f"   ⚠️  TEST MODE: Returning ALL {len(urls)} URLs as 'new'")
+    return urls
+
+
+async def _test_bulk_is_seen(self: ArticleTracker, source_id: str, urls: Iterable[str]) -> set[str]:
+    """TEST MODE bulk_is_seen: nothing has been seen."""
+    if not self.pool:
+        raise RuntimeError("Not connected to database")
+
+    return set()
+
+
+# Decided once per process, so the production methods carry no test-mode branch
+if ArticleTracker.TEST_MODE:
+    ArticleTracker.filter_new_articles = _test_filter_new_articles
+    ArticleTracker.bulk_is_seen = _test_bulk_is_seen
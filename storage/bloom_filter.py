@@ -0,0 +1,83 @@
+# storage/bloom_filter.py
+"""
+Bloom Filter - Compact in-process set membership
+
+Used by ArticleTracker to avoid database lookups for URLs that were
+definitely never seen. Items are strings or raw bytes (e.g. URL hashes).
+
+A Bloom filter has no false negatives: if an item is not in the filter,
+it was never added. It can report false positives (tuned by error_rate),
+so a "maybe present" answer must be confirmed against the database.
+
+Usage:
+    bloom = BloomFilter(capacity=50_000, error_rate=1e-6)
+    bloom.update(known_urls)
+
+    if url not in bloom:
+        ...  # definitely new
+"""
+
+import hashlib
+import math
+from typing import Iterable, List, Union
+
+
+Item = Union[str, bytes]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter for strings or bytes (double hashing over blake2b)."""
+
+    def __init__(self, capacity: int = 50_000, error_rate: float = 1e-6):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of items (false-positive rate degrades beyond it)
+            error_rate: Target false-positive rate at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        # Optimal bit count and hash count for the requested capacity / error rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: Item) -> List[int]:
+        """Bit positions for an item (Kirsch-Mitzenmacher double hashing)."""
+        if isinstance(item, str):
+            item = item.encode('utf-8')
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: Item):
+        """Add an item to the filter."""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def update(self, items: Iterable[Item]):
+        """Add several items to the filter."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Item) -> bool:
+        """True if item may have been added; False if it definitely was not."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        """Number of items added (including duplicates)."""
+        return self._count
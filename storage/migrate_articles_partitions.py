@@ -0,0 +1,97 @@
+# storage/migrate_articles_partitions.py
+"""
+One-off Migration - Partition the articles table by source_id
+
+ArticleTracker creates new articles tables already partitioned by
+HASH (source_id). This script converts a table created before that:
+the old table is renamed, a partitioned table is created in its place,
+the rows are copied over and the old table is dropped, all in one
+transaction. Indexes are then rebuilt by ArticleTracker.connect().
+
+Stop the scrapers before running it (the table is locked while copying).
+
+Usage:
+    python -m storage.migrate_articles_partitions
+"""
+
+import asyncio
+import os
+
+import asyncpg
+
+from storage.article_tracker import ARTICLE_PARTITIONS, ArticleTracker, create_articles_table
+
+
+# Names that the new table and its indexes reuse
+LEGACY_INDEXES = (
+    "articles_pkey",
+    "articles_source_id_url_key",
+    "idx_articles_source_hash",
+    "idx_articles_source_url",
+)
+
+
+async def migrate(connection_url: str, partitions: int = ARTICLE_PARTITIONS) -> bool:
+    """
+    Convert an unpartitioned articles table to a hash-partitioned one.
+
+    Args:
+        connection_url: PostgreSQL connection URL
+        partitions: Number of hash partitions
+
+    Returns:
+        True if the table was migrated, False if there was nothing to do
+    """
+    conn = await asyncpg.connect(connection_url)
+    try:
+        relkind = await conn.fetchval("""
+            SELECT relkind FROM pg_class WHERE oid = to_regclass('articles')
+        """)
+
+        if relkind is None:
+            print("ℹ️  No articles table yet - ArticleTracker will create it partitioned")
+            return False
+        if relkind == 'p':
+            print("ℹ️  articles table is already partitioned")
+            return False
+
+        async with conn.transaction():
+            await conn.execute("ALTER TABLE articles RENAME TO articles_legacy")
+            for index in LEGACY_INDEXES:
+                await conn.execute(f"ALTER INDEX IF EXISTS {index} RENAME TO {index}_legacy")
+
+            await create_articles_table(conn, partitions)
+
+            copied = await conn.execute("""
+                INSERT INTO articles (id, source_id, url, first_seen, last_checked)
+                SELECT id, source_id, url, first_seen, last_checked FROM articles_legacy
+            """)
+
+            # Continue ids after the copied rows
+            await conn.execute("""
+                SELECT setval(pg_get_serial_sequence('articles', 'id'), COALESCE(MAX(id), 0) + 1, false)
+                FROM articles
+            """)
+
+            await conn.execute("DROP TABLE articles_legacy")
+
+        print(f"✅ Copied {int(copied.split()[-1])} rows into {partitions} partitions")
+        return True
+    finally:
+        await conn.close()
+
+
+async def main():
+    """Run the migration, then let ArticleTracker rebuild the indexes."""
+    connection_url = os.getenv("DATABASE_URL")
+    if not connection_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    if await migrate(connection_url):
+        tracker = ArticleTracker(connection_url)
+        await tracker.connect()
+        await tracker.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
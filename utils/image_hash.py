@@ -0,0 +1,66 @@
+# utils/image_hash.py
+"""
+Perceptual Image Hashing Utility for ADUmedia
+
+Difference hash (dHash) of hero images, used to spot the same photo
+published by different sources (resized, recompressed or converted
+copies hash to nearby values, unlike byte hashes).
+"""
+
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image
+
+
+# 8x8 gradient grid -> 64-bit hash
+HASH_SIZE = 8
+
+# Hashes at most this many bits apart are treated as the same image
+DUPLICATE_DISTANCE = 5
+
+# Flat or near-uniform images (placeholders, blank og:images, logos on white)
+# hash to almost all 0 or all 1 bits, so unrelated ones look identical
+MIN_INFORMATIVE_BITS = 8
+MAX_INFORMATIVE_BITS = HASH_SIZE * HASH_SIZE - 8
+
+
+def dhash(image_bytes: bytes) -> Optional[int]:
+    """
+    Compute the 64-bit difference hash of an image.
+
+    The image is shrunk to a (HASH_SIZE + 1) x HASH_SIZE grayscale grid and
+    each bit records whether a pixel is brighter than its right neighbour.
+
+    Args:
+        image_bytes: Encoded image (JPEG, PNG, WebP, ...)
+
+    Returns:
+        Hash as an int, or None if the bytes are not a readable image
+    """
+    try:
+        with Image.open(BytesIO(image_bytes)) as img:
+            # draft() lets the JPEG decoder skip most of the full-size decode
+            img.draft("L", (HASH_SIZE * 8, HASH_SIZE * 8))
+            small = img.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR)
+            pixels = small.tobytes()
+    except Exception:
+        return None
+
+    value = 0
+    row_width = HASH_SIZE + 1
+    for row in range(HASH_SIZE):
+        offset = row * row_width
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def is_informative(image_hash: int) -> bool:
+    """True if the hash has enough gradient detail to compare images by."""
+    return MIN_INFORMATIVE_BITS <= image_hash.bit_count() <= MAX_INFORMATIVE_BITS
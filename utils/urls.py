@@ -0,0 +1,58 @@
+# utils/urls.py
+"""
+URL Normalization Utility for ADUmedia
+
+Canonical URL form used to detect the same article reached through
+different links (tracking parameters, http/https, trailing slashes,
+fragments, mixed-case hosts).
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query parameters that never change page content
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "igshid", "_hsenc", "_hsmi",
+})
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication.
+
+    - lowercases scheme and host, drops "www." and default ports
+    - treats http and https as the same
+    - removes utm_* and other tracking parameters, sorts the rest
+    - drops the fragment and any trailing slash
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Canonical URL string (input returned stripped if it cannot be parsed)
+    """
+    url = url.strip()
+    if not url:
+        return ""
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit(("https", host, path, query, ""))